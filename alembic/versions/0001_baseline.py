@@ -0,0 +1,102 @@
+"""baseline schema matching zhiban.db
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'students',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('username', sa.String(length=50), nullable=False),
+        sa.Column('password_hash', sa.String(length=100), nullable=False),
+        sa.Column('is_admin', sa.Boolean(), nullable=True),
+        sa.Column('phone', sa.String(length=20), nullable=True),
+        sa.Column('email', sa.String(length=100), nullable=True),
+        sa.Column('department', sa.String(length=50), nullable=True),
+        sa.Column('class', sa.String(length=50), nullable=True),
+        sa.Column('gender', sa.String(length=10), nullable=True),
+        sa.Column('is_active', sa.Boolean(), server_default=sa.text('0'), nullable=True),
+        sa.Column('last_login', sa.DateTime(), nullable=True),
+        sa.Column('is_password_set', sa.Boolean(), server_default=sa.text('0'), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_students_id', 'students', ['id'], unique=False)
+    op.create_index('ix_students_username', 'students', ['username'], unique=True)
+
+    op.create_table(
+        'schedules',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('student_id', sa.Integer(), nullable=False),
+        sa.Column('time_slot', sa.String(length=20), nullable=False),
+        sa.Column('location', sa.String(length=50), nullable=True),
+        sa.Column('notes', sa.String(length=200), nullable=True),
+        sa.ForeignKeyConstraint(['student_id'], ['students.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_schedules_date', 'schedules', ['date'], unique=False)
+    op.create_index('ix_schedules_id', 'schedules', ['id'], unique=False)
+
+    op.create_table(
+        'work_records',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('student_id', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('handover_notes', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=True),
+        sa.Column('time_slot', sa.String(length=50), nullable=True),
+        sa.ForeignKeyConstraint(['student_id'], ['students.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_work_records_id', 'work_records', ['id'], unique=False)
+    op.create_index('ix_work_records_date', 'work_records', ['date'], unique=False)
+
+    op.create_table(
+        'todos',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=100), nullable=False),
+        sa.Column('content', sa.Text(), nullable=True),
+        sa.Column('due_date', sa.Date(), nullable=True),
+        sa.Column('priority', sa.String(length=20), nullable=True),
+        sa.Column('status', sa.String(length=20), nullable=True),
+        sa.Column('assigned_to', sa.Integer(), nullable=True),
+        sa.Column('created_by', sa.Integer(), nullable=False),
+        sa.Column('is_completed', sa.Boolean(create_constraint=True), nullable=True),
+        sa.ForeignKeyConstraint(['assigned_to'], ['students.id']),
+        sa.ForeignKeyConstraint(['created_by'], ['students.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_todos_id', 'todos', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todos_id', table_name='todos')
+    op.drop_table('todos')
+    op.drop_index('ix_work_records_date', table_name='work_records')
+    op.drop_index('ix_work_records_id', table_name='work_records')
+    op.drop_table('work_records')
+    op.drop_index('ix_schedules_id', table_name='schedules')
+    op.drop_index('ix_schedules_date', table_name='schedules')
+    op.drop_table('schedules')
+    op.drop_index('ix_students_username', table_name='students')
+    op.drop_index('ix_students_id', table_name='students')
+    op.drop_table('students')
@@ -0,0 +1,45 @@
+"""composite indexes for list and filter queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 排班：按学生+日期范围查询，按日期+时段删除/查重
+    op.create_index('ix_schedules_student_id_date', 'schedules', ['student_id', 'date'], unique=False)
+    op.create_index('ix_schedules_date_time_slot', 'schedules', ['date', 'time_slot'], unique=False)
+    # 工作记录：按学生+日期范围、学生+状态、状态+日期查询
+    op.create_index('ix_work_records_student_id_date', 'work_records', ['student_id', 'date'], unique=False)
+    op.create_index('ix_work_records_student_id_status', 'work_records', ['student_id', 'status'], unique=False)
+    op.create_index('ix_work_records_status_date', 'work_records', ['status', 'date'], unique=False)
+    # 待办：普通用户的 assigned_to OR created_by 查询可分别走两个索引
+    op.create_index('ix_todos_assigned_to_status', 'todos', ['assigned_to', 'status'], unique=False)
+    op.create_index('ix_todos_created_by_status', 'todos', ['created_by', 'status'], unique=False)
+    op.create_index('ix_todos_status', 'todos', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_todos_status', table_name='todos')
+    op.drop_index('ix_todos_created_by_status', table_name='todos')
+    op.drop_index('ix_todos_assigned_to_status', table_name='todos')
+    op.drop_index('ix_work_records_status_date', table_name='work_records')
+    op.drop_index('ix_work_records_student_id_status', table_name='work_records')
+    op.drop_index('ix_work_records_student_id_date', table_name='work_records')
+    op.drop_index('ix_schedules_date_time_slot', table_name='schedules')
+    op.drop_index('ix_schedules_student_id_date', table_name='schedules')
@@ -0,0 +1,56 @@
+"""unique (date, student_id, time_slot) on schedules
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 中止迁移时最多列出的重复组数
+MAX_REPORTED = 50
+
+
+def _duplicate_slots(connection):
+    """返回 (日期, 学生ID, 时段, 排班ID列表)，每组为同一学生同一天同一时段的重复排班"""
+    return connection.execute(sa.text(
+        "SELECT date, student_id, time_slot, group_concat(id, ', ') FROM schedules "
+        "GROUP BY date, student_id, time_slot HAVING COUNT(*) > 1 "
+        "ORDER BY date, student_id, time_slot"
+    )).all()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 存在重复排班时不自动删除，列出冲突的记录并中止，由管理员确认后手动处理
+    duplicates = _duplicate_slots(op.get_bind())
+    if duplicates:
+        lines = [
+            f"  {date} 学生 {student_id} 时段 {time_slot}：排班ID {ids}"
+            for date, student_id, time_slot, ids in duplicates[:MAX_REPORTED]
+        ]
+        if len(duplicates) > MAX_REPORTED:
+            lines.append(f"  …… 共 {len(duplicates)} 组")
+        raise RuntimeError(
+            "schedules 中存在同一学生同一天同一时段的重复排班，无法创建唯一索引。"
+            "请删除多余的排班后重新运行迁移：\n" + "\n".join(lines)
+        )
+    op.create_index(
+        'uq_schedules_date_student_id_time_slot', 'schedules',
+        ['date', 'student_id', 'time_slot'], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_schedules_date_student_id_time_slot', table_name='schedules')
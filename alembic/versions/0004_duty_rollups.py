@@ -0,0 +1,102 @@
+"""duty_rollups table maintained by triggers
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 已完成的工作记录 / 带交接事项且未完成的工作记录
+COMPLETED = "(COALESCE({row}.status, 'pending') = 'completed')"
+PENDING_HANDOVER = "(COALESCE({row}.status, 'pending') = 'pending' AND COALESCE({row}.handover_notes, '') <> '')"
+
+def _add(row: str, shifts: str, completed: str, pending: str) -> str:
+    return (
+        "INSERT INTO duty_rollups (student_id, date, shift_count, completed_records, pending_handovers) "
+        f"VALUES ({row}.student_id, {row}.date, {shifts}, {completed}, {pending}) "
+        "ON CONFLICT (student_id, date) DO UPDATE SET "
+        "shift_count = shift_count + excluded.shift_count, "
+        "completed_records = completed_records + excluded.completed_records, "
+        "pending_handovers = pending_handovers + excluded.pending_handovers;"
+    )
+
+def _subtract(row: str, shifts: str, completed: str, pending: str) -> str:
+    return (
+        f"UPDATE duty_rollups SET shift_count = shift_count - {shifts}, "
+        f"completed_records = completed_records - {completed}, "
+        f"pending_handovers = pending_handovers - {pending} "
+        f"WHERE student_id = {row}.student_id AND date = {row}.date;"
+    )
+
+def _record_counts(row: str):
+    return COMPLETED.format(row=row), PENDING_HANDOVER.format(row=row)
+
+TRIGGERS = {
+    "trg_schedules_rollup_insert": (
+        "AFTER INSERT ON schedules",
+        [_add("NEW", "1", "0", "0")],
+    ),
+    "trg_schedules_rollup_delete": (
+        "AFTER DELETE ON schedules",
+        [_subtract("OLD", "1", "0", "0")],
+    ),
+    "trg_schedules_rollup_update": (
+        "AFTER UPDATE OF student_id, date ON schedules",
+        [_subtract("OLD", "1", "0", "0"), _add("NEW", "1", "0", "0")],
+    ),
+    "trg_work_records_rollup_insert": (
+        "AFTER INSERT ON work_records",
+        [_add("NEW", "0", *_record_counts("NEW"))],
+    ),
+    "trg_work_records_rollup_delete": (
+        "AFTER DELETE ON work_records",
+        [_subtract("OLD", "0", *_record_counts("OLD"))],
+    ),
+    "trg_work_records_rollup_update": (
+        "AFTER UPDATE OF student_id, date, status, handover_notes ON work_records",
+        [_subtract("OLD", "0", *_record_counts("OLD")), _add("NEW", "0", *_record_counts("NEW"))],
+    ),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'duty_rollups',
+        sa.Column('student_id', sa.Integer(), nullable=False),
+        sa.Column('date', sa.Date(), nullable=False),
+        sa.Column('shift_count', sa.Integer(), nullable=False),
+        sa.Column('completed_records', sa.Integer(), nullable=False),
+        sa.Column('pending_handovers', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('student_id', 'date')
+    )
+    # 回填已有数据
+    op.execute(
+        "INSERT INTO duty_rollups (student_id, date, shift_count, completed_records, pending_handovers) "
+        "SELECT student_id, date, SUM(shifts), SUM(completed), SUM(pending) FROM ("
+        "SELECT student_id, date, 1 AS shifts, 0 AS completed, 0 AS pending FROM schedules "
+        "UNION ALL "
+        f"SELECT student_id, date, 0, {COMPLETED.format(row='work_records')}, "
+        f"{PENDING_HANDOVER.format(row='work_records')} FROM work_records"
+        ") GROUP BY student_id, date"
+    )
+    for name, (timing, statements) in TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER {name} {timing} BEGIN {' '.join(statements)} END")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.drop_table('duty_rollups')
@@ -0,0 +1,62 @@
+"""FTS5 full-text indexes for work records, todos and students
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, Sequence[str], None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 源表 -> 参与全文索引的列；trigram 分词支持中文子串匹配
+FTS_SOURCES = {
+    "work_records": ["content", "handover_notes"],
+    "todos": ["title", "content"],
+    "students": ["name", "username"],
+}
+
+
+def _values(row: str, columns) -> str:
+    return ", ".join(f"{row}.{column}" for column in columns)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in FTS_SOURCES.items():
+        fts = f"{table}_fts"
+        column_list = ", ".join(columns)
+        op.execute(
+            f"CREATE VIRTUAL TABLE {fts} USING fts5({column_list}, "
+            f"content='{table}', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        insert_new = (
+            f"INSERT INTO {fts}(rowid, {column_list}) VALUES (NEW.id, {_values('NEW', columns)});"
+        )
+        delete_old = (
+            f"INSERT INTO {fts}({fts}, rowid, {column_list}) "
+            f"VALUES ('delete', OLD.id, {_values('OLD', columns)});"
+        )
+        op.execute(f"CREATE TRIGGER {fts}_insert AFTER INSERT ON {table} BEGIN {insert_new} END")
+        op.execute(f"CREATE TRIGGER {fts}_delete AFTER DELETE ON {table} BEGIN {delete_old} END")
+        op.execute(
+            f"CREATE TRIGGER {fts}_update AFTER UPDATE OF {column_list} ON {table} "
+            f"BEGIN {delete_old} {insert_new} END"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in FTS_SOURCES:
+        fts = f"{table}_fts"
+        for suffix in ("insert", "delete", "update"):
+            op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {fts}")
@@ -0,0 +1,41 @@
+"""students.auth_version bumped by trigger for cross-process auth cache checks
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, Sequence[str], None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 除登录记录（is_active、last_login）外的列发生变化时递增版本号，
+# 各进程的已认证用户缓存据此判断快照是否过期
+VERSIONED_COLUMNS = (
+    "name, username, password_hash, is_admin, is_password_set, phone, email, department, class, gender"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # students 上有全文索引触发器，直接 ADD COLUMN，不重建表
+    op.add_column('students', sa.Column('auth_version', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        f"CREATE TRIGGER trg_students_auth_version AFTER UPDATE OF {VERSIONED_COLUMNS} ON students "
+        "WHEN NEW.auth_version = OLD.auth_version "
+        "BEGIN UPDATE students SET auth_version = OLD.auth_version + 1 WHERE id = NEW.id; END"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS trg_students_auth_version")
+    op.execute("ALTER TABLE students DROP COLUMN auth_version")
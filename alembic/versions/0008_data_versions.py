@@ -0,0 +1,61 @@
+"""data_versions table with calendar month versions maintained by triggers
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, Sequence[str], None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CALENDAR_SCOPE = "'calendar:' || strftime('%Y-%m', {date})"
+
+
+def _bump(row: str) -> str:
+    return (
+        f"INSERT INTO data_versions (scope, version) VALUES ({CALENDAR_SCOPE.format(date=row + '.date')}, 1) "
+        "ON CONFLICT (scope) DO UPDATE SET version = version + 1;"
+    )
+
+TRIGGERS = {
+    "trg_schedules_version_insert": ("AFTER INSERT ON schedules", [_bump("NEW")]),
+    "trg_schedules_version_delete": ("AFTER DELETE ON schedules", [_bump("OLD")]),
+    "trg_schedules_version_update": ("AFTER UPDATE ON schedules", [_bump("OLD"), _bump("NEW")]),
+    # 月历中包含学生姓名，改名时递增该学生有排班的所有月份
+    "trg_students_calendar_version": (
+        "AFTER UPDATE OF name ON students",
+        [
+            f"INSERT INTO data_versions (scope, version) "
+            f"SELECT DISTINCT {CALENDAR_SCOPE.format(date='date')}, 1 FROM schedules WHERE student_id = NEW.id "
+            "ON CONFLICT (scope) DO UPDATE SET version = version + 1;"
+        ],
+    ),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'data_versions',
+        sa.Column('scope', sa.String(length=50), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('scope')
+    )
+    for name, (timing, statements) in TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER {name} {timing} BEGIN {' '.join(statements)} END")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.drop_table('data_versions')
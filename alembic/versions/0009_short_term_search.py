@@ -0,0 +1,75 @@
+"""bigram FTS5 indexes for one- and two-character search terms
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009'
+down_revision: Union[str, Sequence[str], None] = '0008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 与 0005 相同的源表和列；trigram 无法匹配少于 3 个字符的关键词（如“投影”“故障”、两字姓名）
+FTS_SOURCES = {
+    "work_records": ["content", "handover_notes"],
+    "todos": ["title", "content"],
+    "students": ["name", "username"],
+}
+# 触发器中不能使用递归 CTE，借助序号表切分二元组；超出此长度的部分只能用 3 个字符以上的关键词搜到
+MAX_INDEXED_LENGTH = 10000
+
+
+def _bigrams(row: str, column: str) -> str:
+    # 每个位置取两个字符（末位取单个字符），空格分隔后交给 unicode61 分词
+    return (
+        f"(SELECT group_concat(substr({row}.{column}, n, 2), ' ') FROM fts_positions "
+        f"WHERE n <= length({row}.{column}))"
+    )
+
+
+def _values(row: str, columns) -> str:
+    return ", ".join(_bigrams(row, column) for column in columns)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE TABLE fts_positions (n INTEGER PRIMARY KEY)")
+    op.execute(
+        "INSERT INTO fts_positions (n) "
+        f"WITH RECURSIVE p(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM p WHERE n < {MAX_INDEXED_LENGTH}) "
+        "SELECT n FROM p"
+    )
+    for table, columns in FTS_SOURCES.items():
+        fts = f"{table}_fts_bigram"
+        column_list = ", ".join(columns)
+        # 无内容表只保存倒排索引，搜索结果从源表取原文
+        op.execute(f"CREATE VIRTUAL TABLE {fts} USING fts5({column_list}, content='', tokenize='unicode61')")
+        op.execute(f"INSERT INTO {fts}(rowid, {column_list}) SELECT id, {_values(table, columns)} FROM {table}")
+        insert_new = f"INSERT INTO {fts}(rowid, {column_list}) VALUES (NEW.id, {_values('NEW', columns)});"
+        delete_old = (
+            f"INSERT INTO {fts}({fts}, rowid, {column_list}) "
+            f"VALUES ('delete', OLD.id, {_values('OLD', columns)});"
+        )
+        op.execute(f"CREATE TRIGGER {fts}_insert AFTER INSERT ON {table} BEGIN {insert_new} END")
+        op.execute(f"CREATE TRIGGER {fts}_delete AFTER DELETE ON {table} BEGIN {delete_old} END")
+        op.execute(
+            f"CREATE TRIGGER {fts}_update AFTER UPDATE OF {column_list} ON {table} "
+            f"BEGIN {delete_old} {insert_new} END"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in FTS_SOURCES:
+        fts = f"{table}_fts_bigram"
+        for suffix in ("insert", "delete", "update"):
+            op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {fts}")
+    op.execute("DROP TABLE IF EXISTS fts_positions")
@@ -0,0 +1,42 @@
+"""students version in data_versions maintained by triggers
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010'
+down_revision: Union[str, Sequence[str], None] = '0009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 学生检索索引只包含学号和姓名，这两列变化或增删学生时递增 'students' 版本
+BUMP = (
+    "INSERT INTO data_versions (scope, version) VALUES ('students', 1) "
+    "ON CONFLICT (scope) DO UPDATE SET version = version + 1;"
+)
+
+TRIGGERS = {
+    "trg_students_version_insert": "AFTER INSERT ON students",
+    "trg_students_version_delete": "AFTER DELETE ON students",
+    "trg_students_version_update": "AFTER UPDATE OF username, name ON students",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, timing in TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER {name} {timing} BEGIN {BUMP} END")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.execute("DELETE FROM data_versions WHERE scope = 'students'")
@@ -0,0 +1,50 @@
+"""event_log and stream_tickets tables for cross-process SSE
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0011'
+down_revision: Union[str, Sequence[str], None] = '0010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # AUTOINCREMENT 保证清理旧行后事件ID也不会被复用
+    op.create_table(
+        'event_log',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('type', sa.String(length=50), nullable=False),
+        sa.Column('data', sa.JSON(), nullable=False),
+        sa.Column('audience', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sqlite_autoincrement=True
+    )
+    op.create_table(
+        'stream_tickets',
+        sa.Column('ticket_hash', sa.String(length=64), nullable=False),
+        sa.Column('student_id', sa.Integer(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['student_id'], ['students.id']),
+        sa.PrimaryKeyConstraint('ticket_hash')
+    )
+    # 签发票据时清理过期票据
+    op.create_index('ix_stream_tickets_expires_at', 'stream_tickets', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_stream_tickets_expires_at', table_name='stream_tickets')
+    op.drop_table('stream_tickets')
+    op.drop_table('event_log')
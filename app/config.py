@@ -0,0 +1,75 @@
+from typing import List, Literal, Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+class Settings(BaseSettings):
+    """应用配置，可通过 ZHIBAN_ 前缀的环境变量或 .env 文件覆盖"""
+
+    model_config = SettingsConfigDict(env_prefix="ZHIBAN_", env_file=".env", extra="ignore")
+
+    # 数据库
+    database_url: str = "sqlite:///./zhiban.db"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+
+    # SQLite 连接参数
+    sqlite_journal_mode: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"] = "WAL"
+    sqlite_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    sqlite_busy_timeout: int = 5000  # 毫秒
+    sqlite_cache_size: int = -64000  # 负数表示以KB为单位，约64MB
+    sqlite_mmap_size: int = 268435456  # 256MB
+
+    # 令牌有效期：访问令牌较短，过期后用刷新令牌换取，无需重新校验密码
+    access_token_expire_minutes: int = 15
+    refresh_token_expire_days: int = 14
+    refresh_reuse_grace_seconds: int = 10  # 刚轮换的刷新令牌在此时间内再次出现视为多标签页并发刷新，只拒绝不吊销
+
+    # 密码哈希进程池：每个服务进程独立创建；服务进程是多线程的，子进程不能用 fork 启动
+    hash_workers: int = 2
+    hash_start_method: Literal["spawn", "forkserver"] = "spawn"
+
+    # 认证用户缓存
+    auth_cache_ttl: int = 60  # 秒
+    auth_revalidate_interval: float = 5  # 秒，缓存条目超过该时间后命中时才与数据库中的 auth_version 比对
+    auth_cache_maxsize: int = 1024
+    token_cache_maxsize: int = 4096
+
+    # 登录状态写后缓冲
+    login_flush_interval: float = 2  # 秒
+    login_flush_max_pending: int = 200  # 积压达到该数量时立即写入
+
+    # 月历视图缓存
+    calendar_cache_ttl: int = 600  # 秒，只用于淘汰不再访问的月份；数据变化由数据库中的版本号判断
+    calendar_cache_maxsize: int = 48
+
+    # 值班统计是否读取由触发器维护的 duty_rollups 汇总表，否则直接聚合原始表
+    stats_use_rollup: bool = True
+
+    # 实时事件推送（SSE）
+    events_backlog: int = 256  # event_log 表保留的最近事件数，供断线重连补发
+    events_poll_interval: float = 0.5  # 秒，各进程轮询 event_log 新事件的间隔
+    events_queue_size: int = 100  # 单个连接积压上限，溢出后通知客户端重新同步
+    events_heartbeat: int = 15  # 秒
+    events_retry_ms: int = 3000  # 客户端断线重连间隔
+    events_ticket_ttl: int = 30  # 秒，连接票据有效期
+    events_auth_recheck: int = 30  # 秒，连接期间重新校验用户是否被删除、降级或修改密码的间隔
+
+    # API 响应 gzip 压缩
+    gzip_minimum_size: int = 1024  # 字节，小于该大小的响应不压缩
+    gzip_level: int = 6
+
+    # 生产环境启动参数（serve.py）
+    server_host: str = "0.0.0.0"
+    server_ports: List[int] = [8080, 5638]  # 环境变量使用 JSON 格式，如 [8080]
+    server_workers: Optional[int] = None  # 默认为 CPU 核数；实时事件经 event_log 表在各进程间分发
+    server_loop: Literal["auto", "asyncio", "uvloop"] = "auto"  # auto 在已安装 uvloop 时使用 uvloop
+    server_http: Literal["auto", "h11", "httptools"] = "auto"  # auto 在已安装 httptools 时使用 httptools
+    server_keep_alive: int = 5  # 秒
+    server_backlog: int = 2048
+    server_max_requests: Optional[int] = 10000  # worker 处理该数量请求后退出并由主进程重启
+    server_max_requests_jitter: int = 1000  # 随机增量，避免所有 worker 同时回收
+    server_graceful_timeout: int = 30  # 秒，关闭或重启 worker 时等待进行中请求的时间
+    server_access_log: bool = True
+
+settings = Settings()
@@ -1,10 +1,11 @@
 from app.database.database import Base, engine
+from app.database.migrations import upgrade_database, check_schema_version
 from app.models.student import Student
 from app.models.schedule import Schedule
 from app.models.work_record import WorkRecord
 
-# 创建数据库表
+# 创建或升级数据库表结构
 def init_db():
-    Base.metadata.create_all(bind=engine)
+    upgrade_database()
 
-__all__ = ["init_db", "Base", "engine"]
+__all__ = ["init_db", "check_schema_version", "Base", "engine"]
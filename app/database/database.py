@@ -1,12 +1,55 @@
-from sqlalchemy import create_engine
+from typing import Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from app.config import settings
+
+SQLALCHEMY_DATABASE_URL = settings.database_url
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # 每个新连接建立时设置 WAL、同步级别和缓存，使读写互不阻塞
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+    cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout)}")
+    cursor.execute(f"PRAGMA cache_size={int(settings.sqlite_cache_size)}")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+    cursor.close()
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./zhiban.db"
+def create_db_engine(database_url: Optional[str] = None) -> Engine:
+    url = make_url(database_url or settings.database_url)
+    if url.get_backend_name() != "sqlite":
+        return create_engine(
+            url,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_pre_ping=True
+        )
+    connect_args = {
+        "check_same_thread": False,
+        "timeout": settings.sqlite_busy_timeout / 1000
+    }
+    if url.database in (None, "", ":memory:"):
+        # 内存数据库只能共享同一个连接
+        sqlite_engine = create_engine(url, connect_args=connect_args, poolclass=StaticPool)
+    else:
+        sqlite_engine = create_engine(
+            url,
+            connect_args=connect_args,
+            poolclass=QueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout
+        )
+    event.listen(sqlite_engine, "connect", _set_sqlite_pragmas)
+    return sqlite_engine
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+engine = create_db_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
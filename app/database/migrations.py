@@ -0,0 +1,37 @@
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect
+
+from app.database.database import engine
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+# 与引入 Alembic 之前由 create_all 建出的数据库结构一致的版本
+BASELINE_REVISION = "0001"
+
+def _alembic_config() -> Config:
+    return Config(str(ALEMBIC_INI))
+
+def upgrade_database():
+    config = _alembic_config()
+    with engine.begin() as connection:
+        current = MigrationContext.configure(connection).get_current_revision()
+        config.attributes["connection"] = connection
+        # 旧数据库已有表但没有版本记录，先标记为基线版本再升级
+        if current is None and inspect(connection).has_table("students"):
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, "head")
+
+def check_schema_version():
+    # 启动时只比较版本号，不做结构反射
+    heads = set(ScriptDirectory.from_config(_alembic_config()).get_heads())
+    with engine.connect() as connection:
+        current = set(MigrationContext.configure(connection).get_current_heads())
+    if current != heads:
+        raise RuntimeError(
+            f"数据库结构版本 {sorted(current) or '未初始化'} 与程序要求的 {sorted(heads)} 不一致，"
+            "请先运行 python init_db.py 或 alembic upgrade head"
+        )
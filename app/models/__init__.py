@@ -1,5 +1,10 @@
 from app.models.student import Student
 from app.models.schedule import Schedule
 from app.models.work_record import WorkRecord
+from app.models.duty_rollup import DutyRollup
+from app.models.refresh_token import RefreshToken
+from app.models.data_version import DataVersion
+from app.models.event_log import EventLog
+from app.models.stream_ticket import StreamTicket
 
-__all__ = ["Student", "Schedule", "WorkRecord"]
+__all__ = ["Student", "Schedule", "WorkRecord", "DutyRollup", "RefreshToken", "DataVersion", "EventLog", "StreamTicket"]
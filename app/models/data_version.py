@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String
+
+from app.database.database import Base
+
+class DataVersion(Base):
+    """按范围计数的数据版本号，由数据库触发器在相关数据变更时递增
+
+    各进程的内存缓存以版本号判断是否过期，其他进程或直接写库的修改同样可见。
+    """
+    __tablename__ = "data_versions"
+
+    scope = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, Date, PrimaryKeyConstraint
+
+from app.database.database import Base
+
+class DutyRollup(Base):
+    """按 (学生, 日期) 汇总的值班统计，由数据库触发器在写入排班和工作记录时增量维护"""
+    __tablename__ = "duty_rollups"
+    __table_args__ = (
+        PrimaryKeyConstraint("student_id", "date"),
+    )
+
+    student_id = Column(Integer, nullable=False)
+    date = Column(Date, nullable=False)
+    shift_count = Column(Integer, nullable=False, default=0)
+    completed_records = Column(Integer, nullable=False, default=0)
+    pending_handovers = Column(Integer, nullable=False, default=0)
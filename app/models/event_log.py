@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from datetime import datetime
+
+from app.database.database import Base
+
+class EventLog(Base):
+    """实时推送事件日志，各进程轮询新行并推送给本进程内的 SSE 连接
+
+    自增ID即 SSE 事件ID，跨进程、跨重启单调递增，断线重连时按 Last-Event-ID 从表中补发。
+    只保留最近 events_backlog 条。
+    """
+    __tablename__ = "event_log"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id = Column(Integer, primary_key=True)
+    type = Column(String(50), nullable=False)
+    data = Column(JSON, nullable=False)
+    audience = Column(JSON, nullable=True)  # 接收人学生ID列表，NULL 表示所有用户
+    created_at = Column(DateTime, default=datetime.now)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from datetime import datetime
+
+from app.database.database import Base
+
+class RefreshToken(Base):
+    """刷新令牌，数据库中只保存令牌的 SHA-256 摘要
+
+    每次刷新都会吊销旧令牌并签发新令牌，同一次登录轮换出的令牌属于同一家族（family_id）。
+    """
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=False, index=True)
+    token_hash = Column(String(64), unique=True, nullable=False, index=True)
+    family_id = Column(String(32), nullable=False, index=True)
+    expires_at = Column(DateTime, nullable=False)
+    created_at = Column(DateTime, default=datetime.now)
+    revoked_at = Column(DateTime, nullable=True)
@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, Date, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database.database import Base
 
 class Schedule(Base):
     __tablename__ = "schedules"
+    __table_args__ = (
+        Index("ix_schedules_student_id_date", "student_id", "date"),
+        Index("ix_schedules_date_time_slot", "date", "time_slot"),
+        Index("uq_schedules_date_student_id_time_slot", "date", "student_id", "time_slot", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     date = Column(Date, nullable=False, index=True)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+
+from app.database.database import Base
+
+class StreamTicket(Base):
+    """SSE 连接票据，数据库中只保存票据的 SHA-256 摘要
+
+    EventSource 无法发送 Authorization 头，客户端先用访问令牌换取短时效票据再放在地址中，
+    票据使用一次即删除，避免访问令牌出现在访问日志里；任一进程签发的票据可在其他进程使用。
+    """
+    __tablename__ = "stream_tickets"
+
+    ticket_hash = Column(String(64), primary_key=True)
+    student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
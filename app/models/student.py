@@ -20,6 +20,8 @@ class Student(Base):
     department = Column(String(50), nullable=True)
     class_ = Column('class', String(50), nullable=True)
     gender = Column(String(10), nullable=True)
+    # 由数据库触发器在学生信息变更时递增，用于校验各进程中缓存的认证用户
+    auth_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     # 关系
     schedules = relationship("Schedule", back_populates="student")
@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 
 from app.database.database import Base
 
 class Todo(Base):
     __tablename__ = "todos"
+    __table_args__ = (
+        Index("ix_todos_assigned_to_status", "assigned_to", "status"),
+        Index("ix_todos_created_by_status", "created_by", "status"),
+        Index("ix_todos_status", "status"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(100), nullable=False)
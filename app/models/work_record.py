@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database.database import Base
 
 class WorkRecord(Base):
     __tablename__ = "work_records"
+    __table_args__ = (
+        Index("ix_work_records_student_id_date", "student_id", "date"),
+        Index("ix_work_records_student_id_status", "student_id", "status"),
+        Index("ix_work_records_status_date", "status", "date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     date = Column(Date, nullable=False, index=True)
@@ -3,6 +3,9 @@ from app.routes.students import router as students_router
 from app.routes.schedules import router as schedules_router
 from app.routes.work_records import router as work_records_router
 from app.routes.todos import router as todos_router
+from app.routes.stats import router as stats_router
+from app.routes.search import router as search_router
+from app.routes.events import router as events_router
 
 # 导出路由模块，方便main.py导入
 auth = auth_router
@@ -10,5 +13,8 @@ students = students_router
 schedules = schedules_router
 work_records = work_records_router
 todos = todos_router
+stats = stats_router
+search = search_router
+events = events_router
 
-__all__ = ["auth", "students", "schedules", "work_records", "todos"]
+__all__ = ["auth", "students", "schedules", "work_records", "todos", "stats", "search", "events"]
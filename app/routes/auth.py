@@ -1,17 +1,45 @@
+import asyncio
+import time
+import uuid
 from datetime import timedelta, datetime
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from typing import Optional
 
+from app.config import settings
 from app.database.database import get_db
+from app.models.refresh_token import RefreshToken
 from app.models.student import Student
-from app.schemas.auth import Token, TokenData
-from app.utils.auth import verify_password, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES, decode_token
+from app.schemas.auth import Token, TokenData, RefreshRequest
+from app.utils.auth import (
+    verify_password, create_access_token, ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS,
+    decode_token, token_cache, get_hash_executor, generate_refresh_token, hash_refresh_token
+)
+from app.utils.cache import TTLCache
+from app.utils.login_recorder import login_recorder
 
 router = APIRouter()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+# 已认证用户缓存，键为令牌中的用户名，值为 (学生快照, 上次与数据库比对的时间)。
+# 本进程修改学生信息的接口调用 user_cache.invalidate 立即失效；其他进程的修改在
+# auth_revalidate_interval 秒后命中时通过比对 auth_version 发现
+user_cache = TTLCache(maxsize=settings.auth_cache_maxsize, ttl=settings.auth_cache_ttl)
+# 命中但超过比对间隔、查询了 auth_version 的次数
+user_cache_revalidations = 0
+
+def _detached_snapshot(student: Student) -> Student:
+    # 复制列属性得到一个脱离会话的快照，供其他请求通过 merge 复用
+    snapshot = Student(**{
+        attr.key: getattr(student, attr.key) for attr in inspect(Student).column_attrs
+    })
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -23,12 +51,29 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = De
     username: str = payload.get("sub")
     if username is None:
         raise credentials_exception
+    cached = user_cache.get(username)
+    if cached is not None:
+        # 返回的快照不属于任何会话、由多个请求共享，需要修改当前用户的接口应重新查询
+        snapshot, checked_at = cached
+        if time.monotonic() - checked_at < settings.auth_revalidate_interval:
+            return snapshot
+        # 只查询版本号：学生已删除或信息已被修改时重新加载
+        global user_cache_revalidations
+        user_cache_revalidations += 1
+        version = db.query(Student.auth_version).filter(Student.username == username).scalar()
+        if version is None:
+            user_cache.invalidate(username)
+            raise credentials_exception
+        if version == snapshot.auth_version:
+            user_cache.set(username, (snapshot, time.monotonic()))
+            return snapshot
     student = db.query(Student).filter(Student.username == username).first()
     if student is None:
         raise credentials_exception
+    user_cache.set(username, (_detached_snapshot(student), time.monotonic()))
     return student
 
-async def get_current_admin(current_user: Student = Depends(get_current_user)):
+def get_current_admin(current_user: Student = Depends(get_current_user)):
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -36,31 +81,135 @@ async def get_current_admin(current_user: Student = Depends(get_current_user)):
         )
     return current_user
 
+def _new_refresh_token(student_id: int, family_id: str, now: datetime):
+    """返回 (刷新令牌, RefreshToken 列值)"""
+    refresh_token = generate_refresh_token()
+    return refresh_token, {
+        "student_id": student_id,
+        "token_hash": hash_refresh_token(refresh_token),
+        "family_id": family_id,
+        "expires_at": now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+        "created_at": now
+    }
+
+def _token_response(student: Student, refresh_token: str, family_id: str) -> dict:
+    # fid 为刷新令牌家族，修改密码时据此保留当前会话、吊销其他会话
+    access_token = create_access_token(
+        data={"sub": student.username, "student_id": student.id, "is_admin": student.is_admin, "fid": family_id},
+        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+        "expires_in": ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    }
+
+def revoke_refresh_tokens(
+    db: Session, now: datetime, student_id: Optional[int] = None, family_id: Optional[str] = None,
+    keep_family_id: Optional[str] = None
+) -> int:
+    """吊销学生或令牌家族下仍有效的刷新令牌，keep_family_id 指定的家族除外，由调用方提交事务"""
+    query = db.query(RefreshToken).filter(RefreshToken.revoked_at.is_(None))
+    if student_id is not None:
+        query = query.filter(RefreshToken.student_id == student_id)
+    if family_id is not None:
+        query = query.filter(RefreshToken.family_id == family_id)
+    if keep_family_id is not None:
+        query = query.filter(RefreshToken.family_id != keep_family_id)
+    return query.update({RefreshToken.revoked_at: now}, synchronize_session=False)
+
+def _find_refresh_token(db: Session, refresh_token: str) -> Optional[RefreshToken]:
+    token_hash = hash_refresh_token(refresh_token)
+    return db.query(RefreshToken).filter(RefreshToken.token_hash == token_hash).first()
+
+def _store_refresh_token(db: Session, refresh_row: dict):
+    db.add(RefreshToken(**refresh_row))
+    db.commit()
+
 @router.post("/login")
 async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    student = db.query(Student).filter(Student.username == form_data.username).first()
-    if not student or not verify_password(form_data.password, student.password_hash):
+    student = await run_in_threadpool(
+        lambda: db.query(Student).filter(Student.username == form_data.username).first()
+    )
+    # 密码校验在进程池中计算，不占用事件循环和线程池
+    password_valid = False
+    if student:
+        password_valid = await asyncio.get_running_loop().run_in_executor(
+            get_hash_executor(), verify_password, form_data.password, student.password_hash
+        )
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    # 更新登录状态
-    student.is_active = True
-    student.last_login = datetime.now()
-    db.commit()
-    
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": student.username, "student_id": student.id, "is_admin": student.is_admin},
-        expires_delta=access_token_expires
-    )
-    
+    now = datetime.now()
+    family_id = uuid.uuid4().hex
+    student_id = student.id
+    refresh_token, refresh_row = _new_refresh_token(student_id, family_id, now)
+    # 提交后 student 的属性会过期，再读取会在事件循环线程中重新查询，响应须在提交前生成
+    response = _token_response(student, refresh_token, family_id)
     # 检查是否需要强制更改密码
-    require_password_change = not student.is_admin and not student.is_password_set
-    
+    response["require_password_change"] = not student.is_admin and not student.is_password_set
+    # 刷新令牌每次登录单独插入并提交：若也写入缓冲，另一进程在写入前收到刷新请求会当作无效令牌。
+    # 只插入一行，持有写锁的时间很短；登录状态（last_login）仍写入缓冲，由后台线程批量写入
+    await run_in_threadpool(_store_refresh_token, db, refresh_row)
+    login_recorder.record(student_id, now)
+    return response
+
+@router.post("/refresh", response_model=Token)
+def refresh(refresh_data: RefreshRequest, db: Session = Depends(get_db)):
+    invalid_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    stored = _find_refresh_token(db, refresh_data.refresh_token)
+    now = datetime.now()
+    if stored is None or stored.expires_at <= now:
+        raise invalid_exception
+    # 条件更新保证同一令牌只能轮换一次；已轮换的令牌再次出现说明可能已泄露，吊销整个家族。
+    # 刚轮换不久的令牌多半是另一个标签页同时发起的刷新，只拒绝，由客户端改用已保存的新令牌
+    rotated = db.query(RefreshToken).filter(
+        RefreshToken.id == stored.id,
+        RefreshToken.revoked_at.is_(None)
+    ).update({RefreshToken.revoked_at: now}, synchronize_session=False)
+    if not rotated:
+        # 并发刷新时 stored 可能读取于轮换之前，重新读取吊销时间
+        revoked_at = db.query(RefreshToken.revoked_at).filter(RefreshToken.id == stored.id).scalar()
+        if revoked_at is not None and now - revoked_at <= timedelta(seconds=settings.refresh_reuse_grace_seconds):
+            db.rollback()
+            raise invalid_exception
+        revoke_refresh_tokens(db, now, family_id=stored.family_id)
+        db.commit()
+        raise invalid_exception
+    student = db.query(Student).filter(Student.id == stored.student_id).first()
+    if student is None:
+        db.rollback()
+        raise invalid_exception
+    refresh_token, refresh_row = _new_refresh_token(student.id, stored.family_id, now)
+    db.add(RefreshToken(**refresh_row))
+    # 顺带清理该学生已过期的令牌
+    db.query(RefreshToken).filter(
+        RefreshToken.student_id == student.id,
+        RefreshToken.expires_at <= now
+    ).delete(synchronize_session=False)
+    db.commit()
+    return _token_response(student, refresh_token, stored.family_id)
+
+@router.post("/logout")
+def logout(refresh_data: RefreshRequest, db: Session = Depends(get_db)):
+    stored = _find_refresh_token(db, refresh_data.refresh_token)
+    if stored is not None:
+        revoke_refresh_tokens(db, datetime.now(), family_id=stored.family_id)
+        db.commit()
+    return {"message": "Logged out successfully"}
+
+@router.get("/cache-stats")
+def get_cache_stats(current_admin: Student = Depends(get_current_admin)):
     return {
-        "access_token": access_token, 
-        "token_type": "bearer",
-        "require_password_change": require_password_change
+        "user_cache": dict(user_cache.stats(), revalidations=user_cache_revalidations),
+        "token_cache": token_cache.stats(),
+        "login_recorder": login_recorder.stats()
     }
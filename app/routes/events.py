@@ -0,0 +1,150 @@
+import asyncio
+import hashlib
+import json
+import secrets
+import time
+from datetime import datetime, timedelta
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.config import settings
+from app.database.database import SessionLocal, get_db
+from app.models.student import Student
+from app.models.stream_ticket import StreamTicket
+from app.routes.auth import get_current_user, get_current_admin
+from app.utils.events import Event, Subscription, event_broker
+
+router = APIRouter()
+
+def _hash_ticket(ticket: str) -> str:
+    return hashlib.sha256(ticket.encode()).hexdigest()
+
+def _redeem_ticket(ticket: str):
+    """删除票据并返回 (学生ID, 是否管理员, auth_version)；票据无效、过期或已使用时返回 401"""
+    invalid_ticket = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid or expired stream ticket",
+    )
+    # 流式连接会长时间保持，只在建立连接时短暂使用数据库会话
+    db = SessionLocal()
+    try:
+        ticket_hash = _hash_ticket(ticket)
+        stored = (
+            db.query(StreamTicket.student_id, StreamTicket.expires_at)
+            .filter(StreamTicket.ticket_hash == ticket_hash)
+            .first()
+        )
+        # 同一票据并发使用时只有一个请求能删除成功
+        deleted = db.query(StreamTicket).filter(StreamTicket.ticket_hash == ticket_hash).delete(synchronize_session=False)
+        db.commit()
+        if stored is None or not deleted or stored.expires_at <= datetime.now():
+            raise invalid_ticket
+        student = (
+            db.query(Student.id, Student.is_admin, Student.auth_version)
+            .filter(Student.id == stored.student_id)
+            .first()
+        )
+        if student is None:
+            raise invalid_ticket
+        return student.id, bool(student.is_admin), student.auth_version
+    finally:
+        db.close()
+
+def _still_authorized(student_id: int, auth_version: int) -> bool:
+    # 删除、降级、修改密码等都会改变 auth_version
+    db = SessionLocal()
+    try:
+        current = db.query(Student.auth_version).filter(Student.id == student_id).scalar()
+    finally:
+        db.close()
+    return current == auth_version
+
+def _format_event(event: Event) -> str:
+    event_id, event_type, data, _ = event
+    return f"id: {event_id}\nevent: {event_type}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+def _format_resync() -> str:
+    # 客户端收到 resync 后应重新拉取完整列表
+    return "event: resync\ndata: {}\n\n"
+
+async def _event_stream(request: Request, subscription: Subscription, replay, last_event_id: int, auth_version: int):
+    # 先订阅后补发，推送队列中可能有已补发的事件
+    last_sent = last_event_id
+    next_check = time.monotonic() + settings.events_auth_recheck
+    try:
+        yield f"retry: {settings.events_retry_ms}\n\n"
+        if replay is None:
+            yield _format_resync()
+        else:
+            for event in replay:
+                yield _format_event(event)
+                last_sent = event[0]
+        while True:
+            if time.monotonic() >= next_check:
+                # 用户失去权限后结束连接；浏览器用已使用的票据重连会得到 401，需重新换取票据
+                if not await run_in_threadpool(_still_authorized, subscription.student_id, auth_version):
+                    break
+                next_check = time.monotonic() + settings.events_auth_recheck
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=settings.events_heartbeat)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                # 心跳注释，防止代理断开空闲连接
+                yield ": ping\n\n"
+                continue
+            if subscription.overflowed:
+                while not subscription.queue.empty():
+                    subscription.queue.get_nowait()
+                subscription.overflowed = False
+                yield _format_resync()
+                continue
+            if event[0] <= last_sent:
+                continue
+            yield _format_event(event)
+            last_sent = event[0]
+    finally:
+        event_broker.unsubscribe(subscription)
+
+@router.post("/ticket")
+def create_stream_ticket(current_user: Student = Depends(get_current_user), db: Session = Depends(get_db)):
+    """换取一次性的 SSE 连接票据；EventSource 无法发送 Authorization 头，票据代替访问令牌放在地址中"""
+    now = datetime.now()
+    ticket = secrets.token_urlsafe(32)
+    db.query(StreamTicket).filter(StreamTicket.expires_at <= now).delete(synchronize_session=False)
+    db.add(StreamTicket(
+        ticket_hash=_hash_ticket(ticket),
+        student_id=current_user.id,
+        expires_at=now + timedelta(seconds=settings.events_ticket_ttl)
+    ))
+    db.commit()
+    return {"ticket": ticket, "expires_in": settings.events_ticket_ttl}
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    ticket: str = Query(..., description="One-time ticket from POST /events/ticket"),
+    last_event_id: Optional[int] = Header(None)
+):
+    student_id, is_admin, auth_version = await run_in_threadpool(_redeem_ticket, ticket)
+    subscription = event_broker.subscribe(student_id, is_admin)
+    replay = []
+    if last_event_id is not None:
+        try:
+            replay = await run_in_threadpool(event_broker.replay, subscription, last_event_id)
+        except Exception:
+            event_broker.unsubscribe(subscription)
+            raise
+    return StreamingResponse(
+        _event_stream(request, subscription, replay, last_event_id or 0, auth_version),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/stats")
+def get_event_stats(current_admin: Student = Depends(get_current_admin)):
+    return event_broker.stats()
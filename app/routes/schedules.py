@@ -1,18 +1,90 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+import hashlib
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
+from typing import List, Optional, Union
 from datetime import date, datetime, timedelta
 
+from app.config import settings
 from app.database.database import get_db
 from app.models.schedule import Schedule
 from app.models.student import Student
-from app.schemas.schedule import ScheduleCreate, ScheduleUpdate, ScheduleResponse, CalendarView
+from app.schemas.schedule import (
+    ScheduleCreate, ScheduleUpdate, ScheduleResponse, CalendarView,
+    ScheduleBulkCreate, ScheduleBulkResult, ScheduleBulkResponse,
+    ScheduleGenerateRequest, ScheduleGenerateResponse, ScheduleConflict
+)
+from app.schemas.pagination import Page
 from app.routes.auth import get_current_user, get_current_admin
+from app.utils.cache import TTLCache
+from app.utils.conflicts import ScheduleIntervalIndex, find_conflict_groups
+from app.utils.data_versions import calendar_scope, get_data_version
+from app.utils.events import event_broker
+from app.utils.export import export_response, iter_query_rows
+from app.utils.pagination import paginate, MAX_PAGE_SIZE
+from app.utils.responses import rows_response
+from app.utils.roster import generate_roster
 
 router = APIRouter()
 
+# 月历视图缓存：键为 (year, month)，值为 (版本号, etag, JSON正文)。
+# 版本号由数据库触发器在该月排班或相关学生姓名变化时递增，任一进程（或直接写库）的修改都会使缓存失效
+calendar_cache = TTLCache(maxsize=settings.calendar_cache_maxsize, ttl=settings.calendar_cache_ttl)
+_calendar_adapter = TypeAdapter(List[CalendarView])
+
+CONFLICT_DETAIL = "Schedule conflicts with an existing schedule of this student"
+
+def _load_interval_index(db: Session, student_ids, start_date: date, end_date: date) -> ScheduleIntervalIndex:
+    # 一次查询载入相关学生在日期范围内的已有排班
+    index = ScheduleIntervalIndex()
+    rows = db.query(Schedule.id, Schedule.student_id, Schedule.date, Schedule.time_slot).filter(
+        Schedule.student_id.in_(student_ids),
+        Schedule.date >= start_date,
+        Schedule.date <= end_date
+    )
+    for row in rows:
+        index.add(row.student_id, row.date, row.time_slot, row.id)
+    return index
+
+def _publish_range_changed(start_date: date, end_date: date, count: int):
+    # 批量变更只推送日期范围，客户端重新拉取该范围内的排班
+    event_broker.publish("schedules.changed", {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "count": count
+    })
+
+def _raise_conflict():
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=CONFLICT_DETAIL
+    )
+
+# 列表接口按 ScheduleResponse 的字段选择列，直接编码查询结果
+SCHEDULE_RESPONSE_COLUMNS = (
+    Schedule.id,
+    Schedule.date,
+    Schedule.time_slot,
+    Schedule.student_id,
+    Schedule.location,
+    Schedule.notes,
+    Student.name.label("student_name")
+)
+
+def _filter_schedules(query, start_date, end_date, student_id):
+    if start_date:
+        query = query.filter(Schedule.date >= start_date)
+    if end_date:
+        query = query.filter(Schedule.date <= end_date)
+    if student_id:
+        query = query.filter(Schedule.student_id == student_id)
+    return query
+
 @router.post("/", response_model=ScheduleResponse)
-async def create_schedule(
+def create_schedule(
     schedule_data: ScheduleCreate,
     db: Session = Depends(get_db),
     current_admin: Student = Depends(get_current_admin)
@@ -24,49 +96,234 @@ async def create_schedule(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Student not found"
         )
+    # 检查该学生当天是否已有重复或时间重叠的排班
+    index = _load_interval_index(db, [student.id], schedule_data.date, schedule_data.date)
+    if index.find_conflict(student.id, schedule_data.date, schedule_data.time_slot) is not None:
+        _raise_conflict()
     # 创建新排班
     new_schedule = Schedule(**schedule_data.model_dump())
     db.add(new_schedule)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        _raise_conflict()
     db.refresh(new_schedule)
     # 添加学生姓名
     response = ScheduleResponse.model_validate(new_schedule)
     response.student_name = student.name
+    event_broker.publish("schedule.created", response.model_dump(mode="json"))
     return response
 
-@router.get("/", response_model=List[ScheduleResponse])
-async def get_schedules(
+@router.post("/bulk", response_model=ScheduleBulkResponse)
+def bulk_create_schedules(
+    bulk_data: ScheduleBulkCreate,
+    db: Session = Depends(get_db),
+    current_admin: Student = Depends(get_current_admin)
+):
+    # 一次查询确认所有学生是否存在
+    student_ids = {item.student_id for item in bulk_data.schedules}
+    existing_ids = set()
+    if student_ids:
+        existing_ids = {
+            row.id for row in db.query(Student.id).filter(Student.id.in_(student_ids))
+        }
+    # 载入已有排班，与本批数据一起做冲突检测
+    conflicts = ScheduleIntervalIndex()
+    if existing_ids:
+        dates = [item.date for item in bulk_data.schedules]
+        conflicts = _load_interval_index(db, existing_ids, min(dates), max(dates))
+    results = [None] * len(bulk_data.schedules)
+    rows = []
+    row_indexes = []
+    for index, item in enumerate(bulk_data.schedules):
+        if item.student_id not in existing_ids:
+            results[index] = ScheduleBulkResult(index=index, success=False, detail="Student not found")
+            continue
+        if conflicts.find_conflict(item.student_id, item.date, item.time_slot) is not None:
+            results[index] = ScheduleBulkResult(index=index, success=False, detail=CONFLICT_DETAIL)
+            continue
+        conflicts.add(item.student_id, item.date, item.time_slot)
+        rows.append(item.model_dump())
+        row_indexes.append(index)
+    # 单个事务内批量插入
+    if rows:
+        try:
+            inserted = db.execute(
+                insert(Schedule).returning(Schedule.id, sort_by_parameter_order=True),
+                rows
+            ).scalars().all()
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            _raise_conflict()
+        _publish_range_changed(min(row["date"] for row in rows), max(row["date"] for row in rows), len(rows))
+        for index, schedule_id in zip(row_indexes, inserted):
+            results[index] = ScheduleBulkResult(index=index, success=True, id=schedule_id)
+    return ScheduleBulkResponse(
+        created=len(rows),
+        failed=len(results) - len(rows),
+        results=results
+    )
+
+@router.post("/generate", response_model=ScheduleGenerateResponse)
+def generate_schedules(
+    generate_data: ScheduleGenerateRequest,
+    db: Session = Depends(get_db),
+    current_admin: Student = Depends(get_current_admin)
+):
+    if generate_data.end_date < generate_data.start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must not be earlier than start_date"
+        )
+    # 确定参与排班的学生
+    student_query = db.query(Student.id)
+    if generate_data.student_ids is not None:
+        student_query = student_query.filter(Student.id.in_(generate_data.student_ids))
+    else:
+        student_query = student_query.filter(Student.is_admin.isnot(True))
+    student_ids = [row.id for row in student_query.order_by(Student.id)]
+    if not student_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Student not found"
+        )
+    # 排除停班日期和不排班的星期
+    blackout_dates = set(generate_data.blackout_dates)
+    weekdays = set(generate_data.weekdays)
+    days = []
+    current_day = generate_data.start_date
+    while current_day <= generate_data.end_date:
+        if current_day.weekday() in weekdays and current_day not in blackout_dates:
+            days.append(current_day)
+        current_day += timedelta(days=1)
+    # 已有排班计入负载，避免重复排班
+    existing = db.query(Schedule.student_id, Schedule.date, Schedule.time_slot).filter(
+        Schedule.date >= generate_data.start_date,
+        Schedule.date <= generate_data.end_date,
+        Schedule.student_id.in_(student_ids)
+    ).all()
+    assignments, unfilled, loads = generate_roster(
+        student_ids,
+        days,
+        generate_data.time_slots,
+        generate_data.locations or [None],
+        students_per_slot=generate_data.students_per_slot,
+        max_shifts_per_day=generate_data.max_shifts_per_day,
+        max_shifts_per_week=generate_data.max_shifts_per_week,
+        existing=existing
+    )
+    rows = [
+        {"date": day, "student_id": student_id, "time_slot": time_slot, "location": location}
+        for day, time_slot, location, student_id in assignments
+    ]
+    if rows and not generate_data.dry_run:
+        try:
+            db.execute(insert(Schedule), rows)
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            _raise_conflict()
+        _publish_range_changed(generate_data.start_date, generate_data.end_date, len(rows))
+    return ScheduleGenerateResponse(
+        created=0 if generate_data.dry_run else len(rows),
+        unfilled=unfilled,
+        min_shifts=min(loads.values()),
+        max_shifts=max(loads.values()),
+        schedules=[ScheduleCreate(**row) for row in rows]
+    )
+
+@router.get("/", response_model=Union[List[ScheduleResponse], Page[ScheduleResponse]])
+def get_schedules(
     start_date: Optional[date] = Query(None, description="Start date for filtering"),
     end_date: Optional[date] = Query(None, description="End date for filtering"),
     student_id: Optional[int] = Query(None, description="Filter by student ID"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
 ):
-    query = db.query(Schedule)
-    if start_date:
-        query = query.filter(Schedule.date >= start_date)
-    if end_date:
-        query = query.filter(Schedule.date <= end_date)
-    if student_id:
-        query = query.filter(Schedule.student_id == student_id)
-    schedules = query.all()
-    # 添加学生姓名
-    response = []
-    for schedule in schedules:
-        schedule_response = ScheduleResponse.model_validate(schedule)
-        student = db.query(Student).filter(Student.id == schedule.student_id).first()
-        if student:
-            schedule_response.student_name = student.name
-        response.append(schedule_response)
-    return response
+    query = db.query(*SCHEDULE_RESPONSE_COLUMNS).outerjoin(Student, Schedule.student_id == Student.id)
+    query = _filter_schedules(query, start_date, end_date, student_id)
+    if limit is not None or cursor is not None:
+        rows, next_cursor = paginate(query, [Schedule.date, Schedule.id], limit, cursor)
+        return rows_response(rows, paginated=True, next_cursor=next_cursor)
+    return rows_response(query.all())
+
+@router.get("/conflicts", response_model=List[ScheduleConflict])
+def get_schedule_conflicts(
+    start_date: Optional[date] = Query(None, description="Start date for filtering"),
+    end_date: Optional[date] = Query(None, description="End date for filtering"),
+    student_id: Optional[int] = Query(None, description="Filter by student ID"),
+    db: Session = Depends(get_db),
+    current_admin: Student = Depends(get_current_admin)
+):
+    # 按 (学生, 日期) 顺序单次扫描，找出同一学生同一天重复或时间重叠的排班
+    query = db.query(
+        Schedule.id, Schedule.student_id, Schedule.date, Schedule.time_slot, Student.name
+    ).outerjoin(Student, Student.id == Schedule.student_id)
+    query = _filter_schedules(query, start_date, end_date, student_id)
+    rows = query.order_by(Schedule.student_id, Schedule.date).yield_per(1000)
+    return [
+        ScheduleConflict(
+            date=group[0][2],
+            student_id=group[0][1],
+            student_name=group[0][4],
+            schedule_ids=[row[0] for row in group],
+            time_slots=[row[3] for row in group]
+        )
+        for group in find_conflict_groups(tuple(row) for row in rows)
+    ]
+
+@router.get("/export")
+def export_schedules(
+    start_date: Optional[date] = Query(None, description="Start date for filtering"),
+    end_date: Optional[date] = Query(None, description="End date for filtering"),
+    student_id: Optional[int] = Query(None, description="Filter by student ID"),
+    export_format: str = Query("csv", alias="format", pattern="^(csv|xlsx)$", description="csv or xlsx"),
+    current_user: Student = Depends(get_current_user)
+):
+    def build_query(db: Session):
+        query = db.query(
+            Schedule.date,
+            Schedule.time_slot,
+            Student.name,
+            Student.username,
+            Schedule.location,
+            Schedule.notes
+        ).outerjoin(Student, Student.id == Schedule.student_id)
+        query = _filter_schedules(query, start_date, end_date, student_id)
+        return query.order_by(Schedule.date, Schedule.id)
+
+    return export_response(
+        "值班表", export_format, "值班表",
+        ["日期", "时段", "姓名", "学号", "地点", "备注"],
+        iter_query_rows(build_query)
+    )
 
 @router.get("/calendar/{year}/{month}", response_model=List[CalendarView])
-async def get_calendar_view(
+def get_calendar_view(
     year: int,
     month: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
 ):
+    # 先读版本号再生成：与写入并发时缓存记下的是较旧的版本号，下次请求会重新生成
+    version = get_data_version(db, calendar_scope(year, month))
+    cached = calendar_cache.get((year, month))
+    if cached is None or cached[0] != version:
+        body = _calendar_adapter.dump_json(_build_calendar(db, year, month))
+        cached = (version, '"%s"' % hashlib.sha1(body).hexdigest(), body)
+        calendar_cache.set((year, month), cached)
+    _, etag, body = cached
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _build_calendar(db: Session, year: int, month: int) -> List[CalendarView]:
     # 计算月份的开始和结束日期
     start_date = date(year, month, 1)
     if month == 12:
@@ -74,7 +331,7 @@ async def get_calendar_view(
     else:
         end_date = date(year, month + 1, 1) - timedelta(days=1)
     # 获取该月的所有排班
-    schedules = db.query(Schedule).filter(
+    schedules = db.query(Schedule).options(joinedload(Schedule.student)).filter(
         Schedule.date >= start_date,
         Schedule.date <= end_date
     ).all()
@@ -84,9 +341,8 @@ async def get_calendar_view(
         if schedule.date not in date_schedules:
             date_schedules[schedule.date] = []
         schedule_response = ScheduleResponse.model_validate(schedule)
-        student = db.query(Student).filter(Student.id == schedule.student_id).first()
-        if student:
-            schedule_response.student_name = student.name
+        if schedule.student:
+            schedule_response.student_name = schedule.student.name
         date_schedules[schedule.date].append(schedule_response)
     # 生成日历视图
     calendar = []
@@ -100,7 +356,7 @@ async def get_calendar_view(
     return calendar
 
 @router.put("/{schedule_id}", response_model=ScheduleResponse)
-async def update_schedule(
+def update_schedule(
     schedule_id: int,
     schedule_data: ScheduleUpdate,
     db: Session = Depends(get_db),
@@ -114,41 +370,64 @@ async def update_schedule(
         )
     # 更新排班信息
     update_data = schedule_data.model_dump(exclude_unset=True)
+    student_id = update_data.get("student_id") or schedule.student_id
+    time_slot = update_data.get("time_slot") or schedule.time_slot
+    index = _load_interval_index(db, [student_id], schedule.date, schedule.date)
+    if index.find_conflict(student_id, schedule.date, time_slot, exclude_id=schedule.id) is not None:
+        _raise_conflict()
     for field, value in update_data.items():
         setattr(schedule, field, value)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        _raise_conflict()
     db.refresh(schedule)
     # 添加学生姓名
     response = ScheduleResponse.model_validate(schedule)
     student = db.query(Student).filter(Student.id == schedule.student_id).first()
     if student:
         response.student_name = student.name
+    event_broker.publish("schedule.updated", response.model_dump(mode="json"))
     return response
 
 @router.delete("/batch-delete")
-async def batch_delete_schedules(
+def batch_delete_schedules(
     start_date: date = Query(..., description="Start date for batch deletion"),
     end_date: date = Query(..., description="End date for batch deletion"),
+    student_id: Optional[int] = Query(None, description="Only delete schedules of this student"),
+    time_slot: Optional[str] = Query(None, description="Only delete schedules in this time slot"),
+    location: Optional[str] = Query(None, description="Only delete schedules at this location"),
+    dry_run: bool = Query(False, description="Only count matching schedules without deleting"),
     db: Session = Depends(get_db),
     current_admin: Student = Depends(get_current_admin)
 ):
-    schedules = db.query(Schedule).filter(
+    query = db.query(Schedule).filter(
         Schedule.date >= start_date,
         Schedule.date <= end_date
-    ).all()
+    )
+    if student_id:
+        query = query.filter(Schedule.student_id == student_id)
+    if time_slot:
+        query = query.filter(Schedule.time_slot == time_slot)
+    if location:
+        query = query.filter(Schedule.location == location)
     
-    if not schedules:
-        return {"message": "No schedules found in the specified date range"}
+    if dry_run:
+        matched_count = query.count()
+        return {"message": f"{matched_count} schedules would be deleted", "count": matched_count, "dry_run": True}
     
-    deleted_count = len(schedules)
-    for schedule in schedules:
-        db.delete(schedule)
+    # 单条 DELETE 语句完成删除，不加载 ORM 对象
+    deleted_count = query.delete(synchronize_session=False)
+    if not deleted_count:
+        return {"message": "No schedules found in the specified date range", "count": 0}
     db.commit()
+    _publish_range_changed(start_date, end_date, deleted_count)
     
-    return {"message": f"Successfully deleted {deleted_count} schedules"}
+    return {"message": f"Successfully deleted {deleted_count} schedules", "count": deleted_count}
 
 @router.delete("/{schedule_id}")
-async def delete_schedule(
+def delete_schedule(
     schedule_id: int,
     db: Session = Depends(get_db),
     current_admin: Student = Depends(get_current_admin)
@@ -159,6 +438,8 @@ async def delete_schedule(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Schedule not found"
         )
+    schedule_date = schedule.date
     db.delete(schedule)
     db.commit()
+    event_broker.publish("schedule.deleted", {"id": schedule_id, "date": schedule_date.isoformat()})
     return {"message": "Schedule deleted successfully"}
@@ -0,0 +1,117 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import Integer, column, text
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.database.database import get_db
+from app.models.student import Student
+from app.schemas.pagination import Page
+from app.schemas.search import SearchResult
+from app.routes.auth import get_current_user
+from app.utils.pagination import encode_cursor, decode_cursor, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+router = APIRouter()
+
+# trigram 分词至少需要 3 个字符才能匹配，更短的关键词使用二元组索引（*_fts_bigram）
+MIN_MATCH_LENGTH = 3
+SEARCH_TYPES = ("work_record", "todo", "student")
+_OFFSET_COLUMN = column("offset", Integer)
+
+def _fts_table(table: str, use_trigram: bool) -> str:
+    return f"{table}_fts" if use_trigram else f"{table}_fts_bigram"
+
+def _window(text_column: str) -> str:
+    # 二元组索引不保存原文，从源表截取关键词附近的文字作为摘要
+    return (
+        f"replace(substr({text_column}, max(instr({text_column}, :keyword) - 16, 1), 48), "
+        f":keyword, '[' || :keyword || ']')"
+    )
+
+def _work_record_sql(use_trigram: bool) -> str:
+    fts = _fts_table("work_records", use_trigram)
+    if use_trigram:
+        snippet = f"snippet({fts}, -1, '[', ']', '…', 16)"
+    else:
+        snippet = (
+            "CASE WHEN instr(w.content, :keyword) = 0 AND instr(w.handover_notes, :keyword) > 0 "
+            f"THEN {_window('w.handover_notes')} ELSE {_window('w.content')} END"
+        )
+    return (
+        f"SELECT 'work_record' AS type, w.id AS id, s.name AS title, {snippet} AS snippet, w.date AS date, "
+        f"bm25({fts}) AS score "
+        f"FROM {fts} JOIN work_records w ON w.id = {fts}.rowid "
+        "LEFT JOIN students s ON s.id = w.student_id "
+        f"WHERE {fts} MATCH :match"
+    )
+
+def _todo_sql(use_trigram: bool, restricted: bool) -> str:
+    fts = _fts_table("todos", use_trigram)
+    if use_trigram:
+        snippet = f"snippet({fts}, -1, '[', ']', '…', 16)"
+    else:
+        snippet = (
+            f"CASE WHEN instr(t.content, :keyword) > 0 THEN {_window('t.content')} "
+            "ELSE substr(COALESCE(t.content, t.title), 1, 80) END"
+        )
+    sql = (
+        f"SELECT 'todo' AS type, t.id AS id, t.title AS title, {snippet} AS snippet, t.due_date AS date, "
+        f"bm25({fts}) AS score "
+        f"FROM {fts} JOIN todos t ON t.id = {fts}.rowid "
+        f"WHERE {fts} MATCH :match"
+    )
+    # 普通用户只能搜到分配给自己的或自己创建的待办
+    if restricted:
+        sql += " AND (t.assigned_to = :user_id OR t.created_by = :user_id)"
+    return sql
+
+def _student_sql(use_trigram: bool) -> str:
+    fts = _fts_table("students", use_trigram)
+    return (
+        "SELECT 'student' AS type, s.id AS id, s.name AS title, s.username AS snippet, "
+        f"NULL AS date, bm25({fts}) AS score "
+        f"FROM {fts} JOIN students s ON s.id = {fts}.rowid "
+        f"WHERE {fts} MATCH :match"
+    )
+
+def _match_expression(keyword: str, use_trigram: bool) -> str:
+    phrase = '"' + keyword.replace('"', '""') + '"'
+    # 二元组索引中单个字符只出现在词元开头，用前缀查询
+    if not use_trigram and len(keyword) == 1:
+        return phrase + "*"
+    return phrase
+
+@router.get("/", response_model=Page[SearchResult])
+def search(
+    q: str = Query(..., min_length=1, description="Search keywords"),
+    type: Optional[str] = Query(None, pattern="^(work_record|todo|student)$", description="Limit results to one type"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    db: Session = Depends(get_db),
+    current_user: Student = Depends(get_current_user)
+):
+    keyword = q.strip()
+    use_trigram = len(keyword) >= MIN_MATCH_LENGTH
+    types = [type] if type else SEARCH_TYPES
+    parts = []
+    if "work_record" in types:
+        parts.append(_work_record_sql(use_trigram))
+    if "todo" in types:
+        parts.append(_todo_sql(use_trigram, not current_user.is_admin))
+    if "student" in types:
+        parts.append(_student_sql(use_trigram))
+    offset = decode_cursor(cursor, [_OFFSET_COLUMN])[0] if cursor else 0
+    # 结果按 bm25 相关度排序（数值越小越相关），相关度排序无法使用键集分页，游标中记录偏移量
+    sql = " UNION ALL ".join(parts) + " ORDER BY score, type, id DESC LIMIT :limit OFFSET :offset"
+    params = {
+        "match": _match_expression(keyword, use_trigram),
+        "keyword": keyword,
+        "user_id": current_user.id,
+        "limit": limit + 1,
+        "offset": offset
+    }
+    rows = db.execute(text(sql), params).mappings().all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([offset + limit])
+    return Page[SearchResult](items=[SearchResult(**row) for row in rows], next_cursor=next_cursor)
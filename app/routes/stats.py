@@ -0,0 +1,121 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import case, func, literal
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
+
+from app.config import settings
+from app.database.database import get_db
+from app.models.duty_rollup import DutyRollup
+from app.models.schedule import Schedule
+from app.models.student import Student
+from app.models.work_record import WorkRecord
+from app.schemas.stats import DutyStats
+from app.routes.auth import get_current_admin
+
+router = APIRouter()
+
+def _period_column(date_column, period: str):
+    if period == "week":
+        # SQLite 3.46 以下不支持 %G/%V，先按日期分组，再在 Python 中换算为 ISO 周
+        return date_column
+    if period == "month":
+        return func.strftime("%Y-%m", date_column)
+    return literal(None)
+
+def _iso_week(value) -> str:
+    year, week, _ = value.isocalendar()
+    return f"{year}-W{week:02d}"
+
+def _merge_weeks(rows):
+    """把按日期分组的结果合并为 ISO 周（跨年的周归入同一周）"""
+    totals = {}
+    for row_student_id, row_date, *counts in rows:
+        merged = totals.setdefault((row_student_id, _iso_week(row_date)), [0, 0, 0])
+        for index, count in enumerate(counts):
+            merged[index] += count or 0
+    return [(key[0], key[1], *counts) for key, counts in totals.items()]
+
+def _filter_range(query, date_column, student_column, start_date, end_date, student_id):
+    if start_date:
+        query = query.filter(date_column >= start_date)
+    if end_date:
+        query = query.filter(date_column <= end_date)
+    if student_id:
+        query = query.filter(student_column == student_id)
+    return query
+
+def _rollup_stats(db: Session, period: str, start_date, end_date, student_id):
+    period_column = _period_column(DutyRollup.date, period)
+    query = db.query(
+        DutyRollup.student_id,
+        period_column.label("period"),
+        func.sum(DutyRollup.shift_count),
+        func.sum(DutyRollup.completed_records),
+        func.sum(DutyRollup.pending_handovers)
+    )
+    query = _filter_range(query, DutyRollup.date, DutyRollup.student_id, start_date, end_date, student_id)
+    return query.group_by(DutyRollup.student_id, period_column).all()
+
+def _live_stats(db: Session, period: str, start_date, end_date, student_id):
+    schedule_period = _period_column(Schedule.date, period)
+    shifts = db.query(Schedule.student_id, schedule_period.label("period"), func.count(Schedule.id))
+    shifts = _filter_range(shifts, Schedule.date, Schedule.student_id, start_date, end_date, student_id)
+    shifts = shifts.group_by(Schedule.student_id, schedule_period)
+
+    record_period = _period_column(WorkRecord.date, period)
+    record_status = func.coalesce(WorkRecord.status, "pending")
+    records = db.query(
+        WorkRecord.student_id,
+        record_period.label("period"),
+        func.sum(case((record_status == "completed", 1), else_=0)),
+        func.sum(case(
+            ((record_status == "pending") & (func.coalesce(WorkRecord.handover_notes, "") != ""), 1),
+            else_=0
+        ))
+    )
+    records = _filter_range(records, WorkRecord.date, WorkRecord.student_id, start_date, end_date, student_id)
+    records = records.group_by(WorkRecord.student_id, record_period)
+
+    totals = {}
+    for row_student_id, row_period, shift_count in shifts:
+        totals[row_student_id, row_period] = [shift_count, 0, 0]
+    for row_student_id, row_period, completed, pending in records:
+        counts = totals.setdefault((row_student_id, row_period), [0, 0, 0])
+        counts[1] += completed or 0
+        counts[2] += pending or 0
+    return [(key[0], key[1], *counts) for key, counts in totals.items()]
+
+@router.get("/duty", response_model=List[DutyStats])
+def get_duty_stats(
+    period: str = Query("total", pattern="^(total|week|month)$", description="total, week or month"),
+    start_date: Optional[date] = Query(None, description="Start date for filtering"),
+    end_date: Optional[date] = Query(None, description="End date for filtering"),
+    student_id: Optional[int] = Query(None, description="Filter by student ID"),
+    db: Session = Depends(get_db),
+    current_admin: Student = Depends(get_current_admin)
+):
+    if settings.stats_use_rollup:
+        rows = _rollup_stats(db, period, start_date, end_date, student_id)
+    else:
+        rows = _live_stats(db, period, start_date, end_date, student_id)
+    if period == "week":
+        rows = _merge_weeks(rows)
+    rows = [row for row in rows if any(row[2:])]
+    # 一次查询补充学生姓名
+    student_ids = {row[0] for row in rows}
+    names = {}
+    if student_ids:
+        names = dict(db.query(Student.id, Student.name).filter(Student.id.in_(student_ids)).all())
+    rows.sort(key=lambda row: (row[1] or "", row[0]))
+    return [
+        DutyStats(
+            student_id=row[0],
+            student_name=names.get(row[0]),
+            period=row[1],
+            shift_count=row[2] or 0,
+            completed_records=row[3] or 0,
+            pending_handovers=row[4] or 0
+        )
+        for row in rows
+    ]
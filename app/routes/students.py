@@ -1,20 +1,36 @@
+import asyncio
+import json
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Union
 
-from app.database.database import get_db
+from app.database.database import get_db, SessionLocal
 from app.models.student import Student
 from app.models.work_record import WorkRecord
 from app.models.todo import Todo
 from app.models.schedule import Schedule
-from app.schemas.student import StudentCreate, StudentUpdate, StudentAdminUpdate, StudentPasswordReset, StudentResponse
-from app.utils.auth import get_password_hash
-from app.routes.auth import get_current_user, get_current_admin
+from app.models.refresh_token import RefreshToken
+from app.schemas.student import (
+    StudentCreate, StudentUpdate, StudentAdminUpdate, StudentPasswordReset, StudentResponse,
+    StudentBulkCreate, StudentBulkResult, StudentSuggestion
+)
+from app.schemas.pagination import Page
+from app.utils.auth import get_password_hash, get_hash_executor, decode_token
+from app.utils.pagination import paginate, MAX_PAGE_SIZE
+from app.utils.student_index import student_index
+from app.utils.data_versions import STUDENTS_SCOPE, get_data_version
+from app.routes.auth import get_current_user, get_current_admin, oauth2_scheme, user_cache, revoke_refresh_tokens
 
 router = APIRouter()
 
 @router.post("/", response_model=StudentResponse)
-async def create_student(
+def create_student(
     student_data: StudentCreate,
     db: Session = Depends(get_db),
     current_admin: Student = Depends(get_current_admin)
@@ -45,23 +61,149 @@ async def create_student(
     db.refresh(new_student)
     return new_student
 
-@router.get("/", response_model=List[StudentResponse])
-async def get_students(
-    search: Optional[str] = Query(None, description="Search by student ID or name"),
+def _insert_students(rows: List[dict]) -> List[int]:
+    # 在独立会话中单事务批量插入，流式响应期间请求级会话可能已关闭
+    db = SessionLocal()
+    try:
+        ids = db.execute(
+            insert(Student).returning(Student.id, sort_by_parameter_order=True),
+            rows
+        ).scalars().all()
+        db.commit()
+        return ids
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+async def _bulk_import_stream(students: List[StudentCreate], results: List[Optional[StudentBulkResult]]):
+    loop = asyncio.get_running_loop()
+    executor = get_hash_executor()
+    pending = [index for index, result in enumerate(results) if result is None]
+    total = len(pending)
+
+    async def hash_one(index: int):
+        password_hash = await loop.run_in_executor(executor, get_password_hash, students[index].password)
+        return index, password_hash
+
+    # 在进程池中并行计算密码哈希，并按进度回传
+    hashes = {}
+    step = max(1, total // 100)
+    for future in asyncio.as_completed([hash_one(index) for index in pending]):
+        index, password_hash = await future
+        hashes[index] = password_hash
+        if len(hashes) % step == 0 or len(hashes) == total:
+            yield json.dumps({"type": "progress", "hashed": len(hashes), "total": total}) + "\n"
+
+    rows = []
+    for index in pending:
+        item = students[index]
+        rows.append({
+            "name": item.name,
+            "username": item.username,
+            "password_hash": hashes[index],
+            "phone": item.phone,
+            "email": item.email,
+            "department": item.department,
+            "class_": item.class_name,
+            "gender": item.gender,
+            "is_admin": item.is_admin,
+            "is_password_set": False
+        })
+    created = 0
+    if rows:
+        try:
+            ids = await run_in_threadpool(_insert_students, rows)
+        except IntegrityError:
+            for index in pending:
+                results[index] = StudentBulkResult(
+                    index=index, username=students[index].username, success=False,
+                    detail="Username already registered"
+                )
+        else:
+            created = len(ids)
+            for index, student_id in zip(pending, ids):
+                results[index] = StudentBulkResult(
+                    index=index, username=students[index].username, success=True, id=student_id
+                )
+    yield json.dumps({
+        "type": "result",
+        "created": created,
+        "failed": len(results) - created,
+        "results": [result.model_dump() for result in results]
+    }, ensure_ascii=False) + "\n"
+
+@router.post("/bulk")
+def bulk_create_students(
+    bulk_data: StudentBulkCreate,
+    db: Session = Depends(get_db),
+    current_admin: Student = Depends(get_current_admin)
+):
+    # 一次查询检查所有用户名是否已存在
+    usernames = {item.username for item in bulk_data.students}
+    existing_usernames = set()
+    if usernames:
+        existing_usernames = {
+            row.username for row in db.query(Student.username).filter(Student.username.in_(usernames))
+        }
+    results: List[Optional[StudentBulkResult]] = []
+    seen = set()
+    for index, item in enumerate(bulk_data.students):
+        if item.username in existing_usernames or item.username in seen:
+            results.append(StudentBulkResult(
+                index=index, username=item.username, success=False,
+                detail="Username already registered"
+            ))
+            continue
+        seen.add(item.username)
+        results.append(None)
+    return StreamingResponse(
+        _bulk_import_stream(bulk_data.students, results),
+        media_type="application/x-ndjson"
+    )
+
+def _search_student_ids(db: Session, search: str, limit: Optional[int] = None) -> List[int]:
+    # 先读版本号再读学生，加载期间的写入会使版本号不一致，下次查询时重新同步
+    version = get_data_version(db, STUDENTS_SCOPE)
+    if student_index.is_stale(version):
+        student_index.load(db.query(Student.id, Student.username, Student.name), version)
+    return student_index.search(search, limit)
+
+@router.get("/", response_model=Union[List[StudentResponse], Page[StudentResponse]])
+def get_students(
+    search: Optional[str] = Query(None, description="Search by student ID, name, pinyin or pinyin initials (prefix match)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
 ):
     query = db.query(Student)
     if search:
-        query = query.filter(
-            (Student.username == search) | (Student.name.contains(search))
-        )
+        # 先在内存前缀索引中匹配，再按主键取出学生
+        query = query.filter(Student.id.in_(_search_student_ids(db, search)))
     # 按学号从小到大排序
+    if limit is not None or cursor is not None:
+        students, next_cursor = paginate(query, [Student.username], limit, cursor)
+        return Page[StudentResponse](items=students, next_cursor=next_cursor)
     query = query.order_by(Student.username.asc())
     return query.all()
 
+@router.get("/suggest", response_model=List[StudentSuggestion])
+def suggest_students(
+    q: str = Query(..., min_length=1, description="Student ID, name, pinyin or pinyin initials prefix"),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: Student = Depends(get_current_user)
+):
+    # 输入联想直接由内存索引返回，不查询学生表
+    return [
+        StudentSuggestion(id=student_id, username=username, name=name)
+        for student_id, username, name in student_index.lookup(_search_student_ids(db, q, limit))
+    ]
+
 @router.get("/{student_id}", response_model=StudentResponse)
-async def get_student(
+def get_student(
     student_id: int,
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
@@ -81,7 +223,7 @@ async def get_student(
     return student
 
 @router.put("/{student_id}", response_model=StudentResponse)
-async def update_student(
+def update_student(
     student_id: int,
     student_data: StudentUpdate,
     db: Session = Depends(get_db),
@@ -104,11 +246,12 @@ async def update_student(
     for field, value in update_data.items():
         setattr(student, field, value)
     db.commit()
+    user_cache.invalidate(student.username)
     db.refresh(student)
     return student
 
 @router.put("/{student_id}/reset-password")
-async def reset_password(
+def reset_password(
     student_id: int,
     password_data: StudentPasswordReset,
     db: Session = Depends(get_db),
@@ -124,11 +267,14 @@ async def reset_password(
     hashed_password = get_password_hash(password_data.new_password)
     student.password_hash = hashed_password
     student.is_password_set = False
+    # 吊销该学生的全部刷新令牌，已登录的设备需用新密码重新登录
+    revoke_refresh_tokens(db, datetime.now(), student_id=student_id)
     db.commit()
+    user_cache.invalidate(student.username)
     return {"message": "Password reset successfully"}
 
 @router.put("/{student_id}/admin", response_model=StudentResponse)
-async def set_admin(
+def set_admin(
     student_id: int,
     admin_data: StudentAdminUpdate,
     db: Session = Depends(get_db),
@@ -143,11 +289,12 @@ async def set_admin(
     # 设置管理员权限
     student.is_admin = admin_data.is_admin
     db.commit()
+    user_cache.invalidate(student.username)
     db.refresh(student)
     return student
 
 @router.delete("/{student_id}")
-async def delete_student(
+def delete_student(
     student_id: int,
     db: Session = Depends(get_db),
     current_admin: Student = Depends(get_current_admin)
@@ -177,14 +324,20 @@ async def delete_student(
     # 删除相关的值班安排
     db.query(Schedule).filter(Schedule.student_id == student_id).delete()
     
+    # 删除刷新令牌
+    db.query(RefreshToken).filter(RefreshToken.student_id == student_id).delete()
+    
     # 删除学生
+    username = student.username
     db.delete(student)
     db.commit()
+    user_cache.invalidate(username)
     return {"message": "Student deleted successfully"}
 
 @router.post("/change-password")
-async def change_password(
+def change_password(
     new_password: str = Body(..., embed=True),
+    token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
 ):
@@ -194,9 +347,13 @@ async def change_password(
             detail="New password cannot be empty"
         )
     
-    # 更新密码哈希
-    current_user.password_hash = get_password_hash(new_password)
-    current_user.is_password_set = True
+    # 当前用户可能是认证缓存中共享的快照，修改前从数据库读取
+    student = db.query(Student).filter(Student.id == current_user.id).first()
+    student.password_hash = get_password_hash(new_password)
+    student.is_password_set = True
+    # 吊销其他设备上的刷新令牌，只保留发起修改的会话
+    revoke_refresh_tokens(db, datetime.now(), student_id=current_user.id, keep_family_id=decode_token(token).get("fid"))
     db.commit()
+    user_cache.invalidate(current_user.username)
     
     return {"message": "Password changed successfully"}
@@ -1,18 +1,55 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.orm import Session, aliased
+from typing import List, Optional, Union
 from datetime import date
 
 from app.database.database import get_db
 from app.models.todo import Todo
 from app.models.student import Student
 from app.schemas.todo import TodoCreate, TodoUpdate, TodoResponse
+from app.schemas.pagination import Page
 from app.routes.auth import get_current_user, get_current_admin
+from app.utils.events import event_broker
+from app.utils.pagination import paginate, MAX_PAGE_SIZE
+from app.utils.responses import rows_response
 
 router = APIRouter()
 
+# 列表接口按 TodoResponse 的字段选择列，直接编码查询结果
+Assignee = aliased(Student)
+Creator = aliased(Student)
+TODO_RESPONSE_COLUMNS = (
+    Todo.id,
+    Todo.title,
+    Todo.content,
+    Todo.due_date,
+    Todo.priority,
+    Todo.status,
+    Todo.assigned_to,
+    Todo.created_by,
+    Todo.is_completed,
+    Assignee.name.label("assignee_name"),
+    Creator.name.label("creator_name")
+)
+
+def _todo_to_response(todo: Todo) -> TodoResponse:
+    # 字段均来自数据库，类型已确定，直接构造响应以跳过逐字段校验
+    return TodoResponse.model_construct(
+        id=todo.id,
+        title=todo.title,
+        content=todo.content,
+        due_date=todo.due_date,
+        priority=todo.priority,
+        status=todo.status,
+        assigned_to=todo.assigned_to,
+        created_by=todo.created_by,
+        is_completed=todo.is_completed,
+        assignee_name=todo.assignee.name if todo.assignee else None,
+        creator_name=todo.creator.name if todo.creator else None
+    )
+
 @router.post("/", response_model=TodoResponse)
-async def create_todo(
+def create_todo(
     todo_data: TodoCreate,
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
@@ -38,17 +75,25 @@ async def create_todo(
     if new_todo.assignee:
         response.assignee_name = new_todo.assignee.name
     response.creator_name = current_user.name
+    # 待办事项只推送给被分配人和创建人
+    event_broker.publish("todo.created", response.model_dump(mode="json"), audience=[new_todo.assigned_to, new_todo.created_by])
     return response
 
-@router.get("/", response_model=List[TodoResponse])
-async def get_todos(
+@router.get("/", response_model=Union[List[TodoResponse], Page[TodoResponse]])
+def get_todos(
     status: Optional[str] = Query(None, description="Filter by status"),
     priority: Optional[str] = Query(None, description="Filter by priority"),
     assigned_to: Optional[int] = Query(None, description="Filter by assigned student"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
 ):
-    query = db.query(Todo)
+    query = (
+        db.query(*TODO_RESPONSE_COLUMNS)
+        .outerjoin(Assignee, Todo.assigned_to == Assignee.id)
+        .outerjoin(Creator, Todo.created_by == Creator.id)
+    )
     # 普通用户只能看到分配给自己的或自己创建的
     if not current_user.is_admin:
         query = query.filter(
@@ -61,20 +106,13 @@ async def get_todos(
         query = query.filter(Todo.priority == priority)
     if assigned_to:
         query = query.filter(Todo.assigned_to == assigned_to)
-    todos = query.all()
-    # 构建响应
-    response = []
-    for todo in todos:
-        todo_response = TodoResponse.model_validate(todo)
-        if todo.assignee:
-            todo_response.assignee_name = todo.assignee.name
-        if todo.creator:
-            todo_response.creator_name = todo.creator.name
-        response.append(todo_response)
-    return response
+    if limit is not None or cursor is not None:
+        rows, next_cursor = paginate(query, [Todo.id], limit, cursor)
+        return rows_response(rows, paginated=True, next_cursor=next_cursor)
+    return rows_response(query.all())
 
 @router.get("/{todo_id}", response_model=TodoResponse)
-async def get_todo(
+def get_todo(
     todo_id: int,
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
@@ -92,15 +130,10 @@ async def get_todo(
             detail="Not enough permissions"
         )
     # 构建响应
-    response = TodoResponse.model_validate(todo)
-    if todo.assignee:
-        response.assignee_name = todo.assignee.name
-    if todo.creator:
-        response.creator_name = todo.creator.name
-    return response
+    return _todo_to_response(todo)
 
 @router.put("/{todo_id}", response_model=TodoResponse)
-async def update_todo(
+def update_todo(
     todo_id: int,
     todo_data: TodoUpdate,
     db: Session = Depends(get_db),
@@ -126,7 +159,8 @@ async def update_todo(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Assigned student not found"
             )
-    # 更新待办事项
+    # 更新待办事项，原被分配人也需收到变更
+    previous_assignee = todo.assigned_to
     update_data = todo_data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(todo, field, value)
@@ -138,15 +172,15 @@ async def update_todo(
     db.commit()
     db.refresh(todo)
     # 构建响应
-    response = TodoResponse.model_validate(todo)
-    if todo.assignee:
-        response.assignee_name = todo.assignee.name
-    if todo.creator:
-        response.creator_name = todo.creator.name
+    response = _todo_to_response(todo)
+    event_broker.publish(
+        "todo.updated", response.model_dump(mode="json"),
+        audience=[previous_assignee, todo.assigned_to, todo.created_by]
+    )
     return response
 
 @router.delete("/{todo_id}")
-async def delete_todo(
+def delete_todo(
     todo_id: int,
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
@@ -163,12 +197,14 @@ async def delete_todo(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
+    audience = [todo.assigned_to, todo.created_by]
     db.delete(todo)
     db.commit()
+    event_broker.publish("todo.deleted", {"id": todo_id}, audience=audience)
     return {"message": "Todo deleted successfully"}
 
 @router.post("/{todo_id}/complete")
-async def complete_todo(
+def complete_todo(
     todo_id: int,
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
@@ -189,4 +225,8 @@ async def complete_todo(
     todo.status = "completed"
     todo.is_completed = True
     db.commit()
+    event_broker.publish(
+        "todo.completed", {"id": todo_id, "status": todo.status, "is_completed": True},
+        audience=[todo.assigned_to, todo.created_by]
+    )
     return {"message": "Todo marked as completed"}
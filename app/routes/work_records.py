@@ -1,18 +1,46 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Union
 from datetime import date
 
 from app.database.database import get_db
 from app.models.work_record import WorkRecord
 from app.models.student import Student
 from app.schemas.work_record import WorkRecordCreate, WorkRecordUpdate, WorkRecordResponse, WorkRecordHandover
+from app.schemas.pagination import Page
 from app.routes.auth import get_current_user, get_current_admin
+from app.utils.export import export_response, iter_query_rows
+from app.utils.events import event_broker
+from app.utils.pagination import paginate, MAX_PAGE_SIZE
+from app.utils.responses import rows_response
 
 router = APIRouter()
 
+# 列表接口按 WorkRecordResponse 的字段选择列，直接编码查询结果
+WORK_RECORD_RESPONSE_COLUMNS = (
+    WorkRecord.id,
+    WorkRecord.date,
+    WorkRecord.time_slot,
+    WorkRecord.student_id,
+    WorkRecord.content,
+    WorkRecord.handover_notes,
+    WorkRecord.status,
+    Student.name.label("student_name")
+)
+
+def _filter_work_records(query, start_date, end_date, student_id, record_status):
+    if start_date:
+        query = query.filter(WorkRecord.date >= start_date)
+    if end_date:
+        query = query.filter(WorkRecord.date <= end_date)
+    if student_id:
+        query = query.filter(WorkRecord.student_id == student_id)
+    if record_status:
+        query = query.filter(WorkRecord.status == record_status)
+    return query
+
 @router.post("/", response_model=WorkRecordResponse)
-async def create_work_record(
+def create_work_record(
     record_data: WorkRecordCreate,
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
@@ -38,39 +66,56 @@ async def create_work_record(
     # 添加学生姓名
     response = WorkRecordResponse.model_validate(new_record)
     response.student_name = student.name
+    event_broker.publish("work_record.created", response.model_dump(mode="json"))
     return response
 
-@router.get("/", response_model=List[WorkRecordResponse])
-async def get_work_records(
+@router.get("/", response_model=Union[List[WorkRecordResponse], Page[WorkRecordResponse]])
+def get_work_records(
     start_date: Optional[date] = Query(None, description="Start date for filtering"),
     end_date: Optional[date] = Query(None, description="End date for filtering"),
     student_id: Optional[int] = Query(None, description="Filter by student ID"),
     status: Optional[str] = Query(None, description="Filter by status"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; enables cursor pagination"),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
 ):
-    query = db.query(WorkRecord)
-    if start_date:
-        query = query.filter(WorkRecord.date >= start_date)
-    if end_date:
-        query = query.filter(WorkRecord.date <= end_date)
-    if student_id:
-        query = query.filter(WorkRecord.student_id == student_id)
-    if status:
-        query = query.filter(WorkRecord.status == status)
-    records = query.all()
-    # 添加学生姓名
-    response = []
-    for record in records:
-        record_response = WorkRecordResponse.model_validate(record)
-        student = db.query(Student).filter(Student.id == record.student_id).first()
-        if student:
-            record_response.student_name = student.name
-        response.append(record_response)
-    return response
+    query = db.query(*WORK_RECORD_RESPONSE_COLUMNS).outerjoin(Student, WorkRecord.student_id == Student.id)
+    query = _filter_work_records(query, start_date, end_date, student_id, status)
+    if limit is not None or cursor is not None:
+        rows, next_cursor = paginate(query, [WorkRecord.date, WorkRecord.id], limit, cursor)
+        return rows_response(rows, paginated=True, next_cursor=next_cursor)
+    return rows_response(query.all())
+
+@router.get("/export")
+def export_work_records(
+    start_date: Optional[date] = Query(None, description="Start date for filtering"),
+    end_date: Optional[date] = Query(None, description="End date for filtering"),
+    student_id: Optional[int] = Query(None, description="Filter by student ID"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    export_format: str = Query("csv", alias="format", pattern="^(csv|xlsx)$", description="csv or xlsx"),
+    current_user: Student = Depends(get_current_user)
+):
+    def build_query(db: Session):
+        query = db.query(
+            WorkRecord.date,
+            WorkRecord.time_slot,
+            Student.name,
+            WorkRecord.content,
+            WorkRecord.handover_notes,
+            WorkRecord.status
+        ).outerjoin(Student, Student.id == WorkRecord.student_id)
+        query = _filter_work_records(query, start_date, end_date, student_id, status)
+        return query.order_by(WorkRecord.date, WorkRecord.id)
+
+    return export_response(
+        "工作记录", export_format, "工作记录",
+        ["日期", "时段", "学生", "工作内容", "交接事项", "状态"],
+        iter_query_rows(build_query)
+    )
 
 @router.get("/{record_id}", response_model=WorkRecordResponse)
-async def get_work_record(
+def get_work_record(
     record_id: int,
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
@@ -89,7 +134,7 @@ async def get_work_record(
     return response
 
 @router.put("/{record_id}", response_model=WorkRecordResponse)
-async def update_work_record(
+def update_work_record(
     record_id: int,
     record_data: WorkRecordUpdate,
     db: Session = Depends(get_db),
@@ -118,10 +163,11 @@ async def update_work_record(
     student = db.query(Student).filter(Student.id == record.student_id).first()
     if student:
         response.student_name = student.name
+    event_broker.publish("work_record.updated", response.model_dump(mode="json"))
     return response
 
 @router.delete("/{record_id}")
-async def delete_work_record(
+def delete_work_record(
     record_id: int,
     db: Session = Depends(get_db),
     current_user: Student = Depends(get_current_user)
@@ -140,4 +186,5 @@ async def delete_work_record(
         )
     db.delete(record)
     db.commit()
+    event_broker.publish("work_record.deleted", {"id": record_id})
     return {"message": "Work record deleted successfully"}
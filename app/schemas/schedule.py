@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import date
 from typing import Optional, List
 
@@ -28,3 +28,44 @@ class ScheduleResponse(ScheduleBase):
 class CalendarView(BaseModel):
     date: date
     schedules: List[ScheduleResponse]
+
+class ScheduleBulkCreate(BaseModel):
+    schedules: List[ScheduleCreate]
+
+class ScheduleBulkResult(BaseModel):
+    index: int
+    success: bool
+    id: Optional[int] = None
+    detail: Optional[str] = None
+
+class ScheduleBulkResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[ScheduleBulkResult]
+
+class ScheduleConflict(BaseModel):
+    date: date
+    student_id: int
+    student_name: Optional[str] = None
+    schedule_ids: List[int]
+    time_slots: List[str]
+
+class ScheduleGenerateRequest(BaseModel):
+    start_date: date
+    end_date: date
+    time_slots: List[str] = Field(..., min_length=1)
+    locations: List[str] = []
+    student_ids: Optional[List[int]] = None  # 为空时使用全部非管理员学生
+    weekdays: List[int] = Field(default=[0, 1, 2, 3, 4, 5, 6], description="0=周一 ... 6=周日")
+    blackout_dates: List[date] = []
+    students_per_slot: int = Field(default=1, ge=1)
+    max_shifts_per_day: int = Field(default=1, ge=1)
+    max_shifts_per_week: Optional[int] = Field(default=None, ge=1)
+    dry_run: bool = False
+
+class ScheduleGenerateResponse(BaseModel):
+    created: int
+    unfilled: int
+    min_shifts: int
+    max_shifts: int
+    schedules: List[ScheduleCreate]
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+import datetime
+from typing import Optional
+
+class SearchResult(BaseModel):
+    type: str  # work_record, todo, student
+    id: int
+    title: Optional[str] = None
+    snippet: Optional[str] = None
+    date: Optional[datetime.date] = None
+    score: float = 0
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import Optional
+
+class DutyStats(BaseModel):
+    student_id: int
+    student_name: Optional[str] = None
+    period: Optional[str] = None  # 按周为 ISO 周 2026-W10，按月为 2026-03，汇总时为空
+    shift_count: int = 0
+    completed_records: int = 0
+    pending_handovers: int = 0
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import Optional, List
 
 class StudentBase(BaseModel):
     name: str
@@ -38,3 +38,18 @@ class StudentResponse(StudentBase):
 
     class Config:
         from_attributes = True
+
+class StudentBulkCreate(BaseModel):
+    students: List[StudentCreate]
+
+class StudentBulkResult(BaseModel):
+    index: int
+    username: str
+    success: bool
+    id: Optional[int] = None
+    detail: Optional[str] = None
+
+class StudentSuggestion(BaseModel):
+    id: int
+    username: str
+    name: str
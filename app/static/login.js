@@ -0,0 +1,175 @@
+    document.addEventListener('DOMContentLoaded', function() {
+        const loginForm = document.getElementById('loginForm');
+        const errorMessage = document.getElementById('errorMessage');
+        const successMessage = document.getElementById('successMessage');
+        const loading = document.getElementById('loading');
+
+        loginForm.addEventListener('submit', function(e) {
+            e.preventDefault();
+
+            const username = document.getElementById('username').value;
+            const password = document.getElementById('password').value;
+
+            // 显示加载状态
+            loading.style.display = 'block';
+            errorMessage.style.display = 'none';
+            successMessage.style.display = 'none';
+
+            // 发送登录请求
+            fetch('/auth/login', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/x-www-form-urlencoded'
+                },
+                body: new URLSearchParams({
+                    'username': username,
+                    'password': password
+                })
+            })
+            .then(response => {
+                loading.style.display = 'none';
+
+                if (!response.ok) {
+                    throw new Error('登录失败，请检查用户名和密码');
+                }
+                return response.json();
+            })
+            .then(data => {
+                // 登录成功，存储token
+                localStorage.setItem('access_token', data.access_token);
+                localStorage.setItem('token_type', data.token_type);
+                localStorage.setItem('refresh_token', data.refresh_token);
+
+                // 检查是否需要强制更改密码
+                if (data.require_password_change) {
+                    // 显示密码更改表单
+                    successMessage.textContent = '请设置新密码';
+                    successMessage.style.display = 'block';
+
+                    setTimeout(() => {
+                        showPasswordChangeForm();
+                    }, 500);
+                } else {
+                    // 显示成功消息
+                    successMessage.textContent = '登录成功，正在跳转...';
+                    successMessage.style.display = 'block';
+
+                    // 跳转到管理界面
+                    setTimeout(() => {
+                        window.location.href = '/static/admin/index.html';
+                    }, 1000);
+                }
+            })
+            .catch(error => {
+                // 显示错误消息
+                errorMessage.textContent = error.message;
+                errorMessage.style.display = 'block';
+            });
+        });
+});
+
+function showPasswordChangeForm() {
+    // 创建密码更改表单
+    const dialog = document.createElement('div');
+    dialog.style.cssText = `
+        position: fixed;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 100%;
+        background-color: rgba(0, 0, 0, 0.5);
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        z-index: 1000;
+    `;
+
+    const dialogContent = document.createElement('div');
+    dialogContent.style.cssText = `
+        background-color: white;
+        padding: 20px;
+        border-radius: 8px;
+        width: 400px;
+        max-width: 90%;
+    `;
+
+    dialogContent.innerHTML = `
+        <h3 style="margin-bottom: 15px;">设置新密码</h3>
+        <p style="margin-bottom: 15px; color: #666;">请设置您的新密码</p>
+        <div class="form-group">
+            <label for="newPassword">新密码</label>
+            <input type="password" id="newPassword" required placeholder="请输入新密码" style="width: 100%;">
+        </div>
+        <div class="form-group">
+            <label for="confirmPassword">确认密码</label>
+            <input type="password" id="confirmPassword" required placeholder="请确认新密码" style="width: 100%;">
+        </div>
+        <div class="error-message" id="passwordError" style="display: none;"></div>
+        <div style="margin-top: 20px; display: flex; gap: 10px; justify-content: flex-end;">
+            <button type="button" class="btn btn-secondary" id="cancelPasswordChange">取消</button>
+            <button type="button" class="btn btn-primary" id="confirmPasswordChange">确认</button>
+        </div>
+    `;
+
+    dialog.appendChild(dialogContent);
+    document.body.appendChild(dialog);
+
+    const cancelBtn = dialogContent.querySelector('#cancelPasswordChange');
+    const confirmBtn = dialogContent.querySelector('#confirmPasswordChange');
+    const newPasswordInput = document.getElementById('newPassword');
+    const confirmPasswordInput = document.getElementById('confirmPassword');
+    const passwordError = document.getElementById('passwordError');
+
+    cancelBtn.addEventListener('click', function() {
+        document.body.removeChild(dialog);
+        // 取消后退出登录
+        logoutSession();
+    });
+
+    confirmBtn.addEventListener('click', function() {
+        const newPassword = newPasswordInput.value.trim();
+        const confirmPassword = confirmPasswordInput.value.trim();
+
+        if (!newPassword) {
+            passwordError.textContent = '新密码不能为空';
+            passwordError.style.display = 'block';
+            return;
+        }
+
+        if (newPassword !== confirmPassword) {
+            passwordError.textContent = '两次输入的密码不一致';
+            passwordError.style.display = 'block';
+            return;
+        }
+
+        // 发送密码更改请求
+        fetch('/students/change-password', {
+            method: 'POST',
+            headers: {
+                'Authorization': `Bearer ${localStorage.getItem('access_token')}`,
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ new_password: newPassword })
+        })
+        .then(response => {
+            if (!response.ok) {
+                throw new Error('密码更改失败');
+            }
+            return response.json();
+        })
+        .then(data => {
+            console.log('密码更改成功');
+            document.body.removeChild(dialog);
+
+            // 跳转到管理界面
+            setTimeout(() => {
+                window.location.href = '/static/admin/index.html';
+            }, 1000);
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            passwordError.textContent = '密码更改失败: ' + error.message;
+            passwordError.style.display = 'block';
+        });
+    });
+}
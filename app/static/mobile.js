@@ -0,0 +1,463 @@
+// 页面加载完成后执行
+document.addEventListener('DOMContentLoaded', function() {
+    // 检查登录状态
+    checkLoginStatus();
+    if (localStorage.getItem('access_token')) {
+        startLiveUpdates();
+    }
+
+    // 登录表单提交事件
+    const loginForm = document.getElementById('loginForm');
+    if (loginForm) {
+        loginForm.addEventListener('submit', function(e) {
+            e.preventDefault();
+            handleLogin();
+        });
+    }
+
+    // 退出登录按钮点击事件
+    const logoutBtn = document.querySelector('.logout-btn');
+    if (logoutBtn) {
+        logoutBtn.addEventListener('click', function() {
+            handleLogout();
+        });
+    }
+
+    // 模拟功能按钮点击
+    document.querySelectorAll('.function-btn').forEach(btn => {
+        btn.addEventListener('click', function() {
+            alert(this.textContent);
+        });
+    });
+});
+
+// 显示页面
+function showPage(pageId) {
+    // 隐藏所有页面
+    document.querySelectorAll('.page').forEach(page => {
+        page.classList.remove('active');
+    });
+
+    // 显示选中的页面
+    document.getElementById(pageId).classList.add('active');
+
+    // 更新导航栏状态
+    document.querySelectorAll('.nav-item').forEach(item => {
+        item.classList.remove('active');
+    });
+
+    // 设置当前导航项为激活状态
+    const navItems = document.querySelectorAll('.nav-item');
+    if (pageId === 'homePage') {
+        navItems[0].classList.add('active');
+    } else if (pageId === 'contactsPage') {
+        navItems[1].classList.add('active');
+    } else if (pageId === 'profilePage') {
+        navItems[2].classList.add('active');
+    }
+}
+
+// 检查登录状态
+function checkLoginStatus() {
+    const accessToken = localStorage.getItem('access_token');
+    if (accessToken) {
+        // 已登录，跳转到首页
+        showPage('homePage');
+    } else {
+        // 未登录，显示登录页面
+        showPage('loginPage');
+    }
+}
+
+// 处理登录
+function handleLogin() {
+    const username = document.getElementById('username').value;
+    const password = document.getElementById('password').value;
+    const errorMessage = document.getElementById('errorMessage');
+    const successMessage = document.getElementById('successMessage');
+    const loading = document.getElementById('loading');
+
+    // 显示加载状态
+    loading.style.display = 'block';
+    errorMessage.style.display = 'none';
+    successMessage.style.display = 'none';
+
+    // 发送登录请求
+    fetch('/auth/login', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/x-www-form-urlencoded'
+        },
+        body: new URLSearchParams({
+            'username': username,
+            'password': password
+        })
+    })
+    .then(response => {
+        loading.style.display = 'none';
+
+        if (!response.ok) {
+            throw new Error('登录失败，请检查用户名和密码');
+        }
+        return response.json();
+    })
+    .then(data => {
+        // 登录成功，存储token
+        localStorage.setItem('access_token', data.access_token);
+        localStorage.setItem('token_type', data.token_type);
+        localStorage.setItem('refresh_token', data.refresh_token);
+
+        // 检查是否需要强制更改密码
+        if (data.require_password_change) {
+            // 显示密码更改表单
+            successMessage.textContent = '请设置新密码';
+            successMessage.style.display = 'block';
+
+            setTimeout(() => {
+                showPasswordChangeForm();
+            }, 500);
+        } else {
+            // 显示成功消息
+            successMessage.textContent = '登录成功，正在跳转...';
+            successMessage.style.display = 'block';
+
+            // 跳转到首页
+            setTimeout(() => {
+                showPage('homePage');
+            }, 1000);
+        }
+        startLiveUpdates();
+    })
+    .catch(error => {
+        // 显示错误消息
+        errorMessage.textContent = error.message;
+        errorMessage.style.display = 'block';
+    });
+}
+
+// 显示密码更改表单
+function showPasswordChangeForm() {
+    // 创建密码更改表单
+    const dialog = document.createElement('div');
+    dialog.style.cssText = `
+        position: fixed;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 100%;
+        background-color: rgba(0, 0, 0, 0.5);
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        z-index: 1000;
+    `;
+
+    const dialogContent = document.createElement('div');
+    dialogContent.style.cssText = `
+        background-color: white;
+        padding: 20px;
+        border-radius: 8px;
+        width: 90%;
+        max-width: 400px;
+    `;
+
+    dialogContent.innerHTML = `
+        <h3 style="margin-bottom: 15px;">设置新密码</h3>
+        <p style="margin-bottom: 15px; color: #666;">请设置您的新密码</p>
+        <div class="form-group">
+            <label for="newPassword">新密码</label>
+            <input type="password" id="newPassword" required placeholder="请输入新密码" style="width: 100%;">
+        </div>
+        <div class="form-group">
+            <label for="confirmPassword">确认密码</label>
+            <input type="password" id="confirmPassword" required placeholder="请确认新密码" style="width: 100%;">
+        </div>
+        <div class="error-message" id="passwordError" style="display: none;"></div>
+        <div style="margin-top: 20px; display: flex; gap: 10px; justify-content: flex-end;">
+            <button type="button" class="btn btn-secondary" id="cancelPasswordChange">取消</button>
+            <button type="button" class="btn btn-primary" id="confirmPasswordChange">确认</button>
+        </div>
+    `;
+
+    dialog.appendChild(dialogContent);
+    document.body.appendChild(dialog);
+
+    const cancelBtn = dialogContent.querySelector('#cancelPasswordChange');
+    const confirmBtn = dialogContent.querySelector('#confirmPasswordChange');
+    const newPasswordInput = document.getElementById('newPassword');
+    const confirmPasswordInput = document.getElementById('confirmPassword');
+    const passwordError = document.getElementById('passwordError');
+
+    cancelBtn.addEventListener('click', function() {
+        document.body.removeChild(dialog);
+        // 取消后退出登录
+        stopLiveUpdates();
+        logoutSession();
+        showPage('loginPage');
+    });
+
+    confirmBtn.addEventListener('click', function() {
+        const newPassword = newPasswordInput.value.trim();
+        const confirmPassword = confirmPasswordInput.value.trim();
+
+        if (!newPassword) {
+            passwordError.textContent = '新密码不能为空';
+            passwordError.style.display = 'block';
+            return;
+        }
+
+        if (newPassword !== confirmPassword) {
+            passwordError.textContent = '两次输入的密码不一致';
+            passwordError.style.display = 'block';
+            return;
+        }
+
+        // 发送密码更改请求
+        fetch('/students/change-password', {
+            method: 'POST',
+            headers: {
+                'Authorization': `Bearer ${localStorage.getItem('access_token')}`,
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ new_password: newPassword })
+        })
+        .then(response => {
+            if (!response.ok) {
+                throw new Error('密码更改失败');
+            }
+            return response.json();
+        })
+        .then(data => {
+            console.log('密码更改成功');
+            document.body.removeChild(dialog);
+
+            // 跳转到首页
+            setTimeout(() => {
+                showPage('homePage');
+            }, 1000);
+        })
+        .catch(error => {
+            console.error('Error:', error);
+            passwordError.textContent = '密码更改失败: ' + error.message;
+            passwordError.style.display = 'block';
+        });
+    });
+}
+
+// 处理退出登录
+function handleLogout() {
+    if (confirm('确定要退出登录吗？')) {
+        // 吊销刷新令牌并清除本地存储的token
+        stopLiveUpdates();
+        logoutSession();
+
+        // 跳转到登录页面
+        showPage('loginPage');
+    }
+}
+
+// 首页的今日值班和我的待办：登录后加载一次，之后按实时推送的事件就地更新
+let todaySchedules = [];
+let myTodos = [];
+let eventSource = null;
+let liveSession = 0;
+const EVENTS_RECONNECT_DELAY = 3000;
+
+function todayString() {
+    const now = new Date();
+    const month = String(now.getMonth() + 1).padStart(2, '0');
+    const day = String(now.getDate()).padStart(2, '0');
+    return `${now.getFullYear()}-${month}-${day}`;
+}
+
+function fetchJson(url) {
+    return fetch(url, {
+        headers: {'Authorization': `Bearer ${localStorage.getItem('access_token')}`}
+    }).then(response => {
+        if (!response.ok) {
+            throw new Error(response.statusText);
+        }
+        return response.json();
+    });
+}
+
+function loadTodaySchedules() {
+    const today = todayString();
+    fetchJson(`/schedules/?start_date=${today}&end_date=${today}`)
+        .then(schedules => {
+            todaySchedules = schedules;
+            renderTodaySchedules();
+        })
+        .catch(error => console.error('获取今日值班失败:', error));
+}
+
+function loadMyTodos() {
+    fetchJson('/todos/')
+        .then(todos => {
+            myTodos = todos.filter(todo => todo.status !== 'completed');
+            renderMyTodos();
+        })
+        .catch(error => console.error('获取待办事项失败:', error));
+}
+
+function renderTodaySchedules() {
+    todaySchedules.sort((a, b) => a.time_slot.localeCompare(b.time_slot));
+    renderHomeList('todaySchedules', todaySchedules, schedule => [
+        schedule.student_name || '未知', `时段：${schedule.time_slot}`
+    ], '今日无值班安排');
+}
+
+function renderMyTodos() {
+    renderHomeList('myTodos', myTodos, todo => [
+        todo.title, `截止：${todo.due_date || '无'}`
+    ], '暂无待办事项');
+}
+
+// 用 textContent 填充，避免内容中的 HTML 被解析
+function renderHomeList(containerId, items, describe, emptyText) {
+    const container = document.getElementById(containerId);
+    if (!container) return;
+    container.innerHTML = '';
+    if (items.length === 0) {
+        const empty = document.createElement('div');
+        empty.className = 'home-empty';
+        empty.textContent = emptyText;
+        container.appendChild(empty);
+        return;
+    }
+    items.forEach(item => {
+        const [title, info] = describe(item);
+        const row = document.createElement('div');
+        row.className = 'contact-item';
+        const name = document.createElement('div');
+        name.className = 'contact-name';
+        name.textContent = title;
+        const detail = document.createElement('div');
+        detail.className = 'contact-info';
+        detail.textContent = info;
+        row.appendChild(name);
+        row.appendChild(detail);
+        container.appendChild(row);
+    });
+}
+
+// 按 id 更新本地列表：keep 为 false 时移除，否则替换已有项或追加到末尾
+function applyDelta(list, item, keep) {
+    const index = list.findIndex(existing => existing.id === item.id);
+    if (!keep) {
+        if (index !== -1) {
+            list.splice(index, 1);
+        }
+        return;
+    }
+    if (index === -1) {
+        list.push(item);
+    } else {
+        list[index] = item;
+    }
+}
+
+const homeEventHandlers = {
+    'schedule.created': schedule => {
+        applyDelta(todaySchedules, schedule, schedule.date === todayString());
+        renderTodaySchedules();
+    },
+    'schedule.updated': schedule => {
+        applyDelta(todaySchedules, schedule, schedule.date === todayString());
+        renderTodaySchedules();
+    },
+    'schedule.deleted': schedule => {
+        applyDelta(todaySchedules, schedule, false);
+        renderTodaySchedules();
+    },
+    // 批量变更只带日期范围，覆盖今天时重新拉取
+    'schedules.changed': range => {
+        const today = todayString();
+        if (range.start_date <= today && today <= range.end_date) {
+            loadTodaySchedules();
+        }
+    },
+    'todo.created': todo => {
+        applyDelta(myTodos, todo, todo.status !== 'completed');
+        renderMyTodos();
+    },
+    'todo.updated': todo => {
+        applyDelta(myTodos, todo, todo.status !== 'completed');
+        renderMyTodos();
+    },
+    'todo.deleted': todo => {
+        applyDelta(myTodos, todo, false);
+        renderMyTodos();
+    },
+    'todo.completed': todo => {
+        applyDelta(myTodos, todo, false);
+        renderMyTodos();
+    }
+};
+
+// EventSource 无法发送 Authorization 头：先用访问令牌换取一次性票据再连接。
+// 票据只能使用一次，连接断开后浏览器自动重连会得到 401，此时重新换取票据并重新同步；
+// 换取失败（刷新令牌也已失效）时不再重连
+function connectEvents(session, resync) {
+    fetch('/events/ticket', {
+        method: 'POST',
+        headers: {'Authorization': `Bearer ${localStorage.getItem('access_token')}`}
+    })
+    .then(response => response.ok ? response.json() : null)
+    .then(data => {
+        if (!data || session !== liveSession) {
+            return;
+        }
+        openEventStream(session, data.ticket);
+        if (resync) {
+            loadTodaySchedules();
+            loadMyTodos();
+        }
+    })
+    .catch(() => reconnectEvents(session));
+}
+
+function reconnectEvents(session) {
+    setTimeout(() => {
+        if (session === liveSession) {
+            connectEvents(session, true);
+        }
+    }, EVENTS_RECONNECT_DELAY);
+}
+
+function openEventStream(session, ticket) {
+    const source = new EventSource(`/events/stream?ticket=${encodeURIComponent(ticket)}`);
+    eventSource = source;
+    Object.keys(homeEventHandlers).forEach(eventType => {
+        source.addEventListener(eventType, event => homeEventHandlers[eventType](JSON.parse(event.data)));
+    });
+    source.addEventListener('resync', () => {
+        loadTodaySchedules();
+        loadMyTodos();
+    });
+    source.addEventListener('error', () => {
+        if (source.readyState !== EventSource.CLOSED || eventSource !== source) {
+            return;
+        }
+        eventSource = null;
+        reconnectEvents(session);
+    });
+}
+
+function startLiveUpdates() {
+    stopLiveUpdates();
+    loadTodaySchedules();
+    loadMyTodos();
+    if (window.EventSource) {
+        connectEvents(liveSession, false);
+    }
+}
+
+function stopLiveUpdates() {
+    // 使尚未完成的票据请求和重连失效
+    liveSession += 1;
+    if (eventSource) {
+        eventSource.close();
+        eventSource = null;
+    }
+}
@@ -0,0 +1,106 @@
+// 访问令牌有效期较短，请求返回 401 时用刷新令牌换取新令牌并重试一次
+(function() {
+    const originalFetch = window.fetch.bind(window);
+    let refreshing = null;
+
+    // 同一标签页内的并发请求共用同一次刷新；刷新失败时清除本地令牌，返回 null。
+    // 多个标签页共用 localStorage 中的令牌，已轮换的刷新令牌再次使用会被服务端视为泄露并吊销整个会话，
+    // 因此用 Web Locks 串行化各标签页的刷新，拿到锁后若令牌已被其他标签页换新则直接使用。
+    // staleToken 为被拒绝的访问令牌
+    function refreshAccessToken(staleToken) {
+        if (!refreshing) {
+            refreshing = withRefreshLock(() => refreshOnce(staleToken))
+                .catch(() => null)
+                .finally(() => {
+                    refreshing = null;
+                });
+        }
+        return refreshing;
+    }
+
+    function withRefreshLock(callback) {
+        if (navigator.locks) {
+            return navigator.locks.request('zhiban-token-refresh', callback);
+        }
+        return callback();
+    }
+
+    function refreshOnce(staleToken) {
+        const accessToken = localStorage.getItem('access_token');
+        if (staleToken && accessToken && accessToken !== staleToken) {
+            return Promise.resolve(accessToken);
+        }
+        const refreshToken = localStorage.getItem('refresh_token');
+        if (!refreshToken) {
+            return Promise.resolve(null);
+        }
+        return originalFetch('/auth/refresh', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({refresh_token: refreshToken})
+        })
+        .then(response => response.ok ? response.json() : null)
+        .then(data => {
+            if (!data) {
+                // 其他标签页已写入新令牌时保留，避免误删后所有标签页一起退出登录
+                if (localStorage.getItem('refresh_token') !== refreshToken) {
+                    return localStorage.getItem('access_token');
+                }
+                localStorage.removeItem('access_token');
+                localStorage.removeItem('refresh_token');
+                return null;
+            }
+            localStorage.setItem('access_token', data.access_token);
+            localStorage.setItem('token_type', data.token_type);
+            localStorage.setItem('refresh_token', data.refresh_token);
+            return data.access_token;
+        });
+    }
+
+    function authorizationOf(init) {
+        if (!init || !init.headers) {
+            return null;
+        }
+        if (init.headers instanceof Headers) {
+            return init.headers.get('Authorization');
+        }
+        return init.headers['Authorization'] || init.headers['authorization'] || null;
+    }
+
+    window.fetch = function(input, init) {
+        return originalFetch(input, init).then(response => {
+            // 只处理带令牌的请求；请求体为流时无法重发
+            if (response.status !== 401 || !authorizationOf(init) || (init.body && init.body instanceof ReadableStream)) {
+                return response;
+            }
+            const staleToken = authorizationOf(init).replace(/^Bearer\s+/i, '');
+            return refreshAccessToken(staleToken).then(accessToken => {
+                if (!accessToken) {
+                    return response;
+                }
+                const headers = new Headers(init.headers);
+                headers.set('Authorization', `Bearer ${accessToken}`);
+                return originalFetch(input, Object.assign({}, init, {headers: headers}));
+            });
+        });
+    };
+
+    // 退出登录：吊销刷新令牌并清除本地令牌
+    function logout() {
+        const refreshToken = localStorage.getItem('refresh_token');
+        localStorage.removeItem('access_token');
+        localStorage.removeItem('token_type');
+        localStorage.removeItem('refresh_token');
+        if (refreshToken) {
+            originalFetch('/auth/logout', {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify({refresh_token: refreshToken}),
+                keepalive: true
+            }).catch(() => {});
+        }
+    }
+
+    window.refreshAccessToken = refreshAccessToken;
+    window.logoutSession = logout;
+})();
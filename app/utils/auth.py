@@ -1,16 +1,33 @@
+import hashlib
+import multiprocessing
+import secrets
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from app.config import settings
+from app.utils.cache import TTLCache
+
 # 密钥，实际部署时应使用环境变量
 SECRET_KEY = "your-secret-key-here"
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
+REFRESH_TOKEN_EXPIRE_DAYS = settings.refresh_token_expire_days
 
 pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 
+# 登录校验和批量导入时用于计算密码哈希的进程池，首次使用时创建，应用关闭时回收
+_hash_executor: Optional[ProcessPoolExecutor] = None
+_hash_executor_lock = threading.Lock()
+
+# 已验证令牌的解码结果缓存，键为原始令牌，条目保留到令牌过期
+token_cache = TTLCache(maxsize=settings.token_cache_maxsize, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
@@ -19,6 +36,25 @@ def get_password_hash(password: str) -> str:
     password = password[:72]
     return pwd_context.hash(password)
 
+def get_hash_executor() -> ProcessPoolExecutor:
+    global _hash_executor
+    with _hash_executor_lock:
+        if _hash_executor is None:
+            # fork 会复制其他线程持有的锁，子进程可能死锁，使用 spawn/forkserver 启动
+            _hash_executor = ProcessPoolExecutor(
+                max_workers=settings.hash_workers,
+                mp_context=multiprocessing.get_context(settings.hash_start_method)
+            )
+        return _hash_executor
+
+def shutdown_hash_executor():
+    """关闭进程池并等待子进程退出，之后再次使用时重新创建"""
+    global _hash_executor
+    with _hash_executor_lock:
+        executor, _hash_executor = _hash_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -29,9 +65,24 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
+def generate_refresh_token() -> str:
+    return secrets.token_urlsafe(32)
+
+def hash_refresh_token(token: str) -> str:
+    # 刷新令牌本身是高熵随机串，用快速哈希保存即可，无需 pbkdf2
+    return hashlib.sha256(token.encode()).hexdigest()
+
 def decode_token(token: str):
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except JWTError:
         return None
+    exp = payload.get("exp")
+    if exp is not None:
+        remaining = exp - time.time()
+        if remaining > 0:
+            token_cache.set(token, payload, ttl=remaining)
+    return payload
@@ -0,0 +1,117 @@
+import bisect
+import re
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_TIME_SLOT_PATTERN = re.compile(r"^\s*(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})\s*$")
+
+def parse_time_slot(time_slot: str) -> Optional[Tuple[int, int]]:
+    """把 "08:10-09:35" 形式的时段解析为以分钟计的 [开始, 结束)，无法解析时返回 None"""
+    match = _TIME_SLOT_PATTERN.match(time_slot or "")
+    if not match:
+        return None
+    start_hour, start_minute, end_hour, end_minute = map(int, match.groups())
+    start = start_hour * 60 + start_minute
+    end = end_hour * 60 + end_minute
+    if end <= start:
+        return None
+    return start, end
+
+def slots_overlap(first: str, second: str) -> bool:
+    if first == second:
+        return True
+    first_range = parse_time_slot(first)
+    second_range = parse_time_slot(second)
+    if first_range is None or second_range is None:
+        return False
+    return first_range[0] < second_range[1] and second_range[0] < first_range[1]
+
+class ScheduleIntervalIndex:
+    """按 (学生, 日期) 保存已占用时段的区间索引，用于检测重复或时间重叠的排班"""
+
+    def __init__(self):
+        # (学生ID, 日期) -> 按开始时间排序的 [(开始, 结束, 时段, 排班ID)]
+        self._intervals: Dict[Tuple[int, date], List[tuple]] = defaultdict(list)
+        # 无法解析为时间区间的时段只按名称判断是否重复
+        self._named: Dict[Tuple[int, date, str], Optional[int]] = {}
+
+    def find_conflict(self, student_id: int, day: date, time_slot: str, exclude_id: Optional[int] = None):
+        """返回与该时段冲突的 (时段, 排班ID)，没有冲突时返回 None"""
+        parsed = parse_time_slot(time_slot)
+        if parsed is None:
+            key = (student_id, day, time_slot)
+            if key in self._named and (exclude_id is None or self._named[key] != exclude_id):
+                return time_slot, self._named[key]
+            return None
+        start, end = parsed
+        intervals = self._intervals.get((student_id, day), [])
+        # 区间按开始时间排序，只需检查开始时间早于本时段结束的条目
+        upper = bisect.bisect_left(intervals, (end,))
+        for other_start, other_end, other_slot, other_id in reversed(intervals[:upper]):
+            if other_end > start and (exclude_id is None or other_id != exclude_id):
+                return other_slot, other_id
+        return None
+
+    def add(self, student_id: int, day: date, time_slot: str, schedule_id: Optional[int] = None):
+        parsed = parse_time_slot(time_slot)
+        if parsed is None:
+            self._named[(student_id, day, time_slot)] = schedule_id
+            return
+        bisect.insort(self._intervals[(student_id, day)], (parsed[0], parsed[1], time_slot, schedule_id or 0))
+
+    def remove(self, student_id: int, day: date, time_slot: str):
+        parsed = parse_time_slot(time_slot)
+        if parsed is None:
+            self._named.pop((student_id, day, time_slot), None)
+            return
+        intervals = self._intervals.get((student_id, day), [])
+        for index, interval in enumerate(intervals):
+            if interval[2] == time_slot:
+                del intervals[index]
+                return
+
+def find_conflict_groups(rows: Iterable[tuple]) -> List[List[tuple]]:
+    """单次扫描找出冲突排班
+
+    rows 为按 (学生ID, 日期) 排序的 (排班ID, 学生ID, 日期, 时段, ...) 元组，
+    同一学生同一天内按开始时间做扫描线，时间相互重叠的排班归为一组。
+    """
+    groups = []
+
+    def flush(day_rows: List[tuple]):
+        named = defaultdict(list)
+        timed = []
+        for row in day_rows:
+            parsed = parse_time_slot(row[3])
+            if parsed is None:
+                named[row[3]].append(row)
+            else:
+                timed.append((parsed[0], parsed[1], row))
+        groups.extend(group for group in named.values() if len(group) > 1)
+        timed.sort(key=lambda item: (item[0], item[1]))
+        cluster = []
+        cluster_end = -1
+        for start, end, row in timed:
+            if cluster and start < cluster_end:
+                cluster.append(row)
+                cluster_end = max(cluster_end, end)
+                continue
+            if len(cluster) > 1:
+                groups.append(cluster)
+            cluster = [row]
+            cluster_end = end
+        if len(cluster) > 1:
+            groups.append(cluster)
+
+    current_key = None
+    day_rows: List[tuple] = []
+    for row in rows:
+        key = (row[1], row[2])
+        if key != current_key:
+            flush(day_rows)
+            current_key = key
+            day_rows = []
+        day_rows.append(row)
+    flush(day_rows)
+    return groups
@@ -0,0 +1,14 @@
+from sqlalchemy.orm import Session
+
+from app.models.data_version import DataVersion
+
+# 学生检索索引的版本范围，由迁移 0010 中的触发器在学号、姓名变化或增删学生时递增
+STUDENTS_SCOPE = "students"
+
+def calendar_scope(year: int, month: int) -> str:
+    """月历的版本范围，与迁移 0008 中触发器写入的 'calendar:YYYY-MM' 一致"""
+    return f"calendar:{year:04d}-{month:02d}"
+
+def get_data_version(db: Session, scope: str) -> int:
+    """读取版本号，该范围尚未发生过变更时为 0"""
+    return db.query(DataVersion.version).filter(DataVersion.scope == scope).scalar() or 0
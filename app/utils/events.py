@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+
+from app.config import settings
+from app.database.database import SessionLocal
+from app.models.event_log import EventLog
+
+logger = logging.getLogger(__name__)
+
+# (事件ID, 事件类型, 数据, 接收人ID集合；None 表示所有用户)
+Event = Tuple[int, str, Dict[str, Any], Optional[frozenset]]
+
+class Subscription:
+    """一个 SSE 连接的订阅，事件从轮询线程投递到该连接所在的事件循环"""
+
+    def __init__(self, student_id: int, is_admin: bool, maxsize: int):
+        self.student_id = student_id
+        self.is_admin = is_admin
+        self.queue: "asyncio.Queue[Event]" = asyncio.Queue(maxsize=maxsize)
+        self.loop = asyncio.get_running_loop()
+        # 队列积压溢出后丢弃后续事件，由客户端重新拉取完整列表
+        self.overflowed = False
+
+    def accepts(self, audience: Optional[frozenset]) -> bool:
+        return audience is None or self.is_admin or self.student_id in audience
+
+    def _offer(self, event: Event):
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+class EventBroker:
+    """基于数据库事件日志的发布/订阅
+
+    路由在提交事务后调用 publish，事件写入 event_log 表；每个进程的后台线程每隔 poll_interval 秒
+    读取新行，按接收人过滤后推送给本进程内的订阅连接，多进程部署时任一进程产生的事件都能送达。
+    SQLite 写事务串行执行，自增ID按提交顺序分配，轮询时不会漏掉较小的ID。
+    表中只保留最近 backlog 条，客户端断线重连时按 Last-Event-ID 从表中补发。
+    """
+
+    def __init__(self, backlog: int = 256, queue_size: int = 100, poll_interval: float = 0.5, batch_size: int = 500):
+        self.backlog = backlog
+        self.queue_size = queue_size
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self._subscriptions: Set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._last_id: Optional[int] = None
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, student_id: int, is_admin: bool) -> Subscription:
+        """在事件循环中调用；先订阅再补发，补发与推送重复的事件由调用方按事件ID跳过"""
+        subscription = Subscription(student_id, is_admin, self.queue_size)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def replay(self, subscription: Subscription, last_event_id: int) -> Optional[List[Event]]:
+        """在线程池中调用；返回需要补发的事件，缺失的事件已被清理或ID无效时返回 None 表示需重新同步"""
+        db = SessionLocal()
+        try:
+            oldest, latest = db.query(func.min(EventLog.id), func.max(EventLog.id)).one()
+            if oldest is None or last_event_id < oldest - 1 or last_event_id > latest:
+                return None
+            rows = (
+                db.query(EventLog.id, EventLog.type, EventLog.data, EventLog.audience)
+                .filter(EventLog.id > last_event_id)
+                .order_by(EventLog.id)
+                .all()
+            )
+        finally:
+            db.close()
+        return [event for event in map(_to_event, rows) if subscription.accepts(event[3])]
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, event_type: str, data: Dict[str, Any], audience: Optional[Iterable[Optional[int]]] = None):
+        """可在任意线程调用；audience 为接收人学生ID，管理员总能收到事件"""
+        if audience is not None:
+            audience = sorted({student_id for student_id in audience if student_id is not None})
+        db = SessionLocal()
+        try:
+            row = EventLog(type=event_type, data=data, audience=audience)
+            db.add(row)
+            db.flush()
+            db.query(EventLog).filter(EventLog.id <= row.id - self.backlog).delete(synchronize_session=False)
+            db.commit()
+        except Exception:
+            # 数据变更已提交，推送失败时不影响接口结果，客户端下次同步时拿到最新数据
+            db.rollback()
+            logger.exception("Failed to publish event %s", event_type)
+            return
+        finally:
+            db.close()
+        # 本进程的订阅不必等到下次轮询
+        self._wakeup.set()
+
+    def poll(self) -> int:
+        """读取上次轮询之后的事件并分发给本进程的订阅，返回读取的事件数"""
+        with self._poll_lock:
+            db = SessionLocal()
+            try:
+                if self._last_id is None:
+                    # 首次轮询只记录当前位置，之前的事件由客户端按 Last-Event-ID 补发
+                    self._last_id = db.query(func.max(EventLog.id)).scalar() or 0
+                    return 0
+                rows = (
+                    db.query(EventLog.id, EventLog.type, EventLog.data, EventLog.audience)
+                    .filter(EventLog.id > self._last_id)
+                    .order_by(EventLog.id)
+                    .limit(self.batch_size)
+                    .all()
+                )
+            finally:
+                db.close()
+            if rows:
+                self._last_id = rows[-1].id
+        for event in map(_to_event, rows):
+            self._dispatch(event)
+        return len(rows)
+
+    def _dispatch(self, event: Event):
+        with self._lock:
+            subscriptions = [item for item in self._subscriptions if item.accepts(event[3])]
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._offer, event)
+            except RuntimeError:
+                # 事件循环已关闭
+                self.unsubscribe(subscription)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._last_id = None
+        self.poll()
+        self._thread = threading.Thread(target=self._run, name="event-poller", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            try:
+                # 积压超过一批时连续读取
+                while self.poll() == self.batch_size:
+                    pass
+            except Exception:
+                logger.exception("Failed to poll event log")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"subscribers": len(self._subscriptions), "last_event_id": self._last_id}
+
+def _to_event(row) -> Event:
+    audience = frozenset(row.audience) if row.audience is not None else None
+    return (row.id, row.type, row.data, audience)
+
+event_broker = EventBroker(
+    backlog=settings.events_backlog,
+    queue_size=settings.events_queue_size,
+    poll_interval=settings.events_poll_interval
+)
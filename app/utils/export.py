@@ -0,0 +1,91 @@
+import csv
+import io
+import tempfile
+from typing import Callable, Iterable, Iterator, List
+from urllib.parse import quote
+
+from fastapi.responses import StreamingResponse
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from sqlalchemy.orm import Query, Session
+
+from app.database.database import SessionLocal
+
+EXPORT_BATCH_SIZE = 1000
+CHUNK_SIZE = 64 * 1024
+
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+# 以这些字符开头的文本在 Excel 中会被当作公式执行（CSV 注入），导出时加单引号前缀
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+def iter_query_rows(build_query: Callable[[Session], Query]) -> Iterator[tuple]:
+    # 流式响应在请求结束后才迭代，因此使用独立会话，并按批次从游标读取
+    db = SessionLocal()
+    try:
+        for row in build_query(db).yield_per(EXPORT_BATCH_SIZE):
+            yield tuple(row)
+    finally:
+        db.close()
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+def _xlsx_value(worksheet, value):
+    # openpyxl 会把以 "=" 开头的字符串写成公式，显式指定为文本单元格
+    if isinstance(value, str) and value.startswith("="):
+        cell = WriteOnlyCell(worksheet, value)
+        cell.data_type = "s"
+        return cell
+    return value
+
+def _stream_csv(headers: List[str], rows: Iterable[tuple]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # 带 BOM 以便 Excel 正确识别中文
+    buffer.write("\ufeff")
+    writer.writerow(headers)
+    for count, row in enumerate(rows, 1):
+        writer.writerow([_csv_value(value) for value in row])
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+def _stream_xlsx(sheet_title: str, headers: List[str], rows: Iterable[tuple]) -> Iterator[bytes]:
+    # 只写模式下行数据写入临时文件，内存占用与行数无关
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(sheet_title)
+    worksheet.append(headers)
+    for row in rows:
+        worksheet.append([_xlsx_value(worksheet, value) for value in row])
+    with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as output:
+        workbook.save(output)
+        output.seek(0)
+        while True:
+            chunk = output.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+def export_response(filename: str, export_format: str, sheet_title: str,
+                    headers: List[str], rows: Iterable[tuple]) -> StreamingResponse:
+    if export_format == "xlsx":
+        content = _stream_xlsx(sheet_title, headers, rows)
+    else:
+        content = _stream_csv(headers, rows)
+    return StreamingResponse(
+        content,
+        media_type=CONTENT_TYPES[export_format],
+        headers={
+            "Content-Disposition": f"attachment; filename*=UTF-8''{quote(f'{filename}.{export_format}')}"
+        }
+    )
@@ -0,0 +1,94 @@
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import case, update
+
+from app.config import settings
+from app.database.database import SessionLocal
+from app.models.student import Student
+
+logger = logging.getLogger(__name__)
+
+class LoginRecorder:
+    """登录状态（is_active、last_login）的写后缓冲
+
+    登录接口只把 (学生ID, 登录时间) 记入内存，由后台线程每隔 interval 秒、
+    或积压达到 max_pending 条时，在一个事务中用一条 UPDATE 写入数据库，
+    避免大量学生同时登录时每次登录都单独提交、争抢 SQLite 写锁。
+    同一学生在两次写入之间多次登录只保留最后一次时间；服务停止时写入剩余记录。
+    """
+
+    def __init__(self, interval: float = 2, max_pending: int = 200):
+        self.interval = interval
+        self.max_pending = max_pending
+        self._pending: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, student_id: int, login_time: datetime):
+        with self._lock:
+            self._pending[student_id] = login_time
+            pending_count = len(self._pending)
+        if pending_count >= self.max_pending:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """写入缓冲中的记录，返回写入的学生数"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        db = SessionLocal()
+        try:
+            db.execute(
+                update(Student)
+                .where(Student.id.in_(list(pending)))
+                .values(is_active=True, last_login=case(pending, value=Student.id))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            # 写入失败时放回缓冲等待下次重试，期间的新登录记录优先
+            with self._lock:
+                for student_id, login_time in pending.items():
+                    self._pending.setdefault(student_id, login_time)
+            raise
+        finally:
+            db.close()
+        return len(pending)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="login-recorder", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        self._thread.join()
+        self._thread = None
+        self.flush()
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to write buffered login records")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"pending": len(self._pending)}
+
+login_recorder = LoginRecorder(interval=settings.login_flush_interval, max_pending=settings.login_flush_max_pending)
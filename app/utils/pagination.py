@@ -0,0 +1,45 @@
+import base64
+import json
+from datetime import date
+from typing import List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(values: list) -> str:
+    data = [value.isoformat() if isinstance(value, date) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+def decode_cursor(cursor: str, columns: list) -> list:
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(data, list) or len(data) != len(columns):
+            raise ValueError(cursor)
+        values = []
+        for column, value in zip(columns, data):
+            python_type = column.type.python_type
+            if python_type is date:
+                values.append(date.fromisoformat(value))
+            else:
+                values.append(python_type(value))
+        return values
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+def paginate(query, columns: list, limit: Optional[int], cursor: Optional[str]):
+    # 基于键集（keyset）分页：按 columns 排序，从游标之后开始取，避免 OFFSET 扫描
+    limit = limit or DEFAULT_PAGE_SIZE
+    if cursor:
+        query = query.filter(tuple_(*columns) > tuple(decode_cursor(cursor, columns)))
+    rows: List = query.order_by(*columns).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([getattr(rows[-1], column.key) for column in columns])
+    return rows, next_cursor
@@ -0,0 +1,23 @@
+from typing import Any, Iterable, Optional
+
+import orjson
+from fastapi.responses import Response
+
+class FastJSONResponse(Response):
+    """使用 orjson 编码的 JSON 响应，日期、时间等类型由 orjson 直接编码"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+def rows_response(rows: Iterable, paginated: bool = False, next_cursor: Optional[str] = None) -> FastJSONResponse:
+    """把查询得到的行直接编码为响应
+
+    查询需按响应模型的字段名选择列（必要时使用 label），行数据类型已由数据库列确定，
+    直接返回 Response 可跳过逐行构造 Pydantic 模型以及 response_model 对整个列表的再次校验。
+    """
+    items = [row._asdict() for row in rows]
+    if paginated:
+        return FastJSONResponse({"items": items, "next_cursor": next_cursor})
+    return FastJSONResponse(items)
@@ -0,0 +1,129 @@
+import heapq
+import random
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.utils.conflicts import ScheduleIntervalIndex
+
+# (日期, 时段, 地点, 学生ID)
+Assignment = Tuple[date, str, Optional[str], int]
+
+def generate_roster(
+    student_ids: Sequence[int],
+    days: Sequence[date],
+    time_slots: Sequence[str],
+    locations: Sequence[Optional[str]] = (None,),
+    students_per_slot: int = 1,
+    max_shifts_per_day: int = 1,
+    max_shifts_per_week: Optional[int] = None,
+    existing: Iterable[Tuple[int, date, str]] = (),
+    seed: Optional[int] = None,
+) -> Tuple[List[Assignment], int, Dict[int, int]]:
+    """贪心分配 + 修复的排班算法
+
+    按时间顺序为每个岗位挑选当前值班次数最少、且最久未值班的可用学生，
+    再把值班最多学生的班次转给值班最少的学生，直到次数差不超过 1 或无法再调整。
+    existing 中的 (学生ID, 日期, 时段) 计入负载并占用对应时段，
+    同一学生同一天内时间重叠的时段不会同时分配。
+    返回 (分配结果, 未能排满的岗位数, 每名学生的值班次数)。
+    """
+    rng = random.Random(seed)
+    loads = {student_id: 0 for student_id in student_ids}
+    day_counts = defaultdict(int)
+    week_counts = defaultdict(int)
+    booked = ScheduleIntervalIndex()
+
+    def week_of(day: date):
+        return day.isocalendar()[:2]
+
+    def can_take(student_id: int, day: date, time_slot: str) -> bool:
+        if booked.find_conflict(student_id, day, time_slot) is not None:
+            return False
+        if day_counts[student_id, day] >= max_shifts_per_day:
+            return False
+        if max_shifts_per_week is not None and week_counts[student_id, week_of(day)] >= max_shifts_per_week:
+            return False
+        return True
+
+    def book(student_id: int, day: date, time_slot: str, delta: int):
+        loads[student_id] += delta
+        day_counts[student_id, day] += delta
+        week_counts[student_id, week_of(day)] += delta
+        if delta > 0:
+            booked.add(student_id, day, time_slot)
+        else:
+            booked.remove(student_id, day, time_slot)
+
+    for student_id, day, time_slot in existing:
+        if student_id in loads:
+            book(student_id, day, time_slot, 1)
+
+    # 堆元素为 (值班次数, 上次值班日序号, 随机序, 学生ID)，过期元素在弹出时丢弃
+    order = list(loads)
+    rng.shuffle(order)
+    tiebreak = {student_id: index for index, student_id in enumerate(order)}
+    last_day = {student_id: -1 for student_id in loads}
+    heap = [(loads[student_id], -1, tiebreak[student_id], student_id) for student_id in order]
+    heapq.heapify(heap)
+
+    assignments: List[Assignment] = []
+    unfilled = 0
+    for day in sorted(days):
+        for time_slot in time_slots:
+            for location in locations:
+                for _ in range(students_per_slot):
+                    skipped = []
+                    chosen = None
+                    while heap:
+                        entry = heapq.heappop(heap)
+                        student_id = entry[3]
+                        if entry[0] != loads[student_id] or entry[1] != last_day[student_id]:
+                            continue
+                        if can_take(student_id, day, time_slot):
+                            chosen = student_id
+                            break
+                        skipped.append(entry)
+                    for entry in skipped:
+                        heapq.heappush(heap, entry)
+                    if chosen is None:
+                        unfilled += 1
+                        continue
+                    book(chosen, day, time_slot, 1)
+                    last_day[chosen] = day.toordinal()
+                    heapq.heappush(heap, (loads[chosen], last_day[chosen], tiebreak[chosen], chosen))
+                    assignments.append((day, time_slot, location, chosen))
+
+    _repair(assignments, loads, can_take, book)
+    return assignments, unfilled, loads
+
+def _repair(assignments: List[Assignment], loads: Dict[int, int], can_take, book):
+    if len(loads) < 2:
+        return
+    by_student = defaultdict(list)
+    for index, assignment in enumerate(assignments):
+        by_student[assignment[3]].append(index)
+    # 每次移动都会让次数差严格变小，移动次数不超过班次数
+    for _ in range(len(assignments)):
+        ranked = sorted(loads, key=loads.get)
+        moved = False
+        for high in reversed(ranked):
+            for low in ranked:
+                if loads[high] - loads[low] <= 1:
+                    break
+                for position, index in enumerate(by_student[high]):
+                    day, time_slot, location, _ = assignments[index]
+                    if can_take(low, day, time_slot):
+                        book(high, day, time_slot, -1)
+                        book(low, day, time_slot, 1)
+                        assignments[index] = (day, time_slot, location, low)
+                        by_student[high].pop(position)
+                        by_student[low].append(index)
+                        moved = True
+                        break
+                if moved:
+                    break
+            if moved or loads[high] - loads[ranked[0]] <= 1:
+                break
+        if not moved:
+            return
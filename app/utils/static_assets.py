@@ -0,0 +1,145 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from typing import Dict, Optional, Set, Tuple
+
+import brotli
+from starlette.responses import PlainTextResponse, Response
+
+# HTML 中引用本地 CSS/JS 的属性，启动时改写为带内容哈希的文件名
+_ASSET_REFERENCE = re.compile(r'(?P<attr>(?:href|src)=")(?P<url>/static/[^"?#]+\.(?:css|js))"')
+_COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+# 协商时的优先顺序
+_ENCODINGS = ("br", "gzip")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+class _Asset:
+    def __init__(self, media_type: str, cache_control: str, variants: Dict[str, Tuple[bytes, str]]):
+        self.media_type = media_type
+        self.cache_control = cache_control
+        # 编码 -> (内容, 强 ETag)，identity 为未压缩内容
+        self.variants = variants
+
+def _accepted_encodings(header: str) -> Set[str]:
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0
+        if quality > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+class StaticAssets:
+    """预压缩的静态文件服务（ASGI 应用，挂载在 url_prefix 下）
+
+    启动时读取目录中的全部文件：CSS/JS 等资源额外以 "name.<哈希>.ext" 提供并长期缓存，
+    HTML 中对它们的引用改写为带哈希的地址；文本类文件预先生成 gzip 和 brotli 版本，
+    按 Accept-Encoding 协商返回，并带每种编码各自的强 ETag。
+    HTML 与不带哈希的地址每次向服务端验证 ETag，修改静态文件后需重启服务（或 SIGHUP）。
+    """
+
+    def __init__(self, directory: str, url_prefix: str = "/static", minimum_size: int = 256):
+        self.directory = directory
+        self.url_prefix = url_prefix
+        self.minimum_size = minimum_size
+        self._assets: Dict[str, _Asset] = {}
+        self._build()
+
+    def _build(self):
+        html_files = []
+        hashed_urls = {}
+        for root, dirs, files in os.walk(self.directory):
+            dirs[:] = sorted(name for name in dirs if not name.startswith("."))
+            for name in sorted(files):
+                if name.startswith("."):
+                    continue
+                full_path = os.path.join(root, name)
+                path = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+                if name.endswith(".html"):
+                    html_files.append((path, full_path))
+                    continue
+                with open(full_path, "rb") as file:
+                    content = file.read()
+                digest = hashlib.sha256(content).hexdigest()[:12]
+                stem, extension = os.path.splitext(path)
+                hashed_path = f"{stem}.{digest}{extension}"
+                self._add(path, content, REVALIDATE_CACHE_CONTROL)
+                self._add(hashed_path, content, IMMUTABLE_CACHE_CONTROL)
+                hashed_urls[f"{self.url_prefix}/{path}"] = f"{self.url_prefix}/{hashed_path}"
+        for path, full_path in html_files:
+            with open(full_path, "r", encoding="utf-8") as file:
+                html = file.read()
+            html = _ASSET_REFERENCE.sub(
+                lambda match: f'{match.group("attr")}{hashed_urls.get(match.group("url"), match.group("url"))}"',
+                html
+            )
+            self._add(path, html.encode("utf-8"), REVALIDATE_CACHE_CONTROL)
+
+    def _add(self, path: str, content: bytes, cache_control: str):
+        media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        if media_type.startswith("text/") or media_type == "application/javascript":
+            media_type += "; charset=utf-8"
+        digest = hashlib.sha256(content).hexdigest()[:16]
+        variants = {"identity": (content, f'"{digest}"')}
+        if len(content) >= self.minimum_size and media_type.startswith(_COMPRESSIBLE_TYPES):
+            compressed = {
+                "br": brotli.compress(content, quality=11),
+                "gzip": gzip.compress(content, compresslevel=9, mtime=0)
+            }
+            for encoding, body in compressed.items():
+                # 只保留确实变小的压缩版本
+                if len(body) < len(content):
+                    variants[encoding] = (body, f'"{digest}-{encoding}"')
+        self._assets[path] = _Asset(media_type, cache_control, variants)
+
+    def lookup(self, path: str, accept_encoding: str = "") -> Optional[Tuple[_Asset, str]]:
+        """返回资源及协商得到的编码，资源不存在时返回 None"""
+        asset = self._assets.get(path.lstrip("/"))
+        if asset is None:
+            return None
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding in _ENCODINGS:
+            if encoding in asset.variants and (encoding in accepted or "*" in accepted):
+                return asset, encoding
+        return asset, "identity"
+
+    async def __call__(self, scope, receive, send):
+        assert scope["type"] == "http"
+        if scope["method"] not in ("GET", "HEAD"):
+            response = PlainTextResponse("Method Not Allowed", status_code=405, headers={"Allow": "GET, HEAD"})
+            await response(scope, receive, send)
+            return
+        path = scope["path"][len(scope.get("root_path", "")):]
+        headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        found = self.lookup(path, headers.get("accept-encoding", ""))
+        if found is None:
+            await PlainTextResponse("Not Found", status_code=404)(scope, receive, send)
+            return
+        asset, encoding = found
+        body, etag = asset.variants[encoding]
+        response_headers = {"ETag": etag, "Cache-Control": asset.cache_control}
+        if len(asset.variants) > 1:
+            response_headers["Vary"] = "Accept-Encoding"
+        if_none_match = headers.get("if-none-match")
+        if if_none_match and (if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]):
+            await Response(status_code=304, headers=response_headers)(scope, receive, send)
+            return
+        if encoding != "identity":
+            response_headers["Content-Encoding"] = encoding
+        response = Response(
+            b"" if scope["method"] == "HEAD" else body,
+            media_type=asset.media_type,
+            headers=response_headers
+        )
+        if scope["method"] == "HEAD":
+            response.headers["Content-Length"] = str(len(body))
+        await response(scope, receive, send)
@@ -0,0 +1,94 @@
+import bisect
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from pypinyin import Style, lazy_pinyin
+
+def search_keys(username: str, name: str) -> Set[str]:
+    """生成学生的检索键：学号、姓名、全拼和拼音首字母
+
+    姓名及其拼音按字/音节生成全部后缀，前缀查找即可覆盖原先姓名的包含匹配，
+    例如 "张三丰" 可由 "三丰"、"sanfeng"、"sf" 查到。
+    """
+    keys = {username.lower()}
+    name = (name or "").strip().lower()
+    if not name:
+        return keys
+    syllables = lazy_pinyin(name, errors="default")
+    initials = lazy_pinyin(name, style=Style.FIRST_LETTER, errors="default")
+    for start in range(len(name)):
+        keys.add(name[start:])
+    for start in range(len(syllables)):
+        keys.add("".join(syllables[start:]))
+        keys.add("".join(initials[start:]))
+    keys.discard("")
+    return keys
+
+class StudentSearchIndex:
+    """学生检索的进程内前缀索引
+
+    检索键按字典序保存在有序列表中，前缀查询用二分定位后顺序扫描匹配区间。
+    索引记录加载时数据库中的学生版本号（data_versions 表），任一进程写入学生后
+    版本号递增，下次查询时重新同步。
+    """
+
+    def __init__(self):
+        self._entries: List[Tuple[str, int]] = []
+        # 学生ID -> (学号, 姓名, 检索键)，重新同步时姓名未变的学生复用已生成的检索键
+        self._students: Dict[int, Tuple[str, str, Set[str]]] = {}
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def is_stale(self, version: int) -> bool:
+        return self._version != version
+
+    def load(self, rows: Iterable[Tuple[int, str, str]], version: int):
+        """用 (学生ID, 学号, 姓名) 全量重建索引，version 为读取这些行之前的学生版本号"""
+        students = {}
+        for student_id, username, name in rows:
+            previous = self._students.get(student_id)
+            if previous is not None and previous[0] == username and previous[1] == name:
+                students[student_id] = previous
+            else:
+                students[student_id] = (username, name, search_keys(username, name))
+        entries = sorted(
+            (key, student_id) for student_id, (_, _, keys) in students.items() for key in keys
+        )
+        with self._lock:
+            self._students = students
+            self._entries = entries
+            self._version = version
+
+    def search(self, prefix: str, limit: Optional[int] = None) -> List[int]:
+        """返回检索键以 prefix 开头的学生ID，按匹配键的字典序、去重"""
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        found: Dict[int, None] = {}
+        with self._lock:
+            index = bisect.bisect_left(self._entries, (prefix,))
+            while index < len(self._entries):
+                key, student_id = self._entries[index]
+                if not key.startswith(prefix):
+                    break
+                found[student_id] = None
+                if limit is not None and len(found) >= limit:
+                    break
+                index += 1
+        return list(found)
+
+    def lookup(self, student_ids: Iterable[int]) -> List[Tuple[int, str, str]]:
+        """返回索引中保存的 (学生ID, 学号, 姓名)"""
+        with self._lock:
+            return [
+                (student_id, self._students[student_id][0], self._students[student_id][1])
+                for student_id in student_ids if student_id in self._students
+            ]
+
+    def clear(self):
+        with self._lock:
+            self._entries = []
+            self._students = {}
+            self._version = None
+
+student_index = StudentSearchIndex()
@@ -0,0 +1,202 @@
+"""并发负载测试：模拟多个客户端同时访问列表接口，统计延迟分位数
+
+用法：
+    python bench/load_test.py                      # 测试当前代码
+    python bench/load_test.py --compare 9ffb706 8d455fa    # 同时测试指定提交，输出对比
+    python bench/load_test.py --url http://127.0.0.1:8080 --username admin --password admin123
+
+未指定 --url 时在临时目录中初始化数据库、启动 uvicorn（单进程）并写入测试数据；
+--compare 通过 git worktree 逐个检出指定提交，用同样的方式启动并测试。
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+SEED_MONTH = date(2030, 3, 1)
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+@contextmanager
+def _checkout(ref):
+    """返回代码目录；ref 为 None 时使用当前工作区"""
+    if ref is None:
+        yield ROOT
+        return
+    directory = tempfile.mkdtemp(prefix="zhiban-bench-")
+    subprocess.run(["git", "worktree", "add", "--detach", directory, ref], cwd=ROOT, check=True, capture_output=True)
+    try:
+        yield Path(directory)
+    finally:
+        subprocess.run(["git", "worktree", "remove", "--force", directory], cwd=ROOT, capture_output=True)
+        shutil.rmtree(directory, ignore_errors=True)
+
+@contextmanager
+def _server(code_dir: Path):
+    """在 code_dir 中用全新数据库启动服务，返回服务地址"""
+    data_dir = tempfile.mkdtemp(prefix="zhiban-bench-db-")
+    env = dict(os.environ, ZHIBAN_DATABASE_URL=f"sqlite:///{data_dir}/bench.db", PYTHONPATH=str(code_dir))
+    # 早期版本的数据库地址固定为 ./zhiban.db，从空库开始
+    for name in ("zhiban.db", "zhiban.db-wal", "zhiban.db-shm"):
+        if code_dir != ROOT and (code_dir / name).exists():
+            (code_dir / name).unlink()
+    subprocess.run([sys.executable, "init_db.py"], cwd=code_dir, env=env, check=True, capture_output=True)
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=code_dir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(url + "/docs", timeout=1)
+                break
+            except httpx.HTTPError:
+                time.sleep(0.1)
+        yield url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+def _login(client: httpx.Client, username: str, password: str) -> dict:
+    response = client.post("/auth/login", data={"username": username, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+def seed(url: str, headers: dict, students: int, shifts: int):
+    """通过 API 写入测试数据，兼容各个版本"""
+    with httpx.Client(base_url=url, headers=headers, timeout=60) as client:
+        student_ids = []
+        for index in range(students):
+            response = client.post("/students/", json={
+                "name": f"压测学生{index}", "username": f"bench{index}", "password": "bench-password"
+            })
+            response.raise_for_status()
+            student_ids.append(response.json()["id"])
+        for index in range(shifts):
+            # 同一学生同一天的排班使用不同时段，避免触发冲突检测
+            student_id = student_ids[index // 28 % students]
+            day = (SEED_MONTH + timedelta(days=index % 28)).isoformat()
+            hour = 8 + index // (28 * students) % 12
+            slot = f"{hour:02d}:00-{hour + 1:02d}:00"
+            client.post("/schedules/", json={"date": day, "time_slot": slot, "student_id": student_id}).raise_for_status()
+            client.post("/work-records/", json={
+                "date": day, "time_slot": slot, "student_id": student_id, "content": f"巡查记录{index}"
+            }).raise_for_status()
+            if index % 4 == 0:
+                client.post("/todos/", json={"title": f"待办{index}", "assigned_to": student_id}).raise_for_status()
+
+def _paths():
+    end = SEED_MONTH + timedelta(days=27)
+    return [
+        f"/schedules/?start_date={SEED_MONTH}&end_date={end}",
+        f"/work-records/?start_date={SEED_MONTH}&end_date={end}",
+        "/todos/",
+        "/students/",
+        f"/schedules/calendar/{SEED_MONTH.year}/{SEED_MONTH.month}",
+    ]
+
+async def run_load(url: str, headers: dict, clients: int, requests_per_client: int, timeout: float = 30):
+    """clients 个客户端并发，各自按顺序循环请求列表接口；返回 (延迟列表, 失败数, 总耗时)"""
+    paths = _paths()
+    latencies = []
+    failures = 0
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(base_url=url, headers=headers, timeout=timeout, limits=limits) as client:
+        async def worker(offset: int):
+            nonlocal failures
+            for index in range(requests_per_client):
+                path = paths[(offset + index) % len(paths)]
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    # 超时同样计入延迟
+                    ok = False
+                latencies.append(time.perf_counter() - started)
+                if not ok:
+                    failures += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(offset) for offset in range(clients)))
+        elapsed = time.perf_counter() - started
+    return latencies, failures, elapsed
+
+def summarize(label: str, latencies, failures: int, elapsed: float) -> dict:
+    ordered = sorted(latencies)
+    quantiles = statistics.quantiles(ordered, n=100, method="inclusive")
+    return {
+        "label": label,
+        "requests": len(ordered),
+        "failures": failures,
+        "rps": len(ordered) / elapsed,
+        "p50": quantiles[49] * 1000,
+        "p95": quantiles[94] * 1000,
+        "p99": quantiles[98] * 1000,
+        "max": ordered[-1] * 1000,
+    }
+
+def print_table(results):
+    print(f"{'target':<16}{'requests':>10}{'failures':>10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for row in results:
+        print(
+            f"{row['label']:<16}{row['requests']:>10}{row['failures']:>10}{row['rps']:>10.1f}"
+            f"{row['p50']:>10.1f}{row['p95']:>10.1f}{row['p99']:>10.1f}{row['max']:>10.1f}"
+        )
+
+def benchmark(label: str, url: str, args, seed_data: bool) -> dict:
+    with httpx.Client(base_url=url, timeout=60) as client:
+        headers = _login(client, args.username, args.password)
+    if seed_data:
+        seed(url, headers, args.students, args.shifts)
+    # 预热
+    asyncio.run(run_load(url, headers, min(args.clients, 5), 2))
+    return summarize(label, *asyncio.run(run_load(url, headers, args.clients, args.requests)))
+
+def main():
+    parser = argparse.ArgumentParser(description="值班管理系统并发负载测试")
+    parser.add_argument("--url", help="测试已运行的服务，不启动新服务也不写入数据")
+    parser.add_argument("--compare", metavar="GIT_REF", nargs="+", default=[], help="同时测试指定提交作为对照")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=40, help="每个客户端的请求数")
+    parser.add_argument("--students", type=int, default=20)
+    parser.add_argument("--shifts", type=int, default=300)
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin123")
+    args = parser.parse_args()
+
+    results = []
+    if args.url:
+        results.append(benchmark(args.url, args.url, args, seed_data=False))
+    else:
+        targets = args.compare + [None]
+        for ref in targets:
+            with _checkout(ref) as code_dir, _server(code_dir) as url:
+                results.append(benchmark(ref or "current", url, args, seed_data=True))
+    print_table(results)
+
+if __name__ == "__main__":
+    main()
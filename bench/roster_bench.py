@@ -0,0 +1,88 @@
+"""排班算法基准：记录 generate_roster 的求解时间和公平性（值班次数极差）
+
+用法：
+    python bench/roster_bench.py
+    python bench/roster_bench.py --students 500 --weeks 20 --slots 5 --repeat 5
+    python bench/roster_bench.py --max-ms 1000    # 用作性能门禁：超时则以非零状态退出
+"""
+import argparse
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.utils.roster import generate_roster
+
+TIME_SLOTS = ["08:00-10:00", "10:00-12:00", "14:00-16:00", "16:00-18:00", "19:00-21:00", "21:00-23:00"]
+
+# (名称, 学生数, 周数, 每天时段数, 地点数, 每岗人数, 每天最多班次, 每周最多班次)
+SCENARIOS = [
+    ("small", 30, 4, 3, 1, 1, 1, None),
+    ("semester", 120, 20, 4, 2, 1, 1, 5),
+    ("target", 500, 20, 5, 1, 1, 1, None),
+    ("crowded", 500, 20, 5, 3, 2, 2, 6),
+]
+
+def run_scenario(students, weeks, slots, locations, per_slot, per_day, per_week, repeat, seed):
+    start = date(2030, 9, 2)
+    days = [start + timedelta(days=offset) for offset in range(weeks * 7)]
+    timings = []
+    for attempt in range(repeat):
+        started = time.perf_counter()
+        assignments, unfilled, loads = generate_roster(
+            list(range(1, students + 1)),
+            days,
+            TIME_SLOTS[:slots],
+            locations=[f"地点{index}" for index in range(locations)],
+            students_per_slot=per_slot,
+            max_shifts_per_day=per_day,
+            max_shifts_per_week=per_week,
+            seed=seed + attempt,
+        )
+        timings.append(time.perf_counter() - started)
+    return {
+        "shifts": len(assignments),
+        "unfilled": unfilled,
+        "spread": max(loads.values()) - min(loads.values()),
+        "median_ms": statistics.median(timings) * 1000,
+        "max_ms": max(timings) * 1000,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="排班算法基准")
+    parser.add_argument("--students", type=int, help="只运行一个自定义场景")
+    parser.add_argument("--weeks", type=int, default=20)
+    parser.add_argument("--slots", type=int, default=5)
+    parser.add_argument("--locations", type=int, default=1)
+    parser.add_argument("--per-slot", type=int, default=1)
+    parser.add_argument("--per-day", type=int, default=1)
+    parser.add_argument("--per-week", type=int)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-ms", type=float, help="任一场景的最长耗时超过该值时以非零状态退出")
+    args = parser.parse_args()
+
+    if args.students:
+        scenarios = [("custom", args.students, args.weeks, args.slots, args.locations,
+                      args.per_slot, args.per_day, args.per_week)]
+    else:
+        scenarios = SCENARIOS
+    print(f"{'scenario':<10}{'students':>9}{'days':>6}{'slots':>6}{'shifts':>8}{'unfilled':>9}{'spread':>8}{'median ms':>11}{'max ms':>9}")
+    over_budget = []
+    for name, students, weeks, slots, locations, per_slot, per_day, per_week in scenarios:
+        result = run_scenario(students, weeks, slots, locations, per_slot, per_day, per_week, args.repeat, args.seed)
+        print(
+            f"{name:<10}{students:>9}{weeks * 7:>6}{slots:>6}{result['shifts']:>8}{result['unfilled']:>9}"
+            f"{result['spread']:>8}{result['median_ms']:>11.1f}{result['max_ms']:>9.1f}"
+        )
+        if args.max_ms is not None and result["max_ms"] > args.max_ms:
+            over_budget.append(name)
+    if over_budget:
+        print(f"over {args.max_ms:g} ms: {', '.join(over_budget)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
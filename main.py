@@ -1,23 +1,42 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import RedirectResponse
 
-from app.routes import auth, students, schedules, work_records, todos
-from app.database.database import engine, Base
-from app.models import student, schedule, work_record, todo
+from app.routes import auth, students, schedules, work_records, todos, stats, search, events
+from app.config import settings
+from app.database import check_schema_version
+from app.utils.auth import shutdown_hash_executor
+from app.utils.events import event_broker
+from app.utils.login_recorder import login_recorder
+from app.utils.static_assets import StaticAssets
 
-# 创建数据库表
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 表结构由 Alembic 迁移维护（python init_db.py），启动时只校验版本
+    check_schema_version()
+    login_recorder.start()
+    event_broker.start()
+    yield
+    event_broker.stop()
+    # 停止前写入缓冲中的登录记录
+    login_recorder.stop()
+    shutdown_hash_executor()
 
 app = FastAPI(
     title="值班管理系统",
     description="值班管理系统后端API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# 配置静态文件服务
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+# 配置静态文件服务：启动时预压缩，CSS/JS 以带内容哈希的地址长期缓存
+app.mount("/static", StaticAssets(directory="app/static"), name="static")
+
+# 压缩较大的 API 响应；已压缩的静态文件和 SSE 流不会重复处理
+app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_minimum_size, compresslevel=settings.gzip_level)
 
 # 配置CORS
 app.add_middleware(
@@ -34,6 +53,9 @@ app.include_router(students, prefix="/students", tags=["学生管理"])
 app.include_router(schedules, prefix="/schedules", tags=["排班管理"])
 app.include_router(work_records, prefix="/work-records", tags=["工作记录"])
 app.include_router(todos, prefix="/todos", tags=["待办事项"])
+app.include_router(stats, prefix="/stats", tags=["数据统计"])
+app.include_router(search, prefix="/search", tags=["全文搜索"])
+app.include_router(events, prefix="/events", tags=["实时推送"])
 
 @app.get("/")
 def read_root():
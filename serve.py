@@ -0,0 +1,59 @@
+"""生产环境启动入口
+
+多个 worker 进程共享同一组监听端口（默认同时监听 8080 和 5638），不监视文件变化。
+参数见 app/config.py 中的 server_* 配置，也可用命令行覆盖：
+
+    python serve.py --workers 4 --port 8080 --port 5638
+
+worker 数默认为 CPU 核数。实时事件（SSE）写入 event_log 表，由每个 worker 轮询后推送给
+本进程的连接，因此连接到任一 worker 的客户端都能收到所有 worker 产生的事件。
+
+向主进程发送 SIGHUP 会逐个平滑重启 worker；worker 处理 server_max_requests 个请求后
+自动退出，由主进程拉起新的 worker。
+"""
+import argparse
+import os
+
+from uvicorn import Config
+from uvicorn.supervisors import Multiprocess
+
+from app.config import settings
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Start the duty system server")
+    parser.add_argument("--host", default=settings.server_host)
+    parser.add_argument("--port", type=int, action="append", dest="ports", help="Port to listen on; may be repeated")
+    parser.add_argument("--workers", type=int, default=settings.server_workers, help="Worker processes; defaults to the CPU count")
+    return parser.parse_args()
+
+def build_config(host: str, port: int, workers: int) -> Config:
+    return Config(
+        "main:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop=settings.server_loop,
+        http=settings.server_http,
+        timeout_keep_alive=settings.server_keep_alive,
+        backlog=settings.server_backlog,
+        limit_max_requests=settings.server_max_requests,
+        limit_max_requests_jitter=settings.server_max_requests_jitter,
+        timeout_graceful_shutdown=settings.server_graceful_timeout,
+        access_log=settings.server_access_log
+    )
+
+def main():
+    args = parse_args()
+    ports = args.ports or settings.server_ports
+    workers = args.workers or os.cpu_count() or 1
+    config = build_config(args.host, ports[0], workers)
+    # 主进程先绑定所有端口，worker 继承这些套接字，每个 worker 都同时服务所有端口
+    sockets = []
+    for port in ports:
+        config.port = port
+        sockets.append(config.bind_socket())
+    # 单个 worker 同样由主进程监管，达到 server_max_requests 退出后或收到 SIGHUP 时重新拉起
+    Multiprocess(config, sockets=sockets).run()
+
+if __name__ == "__main__":
+    main()
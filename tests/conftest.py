@@ -0,0 +1,75 @@
+import itertools
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+# 测试使用临时数据库，必须在导入 app 之前设置
+ROOT = Path(__file__).resolve().parents[1]
+os.environ["ZHIBAN_DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="zhiban-tests-"), "test.db")
+os.chdir(ROOT)
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database import init_db
+from app.database.database import SessionLocal, engine
+from app.models.student import Student
+
+_usernames = itertools.count(1)
+
+@pytest.fixture(scope="session")
+def client():
+    from init_db import create_default_admin
+    from main import app
+    init_db()
+    create_default_admin()
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    response = client.post("/auth/login", data={"username": "admin", "password": "admin123"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+@pytest.fixture
+def db(client):
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+def add_students(db, count: int, **values):
+    """直接插入学生（跳过密码哈希），返回学生ID列表"""
+    students = [
+        Student(name=f"测试学生{next(_usernames)}", username=f"t{next(_usernames)}", password_hash="-", **values)
+        for _ in range(count)
+    ]
+    db.add_all(students)
+    db.commit()
+    return [student.id for student in students]
+
+@contextmanager
+def capture_queries():
+    """记录代码块内执行的 (SQL 语句, 参数)"""
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield executed
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+@contextmanager
+def count_queries():
+    """统计代码块内执行的 SQL 语句"""
+    with capture_queries() as executed:
+        statements = []
+        yield statements
+    statements.extend(statement for statement, _ in executed)
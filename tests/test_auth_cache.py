@@ -0,0 +1,108 @@
+import pytest
+from sqlalchemy import text
+
+from app.config import settings
+from app.database.database import engine
+from app.utils.auth import get_password_hash
+from app.utils.login_recorder import login_recorder
+from conftest import count_queries
+
+@pytest.fixture
+def revalidate_every_hit(monkeypatch):
+    # 其他进程的修改在比对间隔之后才会被发现，测试中每次命中都比对
+    monkeypatch.setattr(settings, "auth_revalidate_interval", 0)
+
+def _external_update(statement: str, **params):
+    # 绕过路由直接写库，相当于另一个进程修改了学生
+    with engine.begin() as connection:
+        connection.execute(text(statement), params)
+
+def _login(client, username, password):
+    response = client.post("/auth/login", data={"username": username, "password": password})
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+def _create_student(client, admin_headers, username):
+    response = client.post("/students/", json={"name": "缓存测试", "username": username, "password": "pw"}, headers=admin_headers)
+    assert response.status_code == 200
+    return response.json()["id"]
+
+def test_admin_flag_change_from_another_process_is_seen(client, admin_headers, revalidate_every_hit):
+    student_id = _create_student(client, admin_headers, "cache-admin")
+    headers = _login(client, "cache-admin", "pw")
+    assert client.get("/stats/duty", headers=headers).status_code == 403
+
+    _external_update("UPDATE students SET is_admin = 1 WHERE id = :id", id=student_id)
+    assert client.get("/stats/duty", headers=headers).status_code == 200
+    # 命中缓存
+    assert client.get("/stats/duty", headers=headers).status_code == 200
+
+    _external_update("UPDATE students SET is_admin = 0 WHERE id = :id", id=student_id)
+    assert client.get("/stats/duty", headers=headers).status_code == 403
+
+def test_deleted_student_is_rejected(client, admin_headers, revalidate_every_hit):
+    student_id = _create_student(client, admin_headers, "cache-deleted")
+    headers = _login(client, "cache-deleted", "pw")
+    assert client.get(f"/students/{student_id}", headers=headers).status_code == 200
+
+    _external_update("DELETE FROM refresh_tokens WHERE student_id = :id", id=student_id)
+    _external_update("DELETE FROM students WHERE id = :id", id=student_id)
+    assert client.get(f"/students/{student_id}", headers=headers).status_code == 401
+
+def test_own_row_is_read_from_database(client, admin_headers):
+    student_id = _create_student(client, admin_headers, "cache-own-row")
+    headers = _login(client, "cache-own-row", "pw")
+    login_recorder.flush()
+    assert client.get(f"/students/{student_id}", headers=headers).json()["is_active"] is True
+
+    # 登录记录列不参与版本号，缓存快照中的值会过期
+    _external_update("UPDATE students SET is_active = 0 WHERE id = :id", id=student_id)
+    assert client.get(f"/students/{student_id}", headers=headers).json()["is_active"] is False
+    listed = client.get("/students/?search=cache-own-row", headers=headers).json()
+    assert listed[0]["is_active"] is False
+
+def test_password_change_from_another_process_is_seen(client, admin_headers, revalidate_every_hit):
+    _create_student(client, admin_headers, "cache-password")
+    headers = _login(client, "cache-password", "pw")
+    client.get("/students/?search=cache-password", headers=headers)
+
+    _external_update(
+        "UPDATE students SET password_hash = :hash, is_password_set = 1 WHERE username = 'cache-password'",
+        hash=get_password_hash("changed")
+    )
+    body = client.get("/students/?search=cache-password", headers=headers).json()
+    assert body[0]["is_password_set"] is True
+
+def _auth_queries(client, headers):
+    with count_queries() as statements:
+        assert client.get("/todos/", headers=headers).status_code == 200
+    return [statement for statement in statements if "FROM students" in statement and "todos" not in statement]
+
+def test_cache_hit_within_interval_skips_database(client, admin_headers, monkeypatch):
+    _create_student(client, admin_headers, "cache-hit")
+    headers = _login(client, "cache-hit", "pw")
+    client.get("/todos/", headers=headers)
+    assert _auth_queries(client, headers) == []
+
+    # 超过比对间隔后只读取版本号
+    monkeypatch.setattr(settings, "auth_revalidate_interval", 0)
+    statements = _auth_queries(client, headers)
+    assert len(statements) == 1 and "auth_version" in statements[0]
+
+def test_local_admin_change_applies_without_waiting(client, admin_headers):
+    student_id = _create_student(client, admin_headers, "cache-local-admin")
+    headers = _login(client, "cache-local-admin", "pw")
+    assert client.get("/stats/duty", headers=headers).status_code == 403
+
+    response = client.put(f"/students/{student_id}/admin", json={"is_admin": True}, headers=admin_headers)
+    assert response.status_code == 200
+    assert client.get("/stats/duty", headers=headers).status_code == 200
+
+def test_change_password_on_cache_hit_is_saved(client, admin_headers):
+    _create_student(client, admin_headers, "cache-change")
+    headers = _login(client, "cache-change", "pw")
+    client.get("/todos/", headers=headers)
+
+    response = client.post("/students/change-password", json={"new_password": "pw2"}, headers=headers)
+    assert response.status_code == 200
+    _login(client, "cache-change", "pw2")
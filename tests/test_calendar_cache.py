@@ -0,0 +1,63 @@
+from sqlalchemy import text
+
+from app.database.database import engine
+from conftest import add_students, count_queries
+
+URL = "/schedules/calendar/2032/5"
+
+def _external(statement: str, **params):
+    # 绕过路由直接写库，相当于另一个进程修改了排班
+    with engine.begin() as connection:
+        connection.execute(text(statement), params)
+
+def _calendar(client, headers, etag=None):
+    if etag:
+        headers = dict(headers, **{"If-None-Match": etag})
+    return client.get(URL, headers=headers)
+
+def _slots(response):
+    return [(item["location"], item["student_name"]) for day in response.json() for item in day["schedules"]]
+
+def test_calendar_cache_follows_database_changes(client, admin_headers, db):
+    student_id = add_students(db, 1)[0]
+    _external(
+        "INSERT INTO schedules (date, student_id, time_slot, location) VALUES ('2032-05-03', :id, '上午', '一楼')",
+        id=student_id
+    )
+    first = _calendar(client, admin_headers)
+    etag = first.headers["ETag"]
+    assert len(_slots(first)) == 1
+    assert _calendar(client, admin_headers, etag).status_code == 304
+
+    # 缓存命中时只读取版本号
+    with count_queries() as statements:
+        assert _calendar(client, admin_headers, etag).status_code == 304
+    assert sum("data_versions" in statement for statement in statements) == 1
+    assert not any("FROM schedules" in statement for statement in statements)
+
+    _external("UPDATE schedules SET location = '二楼' WHERE student_id = :id", id=student_id)
+    updated = _calendar(client, admin_headers, etag)
+    assert updated.status_code == 200
+    assert _slots(updated)[0][0] == "二楼"
+
+    _external("UPDATE students SET name = '改名后' WHERE id = :id", id=student_id)
+    renamed = _calendar(client, admin_headers, updated.headers["ETag"])
+    assert renamed.status_code == 200
+    assert _slots(renamed)[0][1] == "改名后"
+
+    _external("DELETE FROM schedules WHERE student_id = :id", id=student_id)
+    assert _slots(_calendar(client, admin_headers)) == []
+
+def test_moving_a_schedule_invalidates_both_months(client, admin_headers, db):
+    student_id = add_students(db, 1)[0]
+    _external(
+        "INSERT INTO schedules (date, student_id, time_slot) VALUES ('2032-05-20', :id, '下午')", id=student_id
+    )
+    assert len(_slots(_calendar(client, admin_headers))) == 1
+    june = client.get("/schedules/calendar/2032/6", headers=admin_headers)
+
+    _external("UPDATE schedules SET date = '2032-06-02' WHERE student_id = :id", id=student_id)
+    assert _slots(_calendar(client, admin_headers)) == []
+    moved = client.get("/schedules/calendar/2032/6", headers=dict(admin_headers, **{"If-None-Match": june.headers["ETag"]}))
+    assert moved.status_code == 200
+    assert len(_slots(moved)) == 1
@@ -0,0 +1,122 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func
+
+from app.config import settings
+from app.models.event_log import EventLog
+from app.models.student import Student
+from app.models.stream_ticket import StreamTicket
+from app.routes.events import _event_stream, _hash_ticket, _redeem_ticket
+from app.utils.events import EventBroker
+from conftest import add_students
+
+def _ticket(client, headers):
+    response = client.post("/events/ticket", headers=headers)
+    assert response.status_code == 200
+    return response.json()["ticket"]
+
+def test_stream_requires_ticket_instead_of_access_token(client, admin_headers):
+    token = admin_headers["Authorization"][7:]
+    assert client.get("/events/stream", params={"token": token}).status_code == 422
+    assert client.get("/events/stream", params={"ticket": "not-a-ticket"}).status_code == 401
+    assert client.post("/events/ticket").status_code == 401
+
+def test_ticket_is_single_use(client, admin_headers, db):
+    ticket = _ticket(client, admin_headers)
+    admin = db.query(Student).filter(Student.username == "admin").first()
+    assert _redeem_ticket(ticket) == (admin.id, True, admin.auth_version)
+    with pytest.raises(HTTPException) as error:
+        _redeem_ticket(ticket)
+    assert error.value.status_code == 401
+
+def test_expired_ticket_is_rejected(client, db):
+    student_id = add_students(db, 1)[0]
+    db.add(StreamTicket(ticket_hash=_hash_ticket("expired"), student_id=student_id, expires_at=datetime.now() - timedelta(seconds=1)))
+    db.commit()
+    with pytest.raises(HTTPException):
+        _redeem_ticket("expired")
+
+def test_events_reach_subscribers_of_other_processes(client, db):
+    # 两个 EventBroker 相当于两个 worker 进程，只通过数据库共享事件
+    publisher = EventBroker(backlog=50)
+    receiver = EventBroker(backlog=50)
+    member, outsider = add_students(db, 2)
+
+    async def scenario():
+        receiver.poll()
+        member_subscription = receiver.subscribe(member, False)
+        outsider_subscription = receiver.subscribe(outsider, False)
+        publisher.publish("todo.created", {"id": 1}, audience=[member, None])
+        publisher.publish("schedules.changed", {"count": 2})
+        assert receiver.poll() == 2
+        await asyncio.sleep(0)
+        member_events = [member_subscription.queue.get_nowait()[1:3] for _ in range(member_subscription.queue.qsize())]
+        outsider_events = [outsider_subscription.queue.get_nowait()[1:3] for _ in range(outsider_subscription.queue.qsize())]
+        return member_events, outsider_events
+
+    member_events, outsider_events = asyncio.run(scenario())
+    assert member_events == [("todo.created", {"id": 1}), ("schedules.changed", {"count": 2})]
+    assert outsider_events == [("schedules.changed", {"count": 2})]
+
+def test_replay_from_event_log(client, db):
+    broker = EventBroker(backlog=3)
+    student_id = add_students(db, 1)[0]
+    for number in range(5):
+        broker.publish("work_record.deleted", {"id": number})
+    latest = db.query(func.max(EventLog.id)).scalar()
+
+    async def scenario():
+        subscription = broker.subscribe(student_id, False)
+        return [broker.replay(subscription, last_event_id) for last_event_id in (latest - 2, latest - 4, latest + 1)]
+
+    recent, pruned, unknown = asyncio.run(scenario())
+    assert [event[2] for event in recent] == [{"id": 3}, {"id": 4}]
+    # 只保留最近 3 条，更早的事件已清理；ID 大于最新事件说明来自其他数据库。两种情况都需要重新同步
+    assert pruned is None
+    assert unknown is None
+
+def _collect(stream, count):
+    async def take():
+        items = []
+        async for item in stream:
+            items.append(item)
+            if len(items) == count:
+                break
+        await stream.aclose()
+        return items
+    return take()
+
+def test_stream_skips_events_already_replayed(client, db):
+    student_id = add_students(db, 1)[0]
+    broker_events = [(5, "todo.deleted", {"id": 5}, None), (6, "todo.deleted", {"id": 6}, None)]
+
+    async def scenario():
+        from app.utils.events import event_broker
+        subscription = event_broker.subscribe(student_id, False)
+        for event in broker_events:
+            subscription.queue.put_nowait(event)
+        stream = _event_stream(None, subscription, broker_events[:1], 4, 0)
+        return await _collect(stream, 3)
+
+    items = asyncio.run(scenario())
+    assert items[1].startswith("id: 5\n")
+    assert items[2].startswith("id: 6\n")
+
+def test_stream_closes_when_user_loses_access(client, db, monkeypatch):
+    student_id = add_students(db, 1)[0]
+    student = db.get(Student, student_id)
+    auth_version = student.auth_version
+    student.is_admin = True
+    db.commit()
+    monkeypatch.setattr(settings, "events_auth_recheck", 0)
+
+    async def scenario():
+        from app.utils.events import event_broker
+        subscription = event_broker.subscribe(student_id, False)
+        return [item async for item in _event_stream(None, subscription, [], 0, auth_version)]
+
+    # 只发出重连间隔，复查发现 auth_version 已变化后结束连接
+    assert asyncio.run(scenario()) == [f"retry: {settings.events_retry_ms}\n\n"]
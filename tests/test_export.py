@@ -0,0 +1,32 @@
+import csv
+import io
+from datetime import date
+
+from openpyxl import load_workbook
+
+from app.models.work_record import WorkRecord
+from conftest import add_students
+
+PAYLOADS = ['=HYPERLINK("http://example.com","点击")', "+1+2", "-3+4", "@SUM(A1)", "\t=1+1"]
+
+def _seed(db):
+    student_id = add_students(db, 1)[0]
+    for index, payload in enumerate(PAYLOADS):
+        db.add(WorkRecord(date=date(2033, 1, index + 1), student_id=student_id, content=payload, handover_notes="正常内容"))
+    db.commit()
+    return student_id
+
+def test_csv_export_neutralizes_formulas(client, admin_headers, db):
+    student_id = _seed(db)
+    response = client.get(f"/work-records/export?student_id={student_id}&format=csv", headers=admin_headers)
+    rows = list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))[1:]
+    assert [row[3] for row in rows] == ["'" + payload for payload in PAYLOADS]
+    assert {row[4] for row in rows} == {"正常内容"}
+
+def test_xlsx_export_writes_formulas_as_text(client, admin_headers, db):
+    student_id = _seed(db)
+    response = client.get(f"/work-records/export?student_id={student_id}&format=xlsx", headers=admin_headers)
+    worksheet = load_workbook(io.BytesIO(response.content)).active
+    cells = [row[3] for row in worksheet.iter_rows(min_row=2)]
+    assert [cell.value for cell in cells] == PAYLOADS
+    assert {cell.data_type for cell in cells} == {"s"}
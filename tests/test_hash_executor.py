@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+from app.utils.auth import get_hash_executor, get_password_hash, shutdown_hash_executor, verify_password
+from app.utils.events import event_broker
+from app.utils.login_recorder import login_recorder
+
+def test_pool_hashes_and_verifies_in_worker_processes():
+    executor = get_hash_executor()
+    try:
+        assert executor.submit(os.getpid).result(timeout=60) != os.getpid()
+        password_hash = executor.submit(get_password_hash, "secret").result(timeout=60)
+        assert verify_password("secret", password_hash)
+        results = [executor.submit(verify_password, password, password_hash) for password in ("secret", "wrong")]
+        assert [future.result(timeout=60) for future in results] == [True, False]
+    finally:
+        shutdown_hash_executor()
+
+def test_shutdown_rejects_new_work_and_pool_is_recreated():
+    executor = get_hash_executor()
+    password_hash = executor.submit(get_password_hash, "secret").result(timeout=60)
+    shutdown_hash_executor()
+    with pytest.raises(RuntimeError):
+        executor.submit(get_password_hash, "secret")
+    # 关闭后再次使用时重新创建
+    try:
+        assert get_hash_executor().submit(verify_password, "secret", password_hash).result(timeout=60)
+    finally:
+        shutdown_hash_executor()
+
+def test_app_shutdown_closes_pool(client):
+    from fastapi.testclient import TestClient
+    from main import app
+
+    try:
+        with TestClient(app) as other_client:
+            response = other_client.post("/auth/login", data={"username": "admin", "password": "admin123"})
+            assert response.status_code == 200
+            executor = get_hash_executor()
+        with pytest.raises(RuntimeError):
+            executor.submit(get_password_hash, "secret")
+    finally:
+        # 第二个客户端关闭时停止了后台线程，恢复供其他测试使用
+        login_recorder.start()
+        event_broker.start()
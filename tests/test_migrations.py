@@ -0,0 +1,31 @@
+import pytest
+from alembic import command
+from sqlalchemy import create_engine, text
+
+from app.database.migrations import _alembic_config
+
+def _upgrade(connection, revision):
+    config = _alembic_config()
+    config.attributes["connection"] = connection
+    command.upgrade(config, revision)
+
+def test_duplicate_schedules_abort_unique_index_migration(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'dup.db'}")
+    with engine.begin() as connection:
+        _upgrade(connection, "0002")
+        connection.execute(text(
+            "INSERT INTO students (id, name, username, password_hash, is_admin, is_password_set) "
+            "VALUES (1, '重复', 'dup', '-', 0, 0)"
+        ))
+        for schedule_id in (10, 11, 12):
+            connection.execute(text(
+                "INSERT INTO schedules (id, date, time_slot, student_id) VALUES (:id, '2036-01-05', '08:00-10:00', 1)"
+            ), {"id": schedule_id})
+
+    with engine.begin() as connection, pytest.raises(RuntimeError) as error:
+        _upgrade(connection, "0003")
+    assert "2036-01-05 学生 1 时段 08:00-10:00：排班ID 10, 11, 12" in str(error.value)
+    with engine.connect() as connection:
+        # 没有删除任何排班
+        assert connection.execute(text("SELECT COUNT(*) FROM schedules")).scalar() == 3
+    engine.dispose()
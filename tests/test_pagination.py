@@ -0,0 +1,87 @@
+import base64
+import json
+from datetime import date
+
+import pytest
+
+from app.models.schedule import Schedule
+from app.models.todo import Todo
+from app.models.work_record import WorkRecord
+from conftest import add_students
+
+def _all_pages(client, headers, path, params, limit):
+    items, cursor, pages = [], None, 0
+    while True:
+        page_params = dict(params, limit=limit)
+        if cursor:
+            page_params["cursor"] = cursor
+        response = client.get(path, params=page_params, headers=headers)
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["items"]) <= limit
+        items.extend(body["items"])
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return items, pages
+
+def test_work_records_pages_follow_date_then_id(client, admin_headers, db):
+    student_id, = add_students(db, 1)
+    # 插入顺序与日期顺序相反，同一天有多条记录，并混入其他状态
+    days = [date(2035, 3, 5), date(2035, 3, 5), date(2035, 3, 1), date(2035, 3, 3), date(2035, 3, 1), date(2035, 3, 2)]
+    for index, day in enumerate(days):
+        db.add(WorkRecord(date=day, student_id=student_id, content=f"记录{index}", status="pending"))
+    db.add(WorkRecord(date=date(2035, 3, 2), student_id=student_id, content="已完成", status="completed"))
+    db.commit()
+
+    params = {"student_id": student_id, "status": "pending"}
+    items, pages = _all_pages(client, admin_headers, "/work-records/", params, limit=4)
+    keys = [(item["date"], item["id"]) for item in items]
+    assert keys == sorted(keys)
+    assert len(set(keys)) == len(days)
+    assert pages == 2
+    assert {item["status"] for item in items} == {"pending"}
+
+def test_page_boundary_without_extra_page(client, admin_headers, db):
+    student_id, = add_students(db, 1)
+    for day in (date(2035, 4, 1), date(2035, 4, 2)):
+        db.add(Schedule(date=day, student_id=student_id, time_slot="08:00-10:00"))
+    db.commit()
+
+    response = client.get("/schedules/", params={"student_id": student_id, "limit": 2}, headers=admin_headers)
+    assert len(response.json()["items"]) == 2
+    # 恰好取完一页时不返回游标
+    assert response.json()["next_cursor"] is None
+
+    items, pages = _all_pages(client, admin_headers, "/schedules/", {"student_id": student_id}, limit=1)
+    assert [item["date"] for item in items] == ["2035-04-01", "2035-04-02"]
+    assert pages == 2
+
+def test_todos_cursor_with_filters(client, admin_headers, db):
+    student_id, = add_students(db, 1)
+    for index in range(5):
+        db.add(Todo(title=f"分页{index}", assigned_to=student_id, created_by=student_id, priority="high" if index % 2 else "low"))
+    db.commit()
+
+    params = {"assigned_to": student_id, "priority": "low"}
+    items, _ = _all_pages(client, admin_headers, "/todos/", params, limit=2)
+    assert [item["title"] for item in items] == ["分页0", "分页2", "分页4"]
+    ids = [item["id"] for item in items]
+    assert ids == sorted(ids)
+
+def test_students_pages_by_username(client, admin_headers, db):
+    add_students(db, 3)
+    items, _ = _all_pages(client, admin_headers, "/students/", {}, limit=2)
+    usernames = [item["username"] for item in items]
+    assert usernames == sorted(usernames)
+    assert len(usernames) == len(set(usernames))
+
+def _cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+@pytest.mark.parametrize("path", ["/work-records/", "/schedules/", "/todos/", "/students/"])
+@pytest.mark.parametrize("cursor", ["not-a-cursor", _cursor([1, 2, 3]), _cursor(["bad-date", 1]), _cursor({"id": 1})])
+def test_invalid_cursor_is_rejected(client, admin_headers, path, cursor):
+    response = client.get(path, params={"cursor": cursor}, headers=admin_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
@@ -0,0 +1,57 @@
+from datetime import date, timedelta
+
+import pytest
+
+from app.models.schedule import Schedule
+from app.models.work_record import WorkRecord
+from conftest import add_students, count_queries
+
+SMALL_MONTH = date(2031, 1, 1)
+LARGE_MONTH = date(2031, 2, 1)
+
+@pytest.fixture(scope="module")
+def seeded(client):
+    from app.database.database import SessionLocal
+    db = SessionLocal()
+    try:
+        for first_day, count in ((SMALL_MONTH, 3), (LARGE_MONTH, 40)):
+            for index, student_id in enumerate(add_students(db, count)):
+                day = first_day + timedelta(days=index % 28)
+                db.add(Schedule(date=day, student_id=student_id, time_slot="08:00-10:00"))
+                db.add(WorkRecord(date=day, student_id=student_id, content="巡查"))
+        db.commit()
+    finally:
+        db.close()
+
+def _list_url(path, first_day):
+    return f"{path}?start_date={first_day}&end_date={first_day + timedelta(days=27)}"
+
+def _calendar_url(path, first_day):
+    return f"{path}/{first_day.year}/{first_day.month}"
+
+def _names(body):
+    if isinstance(body[0], dict) and "schedules" in body[0]:
+        return [item["student_name"] for day in body for item in day["schedules"]]
+    return [item["student_name"] for item in body]
+
+def _run(client, headers, url):
+    # 先请求一次无数据的列表，使认证缓存处于相同状态
+    client.get("/schedules/?start_date=1900-01-01&end_date=1900-01-01", headers=headers)
+    with count_queries() as statements:
+        response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    return len(statements), _names(response.json())
+
+@pytest.mark.parametrize("path, build_url", [
+    ("/schedules/", _list_url),
+    ("/work-records/", _list_url),
+    ("/schedules/calendar", _calendar_url),
+])
+def test_student_names_do_not_add_queries_per_row(client, admin_headers, seeded, path, build_url):
+    small_count, small_names = _run(client, admin_headers, build_url(path, SMALL_MONTH))
+    large_count, large_names = _run(client, admin_headers, build_url(path, LARGE_MONTH))
+    assert (len(small_names), len(large_names)) == (3, 40)
+    assert all(large_names)
+    # 姓名随主查询一并取出，语句数与返回行数无关
+    assert large_count == small_count
+    assert large_count <= 3
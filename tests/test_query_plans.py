@@ -0,0 +1,50 @@
+import pytest
+
+from app.database.database import engine
+from conftest import capture_queries
+
+def _login(client, username):
+    response = client.post("/auth/login", data={"username": username, "password": "pw"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+@pytest.fixture(scope="module")
+def student(client, admin_headers):
+    response = client.post("/students/", json={"name": "计划测试", "username": "plan-student", "password": "pw"}, headers=admin_headers)
+    return response.json()["id"], _login(client, "plan-student")
+
+def _plan_of(client, headers, url, table):
+    """执行请求，返回其中查询 table 的那条语句的 EXPLAIN QUERY PLAN 明细"""
+    with capture_queries() as executed:
+        assert client.get(url, headers=headers).status_code == 200
+    statements = [(sql, params) for sql, params in executed if f"FROM {table}" in sql]
+    assert len(statements) == 1, statements
+    sql, params = statements[0]
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return [row[-1] for row in rows]
+
+def test_todos_for_student_use_both_or_indexes(client, student):
+    student_id, headers = student
+    plan = _plan_of(client, headers, "/todos/", "todos")
+    assert "MULTI-INDEX OR" in plan
+    assert any("ix_todos_assigned_to_status (assigned_to=?)" in line for line in plan)
+    assert any("ix_todos_created_by_status (created_by=?)" in line for line in plan)
+    assert not any(line.startswith("SCAN todos") for line in plan)
+
+def test_work_records_by_student_and_status_use_composite_index(client, student):
+    student_id, headers = student
+    plan = _plan_of(client, headers, f"/work-records/?student_id={student_id}&status=pending", "work_records")
+    assert any("ix_work_records_student_id_status (student_id=? AND status=?)" in line for line in plan)
+
+def test_schedules_by_student_and_date_range_use_composite_index(client, student):
+    student_id, headers = student
+    plan = _plan_of(
+        client, headers,
+        f"/schedules/?student_id={student_id}&start_date=2030-01-01&end_date=2030-01-31",
+        "schedules"
+    )
+    assert any("ix_schedules_student_id_date (student_id=? AND date>? AND date<?)" in line for line in plan)
+
+def test_schedules_by_date_range_use_date_index(client, admin_headers):
+    plan = _plan_of(client, admin_headers, "/schedules/?start_date=2030-01-01&end_date=2030-01-31", "schedules")
+    assert any("SEARCH schedules USING INDEX" in line and "(date>? AND date<?)" in line for line in plan)
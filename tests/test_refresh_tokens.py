@@ -0,0 +1,68 @@
+from sqlalchemy import text
+
+from app.config import settings
+from app.database.database import engine
+from conftest import capture_queries
+
+def _create_student(client, admin_headers, username):
+    response = client.post("/students/", json={"name": "令牌测试", "username": username, "password": "pw"}, headers=admin_headers)
+    assert response.status_code == 200
+
+def _login(client, username, password="pw"):
+    response = client.post("/auth/login", data={"username": username, "password": password})
+    assert response.status_code == 200
+    return response.json()
+
+def _refresh(client, refresh_token):
+    return client.post("/auth/refresh", json={"refresh_token": refresh_token})
+
+def test_login_stores_refresh_token_before_responding(client, admin_headers):
+    _create_student(client, admin_headers, "token-sync")
+    _login(client, "token-sync")
+    # 直接查库，相当于另一个进程收到刷新请求
+    with engine.connect() as connection:
+        count = connection.execute(text(
+            "SELECT COUNT(*) FROM refresh_tokens JOIN students ON students.id = refresh_tokens.student_id "
+            "WHERE students.username = 'token-sync'"
+        )).scalar()
+    assert count == 1
+
+def test_login_does_not_reload_student_after_commit(client, admin_headers):
+    _create_student(client, admin_headers, "token-expired")
+    with capture_queries() as executed:
+        _login(client, "token-expired")
+    statements = [statement for statement, _ in executed]
+    insert_index = next(index for index, statement in enumerate(statements) if statement.startswith("INSERT INTO refresh_tokens"))
+    # 提交后再读取 student 属性会在事件循环线程中重新查询 students
+    assert not [statement for statement in statements[insert_index:] if "FROM students" in statement]
+
+def test_change_password_revokes_other_sessions(client, admin_headers):
+    _create_student(client, admin_headers, "token-change")
+    current = _login(client, "token-change")
+    other = _login(client, "token-change")
+
+    response = client.post(
+        "/students/change-password", json={"new_password": "new-pw"},
+        headers={"Authorization": f"Bearer {current['access_token']}"}
+    )
+    assert response.status_code == 200
+    assert _refresh(client, other["refresh_token"]).status_code == 401
+    assert _refresh(client, current["refresh_token"]).status_code == 200
+
+def test_concurrent_refresh_within_grace_keeps_session(client, admin_headers):
+    _create_student(client, admin_headers, "token-grace")
+    tokens = _login(client, "token-grace")
+    rotated = _refresh(client, tokens["refresh_token"]).json()
+
+    # 另一个标签页同时用旧令牌刷新：被拒绝，但不吊销会话
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+    assert _refresh(client, rotated["refresh_token"]).status_code == 200
+
+def test_reuse_after_grace_revokes_family(client, admin_headers, monkeypatch):
+    monkeypatch.setattr(settings, "refresh_reuse_grace_seconds", -1)
+    _create_student(client, admin_headers, "token-reuse")
+    tokens = _login(client, "token-reuse")
+    rotated = _refresh(client, tokens["refresh_token"]).json()
+
+    assert _refresh(client, tokens["refresh_token"]).status_code == 401
+    assert _refresh(client, rotated["refresh_token"]).status_code == 401
@@ -0,0 +1,14 @@
+from bench.roster_bench import run_scenario
+
+def test_target_roster_is_balanced():
+    # 500 名学生 × 20 周 × 每天 5 个时段
+    result = run_scenario(500, 20, 5, 1, 1, 1, None, repeat=1, seed=1)
+    assert result["shifts"] == 140 * 5
+    assert result["unfilled"] == 0
+    assert result["spread"] <= 1
+    # 耗时阈值依赖机器性能，不在单元测试中断言，见 bench/roster_bench.py --max-ms
+
+def test_crowded_roster_stays_balanced():
+    result = run_scenario(500, 20, 5, 3, 2, 2, 6, repeat=1, seed=1)
+    assert result["unfilled"] == 0
+    assert result["spread"] <= 1
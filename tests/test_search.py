@@ -0,0 +1,52 @@
+from datetime import date
+
+from app.models.student import Student
+from app.models.todo import Todo
+from app.models.work_record import WorkRecord
+from conftest import add_students, capture_queries
+
+def _search(client, admin_headers, q, **params):
+    with capture_queries() as executed:
+        response = client.get("/search/", params={"q": q, **params}, headers=admin_headers)
+    assert response.status_code == 200
+    statements = [statement for statement, _ in executed if "MATCH" in statement]
+    return response.json()["items"], statements
+
+def test_two_character_terms_use_bigram_index(client, admin_headers, db):
+    student_id, = add_students(db, 1)
+    db.add(WorkRecord(date=date(2034, 1, 1), student_id=student_id, content="三号楼投影仪出现蜃蜊故障，已报修"))
+    db.add(WorkRecord(date=date(2034, 1, 2), student_id=student_id, content="一切正常", handover_notes="注意蜃蜊"))
+    db.commit()
+
+    items, statements = _search(client, admin_headers, "蜃蜊", type="work_record")
+    assert len(items) == 2
+    assert all(item["score"] < 0 for item in items)
+    assert {item["snippet"] for item in items} == {"三号楼投影仪出现[蜃蜊]故障，已报修", "注意[蜃蜊]"}
+    assert "work_records_fts_bigram MATCH" in statements[0]
+    assert "LIKE" not in statements[0]
+
+def test_short_names_and_single_characters(client, admin_headers, db):
+    student = Student(name="鼋鼍", username="yuantuo", password_hash="-")
+    db.add(student)
+    db.commit()
+    todo = Todo(title="检查鼍", content="鼍龙", created_by=student.id)
+    db.add(todo)
+    db.commit()
+
+    items, _ = _search(client, admin_headers, "鼋鼍", type="student")
+    assert [item["id"] for item in items] == [student.id]
+    # 单个字符位于末尾时同样可以搜到
+    items, _ = _search(client, admin_headers, "鼍")
+    assert {(item["type"], item["id"]) for item in items} == {("student", student.id), ("todo", todo.id)}
+
+def test_index_follows_updates_and_deletes(client, admin_headers, db):
+    student = Student(name="鼋鼍鼋", username="yuantuo2", password_hash="-")
+    db.add(student)
+    db.commit()
+    student.name = "饕餮"
+    db.commit()
+    assert student.id not in [item["id"] for item in _search(client, admin_headers, "鼋鼍", type="student")[0]]
+    assert [item["id"] for item in _search(client, admin_headers, "饕餮", type="student")[0]] == [student.id]
+    db.delete(student)
+    db.commit()
+    assert _search(client, admin_headers, "饕餮", type="student")[0] == []
@@ -0,0 +1,34 @@
+from datetime import date
+
+import pytest
+
+from app.config import settings
+from app.models.schedule import Schedule
+from conftest import add_students
+
+@pytest.fixture(params=[True, False], ids=["rollup", "live"])
+def use_rollup(request, monkeypatch):
+    monkeypatch.setattr(settings, "stats_use_rollup", request.param)
+
+def _weekly(client, admin_headers, student_id):
+    response = client.get("/stats/duty", params={"period": "week", "student_id": student_id}, headers=admin_headers)
+    assert response.status_code == 200
+    return {row["period"]: row["shift_count"] for row in response.json()}
+
+def test_weeks_are_iso_weeks(client, admin_headers, db, use_rollup):
+    student_id, = add_students(db, 1)
+    # 2026-03-01 是周日（ISO W09 最后一天），03-02 是周一（ISO W10）
+    for day in (date(2026, 3, 1), date(2026, 3, 2), date(2026, 3, 8)):
+        db.add(Schedule(date=day, time_slot="08:00-10:00", student_id=student_id))
+    db.commit()
+
+    assert _weekly(client, admin_headers, student_id) == {"2026-W09": 1, "2026-W10": 2}
+
+def test_year_boundary_week_is_not_split(client, admin_headers, db, use_rollup):
+    student_id, = add_students(db, 1)
+    # 2026-12-28 至 2027-01-03 同属 ISO 2026-W53
+    for day in (date(2026, 12, 31), date(2027, 1, 1), date(2027, 1, 3), date(2027, 1, 4)):
+        db.add(Schedule(date=day, time_slot="08:00-10:00", student_id=student_id))
+    db.commit()
+
+    assert _weekly(client, admin_headers, student_id) == {"2026-W53": 3, "2027-W01": 1}
@@ -0,0 +1,42 @@
+from sqlalchemy import text
+
+from app.database.database import engine
+from conftest import count_queries
+
+def _external(statement: str, **params):
+    # 绕过路由直接写库，相当于另一个进程修改了学生
+    with engine.begin() as connection:
+        connection.execute(text(statement), params)
+
+def _suggest(client, admin_headers, q):
+    response = client.get("/students/suggest", params={"q": q}, headers=admin_headers)
+    assert response.status_code == 200
+    return [(item["username"], item["name"]) for item in response.json()]
+
+def test_index_picks_up_writes_from_other_processes(client, admin_headers):
+    assert _suggest(client, admin_headers, "index-x") == []
+
+    _external(
+        "INSERT INTO students (name, username, password_hash, is_admin, is_password_set) "
+        "VALUES ('欧阳锋', 'index-x1', '-', 0, 0)"
+    )
+    assert _suggest(client, admin_headers, "index-x") == [("index-x1", "欧阳锋")]
+    assert _suggest(client, admin_headers, "oyf") == [("index-x1", "欧阳锋")]
+
+    _external("UPDATE students SET name = '黄药师' WHERE username = 'index-x1'")
+    assert _suggest(client, admin_headers, "oyf") == []
+    response = client.get("/students/", params={"search": "hys"}, headers=admin_headers)
+    assert [student["username"] for student in response.json()] == ["index-x1"]
+
+    _external("DELETE FROM students WHERE username = 'index-x1'")
+    assert _suggest(client, admin_headers, "index-x") == []
+
+def test_unchanged_index_only_reads_version(client, admin_headers):
+    _suggest(client, admin_headers, "admin")
+    with count_queries() as statements:
+        _suggest(client, admin_headers, "admin")
+    student_reads = [statement for statement in statements if "FROM students" in statement]
+    version_reads = [statement for statement in statements if "FROM data_versions" in statement]
+    assert len(version_reads) == 1
+    # 只剩认证时按用户名读取版本号的查询
+    assert all("auth_version" in statement for statement in student_reads)